@@ -0,0 +1,146 @@
+# asyncio flavour of Listener.serve (server.py -a).
+#
+# Network I/O all runs on one event loop.  The blocking calls run on two
+# single-thread executors: one that waits on the capture ring for the next
+# frames from the radio and one for writes to it.  Frames come back to the
+# loop as views into the ring, a batch at a time, and stay put until the
+# loop asks for more, so nothing is copied on the way.
+#
+# Nothing on the loop waits for a client.  The UDP socket is non-blocking,
+# so a full send buffer drops IQ for the client being sent to (see
+# sender.py), and a client that stops reading its TCP replies loses them
+# once replyBacklog bytes are waiting for it.  Either way the loop gets back
+# to draining the capture ring rather than letting it overflow for everyone.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, perf_counter
+
+from framer import frameLength
+
+
+replyBacklog = 64 * 1024       # bytes of replies a client may leave unread
+
+
+class AsyncServer:
+    def __init__(self,listener,logger):
+        self.listener   = listener
+        self.makeItStop = listener.makeItStop
+        self.print      = listener.print
+        self.logger     = logger
+        self.ring       = listener.ring
+        self.frames     = listener.ring.consumer()
+        self.hub        = listener.hub
+        self.meter      = listener.meter
+        self.meterInterval = listener.meterInterval
+        self.latency    = listener.latency
+        self.readPool   = ThreadPoolExecutor(1, 'radio-read')
+        self.writePool  = ThreadPoolExecutor(1, 'radio-write')
+        self.clients    = set()
+        self.repliesDropped = 0
+
+    def run(self):
+        try:
+            asyncio.run(self.main())
+        finally:
+            self.makeItStop.set()
+            self.readPool.shutdown()
+            self.writePool.shutdown()
+
+    async def main(self):
+        self.loop = asyncio.get_running_loop()
+        self.listener.udp.setblocking(False)
+        server = await asyncio.start_server(self.onClient, sock=self.listener.tcp)
+        pump = asyncio.ensure_future(self.pumpRadio())
+        # Listener.stop() may come from any thread; park a default executor
+        # thread on the event rather than polling it.
+        try:
+            await self.loop.run_in_executor(None, self.makeItStop.wait)
+        except asyncio.CancelledError:
+            # ^C: let the parked thread go so asyncio.run can shut down
+            self.makeItStop.set()
+            raise
+        server.close()
+        pump.cancel()
+        for task in self.clients:
+            task.cancel()
+
+    async def onClient(self,reader,writer):
+        peer = writer.get_extra_info('peername')
+        if len(self.hub) >= self.listener.maxClients:
+            self.print(f'Refused: {peer[0]} on port {peer[1]}, {self.listener.maxClients} client(s) already')
+            writer.close()
+            return
+        self.print(f'Connected: {peer[0]} on port {peer[1]}')
+        client = self.hub.add(self.listener.newClient(self.replySender(writer, peer), (peer[0], self.listener.clientPort)))
+        task = asyncio.current_task()
+        self.clients.add(task)
+        try:
+            await self.pumpClient(reader, client)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.clients.discard(task)
+            self.hub.remove(client)
+            writer.close()
+            if self.listener.maxClients == 1:
+                self.makeItStop.set()
+        self.print('client - done')
+
+    def replySender(self,writer,peer):
+        transport = writer.transport
+        dropping = False
+        def send(msg):
+            nonlocal dropping
+            if transport.get_write_buffer_size() > replyBacklog:
+                if not dropping:
+                    self.print(f'{peer[0]} is not reading its replies, dropping them')
+                dropping = True
+                self.repliesDropped = self.repliesDropped + 1
+                return
+            dropping = False
+            # the transport may hold on to what we give it, and a view is
+            # only good until the next batch of frames
+            writer.write(bytes(msg))
+        return send
+
+    async def pumpClient(self,reader,client):
+        # Messages from one SDR client go to the radio.
+        while not self.makeItStop.is_set():
+            try:
+                head = await reader.readexactly(2)
+                body = await reader.readexactly(frameLength(head[0], head[1]) - 2)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+            msg = head + body
+            self.logger.log(msg)
+            out = self.hub.fromClient(client, msg)
+            if out:
+                await self.loop.run_in_executor(self.writePool, self.listener.writeRadio, out)
+
+    def nextFrames(self):
+        # Runs on the read executor; blocks until the ring has something.
+        while not self.makeItStop.is_set():
+            frames = self.frames.take(32, 0.1)
+            if frames:
+                return frames
+        return None
+
+    async def pumpRadio(self):
+        # Messages from the radio: IQ data by UDP, the rest back over TCP.
+        nextReport = monotonic() + self.meterInterval
+        while True:
+            frames = await self.loop.run_in_executor(self.readPool, self.nextFrames)
+            if not frames:
+                return
+            for msg, t in zip(frames, self.frames.times):
+                if msg[0:2] == b'\x00\x80':
+                    self.hub.sendData(msg[2:])
+                    self.latency.observe(perf_counter() - t)
+                    self.meter.update(msg[2:])
+                else:
+                    self.hub.fromRadio(msg)
+            if self.meterInterval and monotonic() >= nextReport:
+                print(self.meter.report())
+                print(self.ring.report())
+                nextReport = monotonic() + self.meterInterval
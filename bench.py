@@ -0,0 +1,1237 @@
+#!/usr/bin/env python3
+
+# Benchmarks for the server's hot paths.  None of them need a radio.
+#
+#   ./bench.py              run everything
+#   ./bench.py framer ...   run the named benchmarks
+
+import hashlib
+import multiprocessing
+import socket
+import subprocess
+import sys
+from threading import Thread, Event
+from types import SimpleNamespace
+from time import perf_counter, process_time, thread_time, sleep
+
+from struct import unpack
+import ctypes
+from pylibftdi.device import Device
+from framer import FrameReader, readIntoFrom, ftdiReadInto, maxFrameLength
+from meter import IQMeter
+from ddc import DDC
+from compress import codecs, encode, decode
+import numpy as np
+from sender import IQSender
+import capture
+from capture import Capture, FrameRing
+from simradio import SimRadio, stampOf
+from playback import Playback
+import recorder
+import os
+import json
+import tempfile
+import server
+import supervisor
+from sdrcmds import SdrIQByteCommands as bc
+
+
+def iqFrame(seq=0):
+    return b'\x00\x80' + bytes([seq & 0xFF]) * 8192
+
+def iqStream(frames, controlEvery=16):
+    # A radio-like byte stream: IQ frames with the odd status reply mixed in.
+    status = b'\x08\x20\x05\x00\x0C\x00\x00\x00'
+    out = bytearray()
+    for k in range(frames):
+        out += iqFrame(k)
+        if controlEvery and k % controlEvery == 0:
+            out += status
+    return bytes(out)
+
+class ChunkedSource:
+    # Hands the stream out in pieces no bigger than chunk, the way a USB
+    # read returns whatever the last bulk transfers delivered.
+    def __init__(self, data, chunk):
+        self.data = memoryview(data)
+        self.chunk = chunk
+        self.pos = 0
+
+    def read(self, n):
+        n = min(n, self.chunk)
+        out = bytes(self.data[self.pos:self.pos+n])
+        self.pos = self.pos + len(out)
+        return out
+
+    def readinto(self, view):
+        n = min(len(view), self.chunk, len(self.data) - self.pos)
+        view[:n] = self.data[self.pos:self.pos+n]
+        self.pos = self.pos + n
+        return n
+
+class FakeLibftdi:
+    # ftdi_read_data over a byte stream, handing out all it is asked for
+    # the way libftdi does while the radio streams.
+    def __init__(self, data):
+        self.data = bytearray(data)
+        self.base = ctypes.addressof((ctypes.c_char * len(self.data)).from_buffer(self.data))
+        self.pos = 0
+
+    def ftdi_read_data(self, ctx, buf, n):
+        n = min(n, len(self.data) - self.pos)
+        ctypes.memmove(buf, self.base + self.pos, n)
+        self.pos = self.pos + n
+        return n
+
+class FakeDevice(Device):
+    # A pylibftdi Device on a FakeLibftdi, so its own read() and the
+    # server's ftdiReadInto run as they do on the radio.
+    def __init__(self, data):
+        self._opened = True
+        self.chunk_size = 0
+        self.mode = 'b'
+        self.fdll = FakeLibftdi(data)
+        self.ctx = ctypes.c_int(0)
+
+    def __del__(self):
+        pass
+
+def report(name, count, unit, nbytes, wall, cpu):
+    print(f'  {name:<24} {count/wall:12.0f} {unit}/s {nbytes/wall/1e6:9.1f} MB/s'
+          f' {1e6*cpu/count:8.2f} us cpu/{unit[:-1]}')
+
+def timed(fn):
+    w, c = perf_counter(), process_time()
+    result = fn()
+    return result, perf_counter() - w, process_time() - c
+
+
+def benchFramer(frames=4000):
+    print('framer: readMsg vs FrameReader')
+    data = iqStream(frames)
+
+    def old(src):
+        n = 0
+        while server.readMsg(src.read):
+            n = n + 1
+        return n
+
+    def new(readinto):
+        reader = FrameReader(readinto)
+        n = 0
+        while reader.read():
+            n = n + 1
+        return n
+
+    for chunk in (512, 4096, 65536):
+        print(f' {chunk} byte reads')
+        n, wall, cpu = timed(lambda: old(ChunkedSource(data, chunk)))
+        report('readMsg', n, 'frames', len(data), wall, cpu)
+        n, wall, cpu = timed(lambda: new(ChunkedSource(data, chunk).readinto))
+        report('FrameReader readinto', n, 'frames', len(data), wall, cpu)
+        n, wall, cpu = timed(lambda: new(readIntoFrom(ChunkedSource(data, chunk).read)))
+        report('FrameReader read', n, 'frames', len(data), wall, cpu)
+
+    # What the capture thread actually runs, against what it replaced: the
+    # pylibftdi calls included, best of five
+    def shipped(device):
+        reader = FrameReader(ftdiReadInto(device), 8 * maxFrameLength, resync=True, most=8192)
+        n = 0
+        while reader.read():
+            n = n + 1
+        return n
+
+    print(' as the capture thread reads the radio (pylibftdi, best of 5)')
+    for name, pattern in (('readMsg, Device.read', lambda d: old(d)),
+                          ('FrameReader, 8 KB reads', shipped)):
+        n, wall, cpu = min((timed(lambda: pattern(FakeDevice(data))) for k in range(5)), key=lambda r: r[2])
+        report(name, n, 'frames', len(data), wall, cpu)
+
+
+def noisyStream(frames, controlEvery=16):
+    # Like iqStream but with noise for samples, so 00 80 turns up inside
+    # frames the way it does on a real band.  Returns the stream, the
+    # frames in it and where each starts.
+    rng = np.random.default_rng(1)
+    status = b'\x08\x20\x05\x00\x0C\x00\x00\x00'
+    payloads = rng.normal(0, 3000, (frames, 4096)).astype('<i2')
+    out = bytearray()
+    sent = []
+    starts = []
+    for k in range(frames):
+        frame = b'\x00\x80' + payloads[k].tobytes()
+        sent.append(frame)
+        starts.append(len(out))
+        out += frame
+        if controlEvery and k % controlEvery == 0:
+            out += status
+    return out, sent, starts
+
+faults = {
+    'byte lost'      : lambda data, at: data[:at] + data[at+1:],
+    'byte added'     : lambda data, at: data[:at] + b'\x55' + data[at:],
+    'header garbled' : lambda data, at: data[:at] + b'\x00\x81' + data[at+2:],
+    '512 bytes lost' : lambda data, at: data[:at] + data[at+512:],
+}
+
+def benchResync(frames=2000, count=20, chunk=4096):
+    print(f'resync: {count} faults in {frames} noisy IQ frames, read {chunk} bytes at a time')
+    data, sent, starts = noisyStream(frames)
+    original = set(sent)
+    rng = np.random.default_rng(2)
+    failed = False
+    for name, fault in faults.items():
+        damaged = bytes(data)
+        # one in each stretch of frames/count, from the end back so the
+        # places further on don't move
+        for k in sorted(((np.arange(count) + rng.uniform(0.2, 0.8, count)) * frames // count).astype(int), reverse=True):
+            at = starts[k]
+            if name != 'header garbled':
+                at = at + int(rng.integers(100, 8000))
+            damaged = fault(damaged, at)
+        for resync in (False, True):
+            reader = FrameReader(ChunkedSource(damaged, chunk).readinto, resync=resync)
+            good = n = 0
+            w, c = perf_counter(), process_time()
+            while True:
+                msg = reader.read()
+                if not msg:
+                    break
+                n = n + 1
+                good = good + (bytes(msg) in original)
+            wall, cpu = perf_counter() - w, process_time() - c
+            lost = (frames - good) / count
+            print(f'  {name:<16} {"resync" if resync else "no resync":<10} {100*good/frames:6.1f}% frames intact,'
+                  f' {lost:7.1f} frames lost a fault, {reader.desyncs:3} desyncs, {reader.skipped:7} bytes skipped,'
+                  f' {1e6*cpu/n:5.1f} us cpu/frame')
+            if resync and (lost > 2 or reader.desyncs < count):
+                failed = True
+    reader = FrameReader(ChunkedSource(bytes(data), chunk).readinto, resync=True)
+    while reader.read():
+        pass
+    if reader.desyncs:
+        print(f'  clean stream: {reader.desyncs} false desyncs')
+        failed = True
+    if failed:
+        print('  resync did not recover within two frames of every fault')
+        sys.exit(1)
+
+
+def benchMeter(frames=2000):
+    print('meter: per-sample unpack vs IQMeter (196 kS/s is ~96 frames/s)')
+    data = iqStream(frames, controlEvery=0)
+    payloads = [data[k*8194+2:(k+1)*8194] for k in range(frames)]
+
+    def old():
+        # what server.power used to do
+        for msg in payloads[:frames//20]:
+            av = 0.0
+            for k in range(0, len(msg), 2):
+                iq = unpack('h', msg[k:k+2])[0]
+                av = av + iq*iq
+        return frames//20
+
+    def new():
+        meter = IQMeter()
+        for msg in payloads:
+            meter.update(msg)
+        meter.snapshot()
+        return frames
+
+    for name, fn in (('unpack loop', old), ('IQMeter', new)):
+        n, wall, cpu = timed(fn)
+        report(name, n, 'frames', n*8192, wall, cpu)
+        print(f'  {"":<24} {100*cpu/n*96:12.2f} % of a core at 196 kS/s')
+
+
+def toneFrames(frames, freqs=(0.1, -0.3), level=0.3):
+    # IQ payloads (8192 bytes each) of tones at the given cycles/sample
+    n = np.arange(frames * 2048)
+    z = sum(level * 32767 * np.exp(2j * np.pi * f * n) for f in freqs)
+    iq = np.empty(2 * len(n), dtype='<i2')
+    iq[0::2] = np.rint(z.real)
+    iq[1::2] = np.rint(z.imag)
+    data = iq.tobytes()
+    return [data[k*8192:(k+1)*8192] for k in range(frames)]
+
+def benchDDC(frames=2000):
+    print('ddc: down-conversion per client (196 kS/s is ~96 frames/s)')
+    payloads = toneFrames(frames)
+    for decimation in (2, 4, 8, 16, 32, 64):
+        ddc = DDC(decimation, 0.05)
+
+        def run():
+            for msg in payloads:
+                ddc.feed(msg)
+            return frames
+
+        n, wall, cpu = timed(run)
+        report(f'1/{decimation} ({len(ddc.taps)} taps)', n, 'frames', n*8192, wall, cpu)
+        print(f'  {"":<24} {n/cpu/96:12.0f} channels per core at 196 kS/s')
+    # frame by frame has to match filtering the stream in one go
+    whole = b''.join(payloads[:50])
+    for decimation in (3, 8):
+        a, b = DDC(decimation, 0.05), DDC(decimation, 0.05)
+        framed = np.concatenate([a.process(msg) for msg in payloads[:50]])
+        once = b.process(whole)
+        print(f'  1/{decimation} frame edges: largest difference from one pass'
+              f' {np.abs(framed - once).max():.4f} of 32767')
+
+def benchCompress(frames=1000):
+    print('compress: IQ codecs on noise plus tones (196 kS/s is ~96 frames/s)')
+    rng = np.random.default_rng(1)
+    noise = toneFrames(frames, (0.07, -0.21), 0.05)
+    payloads = []
+    for msg in noise:
+        x = np.frombuffer(msg, dtype='<i2') + rng.normal(0, 30, 4096)
+        payloads.append(np.clip(np.rint(x), -32768, 32767).astype('<i2').tobytes())
+    for name, codec in codecs.items():
+        coded = []
+
+        def enc():
+            for msg in payloads:
+                coded.append(encode(msg, codec))
+            return frames
+
+        def dec():
+            for kind, payload in coded:
+                decode(kind, payload)
+            return frames
+
+        n, wall, cpu = timed(enc)
+        size = sum(len(p) for k, p in coded)
+        dwall, dcpu = timed(dec)[1:]
+        a = np.frombuffer(payloads[0], dtype='<i2').astype(np.float64)
+        b = np.frombuffer(decode(*coded[0]), dtype='<i2').astype(np.float64)
+        err = np.dot(a - b, a - b)
+        snr = f'{10*np.log10(np.dot(a, a)/err):.0f} dB snr' if err else 'lossless'
+        print(f'  {name:<6} ratio {n*8192/size:5.2f} {6.3*size/(n*8192):5.2f} Mbit/s'
+              f' encode {1e6*cpu/n:7.1f} us/frame ({100*cpu/n*96:4.1f}% of a core)'
+              f' decode {1e6*dcpu/n:7.1f} us/frame  {snr}')
+
+
+class UdpSink(Thread):
+    # Drains a local UDP socket so the sender measures its own cost and not
+    # a full receive queue.
+    def __init__(self):
+        super(UdpSink,self).__init__()
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 << 20)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.settimeout(0.5)
+        self.address = self.sock.getsockname()
+        self.count = 0
+        self.last = perf_counter()
+        self.daemon = True
+
+    def run(self):
+        buf = bytearray(9000)
+        while True:
+            try:
+                self.sock.recv_into(buf)
+            except socket.timeout:
+                break
+            self.count = self.count + 1
+            self.last = perf_counter()
+
+def benchSender(frames=20000, blockSize=1024):
+    print(f'sender: {blockSize} byte datagrams to a local UDP sink')
+    buffer = bytearray(iqFrame(7))
+    frame = memoryview(buffer)[2:]
+    udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def legacy(data, address, state=[0]):
+        # the old RadioReader.sendData
+        length = blockSize + 4
+        ba = bytearray(length)
+        for k in range(len(data) // blockSize):
+            state[0] = state[0] % 0xFFFE + 1
+            ba[0] = length & 0xff
+            ba[1] = 0x80 | ((length >> 8) & 0x1f)
+            ba[2] = state[0] & 0xFF
+            ba[3] = (state[0] >> 8) & 0xFF
+            ba[4:] = data[k*blockSize:(k+1)*blockSize]
+            udp.sendto(ba, address)
+
+    modes = [('legacy copy', legacy)]
+    for mode in ('sendto', 'sendmsg', 'sendmmsg'):
+        sender = IQSender(udp, blockSize, mode)
+        if sender.mode == mode:
+            modes.append((mode, sender.send))
+    for name, send in modes:
+        sink = UdpSink()
+        sink.start()
+        w, c = perf_counter(), thread_time()
+        for k in range(frames):
+            send(frame, sink.address)
+        wall, cpu = perf_counter() - w, thread_time() - c
+        sink.join()
+        n = frames * (8192 // blockSize)
+        mb = frames * 8192 / 1e6
+        print(f'  {name:<24} {n/wall:12.0f} datagrams/s {1e3*cpu/mb:8.2f} ms cpu/MB'
+              f' {100*sink.count/n:6.1f}% received')
+
+def benchBlockSize(frames=10000):
+    print('blocksize: IQ datagram size vs send cost, local UDP sink')
+    buffer = bytearray(iqFrame(7))
+    frame = memoryview(buffer)[2:]
+    udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    for mode in ('sendmsg', 'sendmmsg'):
+        for size in (512, 1024, 2048, 4096):
+            sender = IQSender(udp, size, mode)
+            if sender.mode != mode:
+                continue
+            sink = UdpSink()
+            sink.start()
+            w, c = perf_counter(), thread_time()
+            for k in range(frames):
+                sender.send(frame, sink.address)
+            wall, cpu = perf_counter() - w, thread_time() - c
+            sink.join()
+            calls = 1 if mode == 'sendmmsg' else sender.blocks
+            mb = frames * 8192 / 1e6
+            print(f'  {mode:<9} {size:5} bytes {sender.blocks:2} datagrams/frame {calls:2} syscalls/frame'
+                  f' {frames/wall:9.0f} frames/s {1e3*cpu/mb:7.2f} ms cpu/MB'
+                  f' {100*sink.count/(frames*sender.blocks):6.1f}% received')
+
+
+def runServer(argv, radio, clients=1, sink=None):
+    # Serve `radio` on ephemeral ports to `clients` local TCP clients that
+    # all get their IQ at one UDP sink.  The first client starts the radio.
+    # Returns (listener, sink, [tcp ...]).
+    sink = sink or UdpSink()
+    listener = server.Listener(argv=['-b', '-c', str(clients)] + argv, radio=radio)
+    listener.tcpPort = 0
+    listener.udpPort = 0
+    listener.clientPort = sink.address[1]
+    listener.serving = Thread(target=listener.serve, daemon=True)
+    listener.serving.start()
+    while not hasattr(listener, 'tcp') or not hasattr(listener, 'hub'):
+        sleep(0.01)
+    port = listener.tcp.getsockname()[1]
+    tcps = [socket.create_connection(('127.0.0.1', port)) for k in range(clients)]
+    while len(listener.hub) < clients:
+        sleep(0.01)
+    sink.start()
+    tcps[0].sendall(bc.FreeRun)
+    return listener, sink, tcps
+
+def stopServer(listener, tcps):
+    t = perf_counter()
+    for tcp in tcps:
+        tcp.close()
+    listener.stop()
+    listener.makeItStop.wait(5)
+    t = perf_counter() - t
+    listener.serving.join(5)            # its last state save included
+    return t
+
+def benchServe(frames=5000, rate=2000):
+    print(f'serve: threaded vs asyncio server, simulated radio at {rate} frames/s (cpu includes the sink)')
+    for name, argv in (('threaded', []), ('asyncio -a', ['-a'])):
+        w, c = perf_counter(), process_time()
+        listener, sink, tcps = runServer(argv, SimRadio(rate * 2048, frames))
+        sink.join()
+        wall, cpu = sink.last - w, process_time() - c
+        stop = stopServer(listener, tcps)
+        n = frames * 8192 // listener.blockSize
+        print(f'  {name:<24} {frames/wall:12.0f} frames/s {1e6*cpu/frames:8.1f} us cpu/frame'
+              f' {100*sink.count/n:6.1f}% received, stop in {1e3*stop:.1f} ms')
+        print(f'  {"":<24} {listener.ring.report()}')
+    print(f'  a second client on a link half as fast as the stream, {rate//2} frames/s:')
+    for name, argv in (('threaded', []), ('asyncio -a', ['-a'])):
+        listener, sink, tcps = runServer(argv + ['-s', 'sendto'], SimRadio(rate * 2048, frames), 2)
+        fast, slow = listener.hub.clients
+        slow.sender.udp = SlowLink(slow.sender.udp, rate * 8192 // 2)
+        sink.join()
+        stopServer(listener, tcps)
+        print(f'  {name:<24} {fast.sender.datagrams*listener.blockSize//8192:6} frames to the other client,'
+              f' {slow.sender.dropped:5} dropped for the slow one, {listener.ring.report()}')
+
+class SlowLink:
+    # The UDP socket as one client on a slow link sees it: its send buffer
+    # empties at `rate` bytes/s.  Blocking, a send waits for room the way
+    # the kernel's would; non-blocking (-a) it fails as a full buffer does.
+    def __init__(self, udp, rate, size=64 << 10):
+        self.udp = udp
+        self.rate = rate
+        self.size = size
+        self.queued = 0
+        self.t = perf_counter()
+
+    def getblocking(self):
+        return self.udp.getblocking()
+
+    def sendto(self, data, address):
+        now = perf_counter()
+        self.queued = max(0, self.queued - (now - self.t) * self.rate)
+        self.t = now
+        if self.queued + len(data) > self.size:
+            if not self.udp.getblocking():
+                raise BlockingIOError
+            sleep((self.queued + len(data) - self.size) / self.rate)
+            self.queued = self.size - len(data)
+            self.t = perf_counter()
+        self.queued = self.queued + len(data)
+        return self.udp.sendto(data, address)
+
+def benchFanout(frames=3000, rate=1000):
+    print(f'fanout: one radio to N clients, simulated radio at {rate} frames/s (cpu includes the sink)')
+    for clients in (1, 2, 4, 8):
+        w, c = perf_counter(), process_time()
+        listener, sink, tcps = runServer([], SimRadio(rate * 2048, frames), clients)
+        sink.join()
+        wall, cpu = sink.last - w, process_time() - c
+        stopServer(listener, tcps)
+        n = clients * frames * 8192 // listener.blockSize
+        print(f'  {clients} client(s) {"":<14} {frames/wall:12.0f} frames/s {1e6*cpu/frames/clients:8.1f}'
+              f' us cpu/frame/client {100*sink.count/n:6.1f}% received, dropped {listener.ring.dropped}')
+
+
+def benchRing(frames=1500, rate=500, stall=0.05, every=100):
+    print(f'ring: capture at {rate} frames/s, consumer stalls {1e3*stall:.0f} ms every {every} frames')
+    for size in (4, 16, 64):
+        radio = SimRadio(rate * 2048, frames)
+        listener = SimpleNamespace(makeItStop=Event(), radio=radio, usbChunk=None, reconnect=None)
+        ring = FrameRing(size)
+        consumer = ring.consumer()
+        Capture(listener, ring).start()
+        radio.write(bc.FreeRun)
+        n = 0
+        while consumer.next(0.5) is not None:
+            n = n + 1
+            if n % every == 0:
+                sleep(stall)
+        listener.makeItStop.set()
+        print(f'  {size:3} frame ring {"":<14} {n:6} consumed {ring.report()}')
+
+class StallingDisk:
+    # os for recorder.py, with a write that hangs now and then the way an SD
+    # card does when it is busy erasing.
+    def __init__(self, every, stall):
+        self.every = every
+        self.stall = stall
+        self.writes = 0
+
+    def __getattr__(self, name):
+        return getattr(os, name)
+
+    def write(self, fd, data):
+        self.writes = self.writes + 1
+        if self.writes % self.every == 0:
+            sleep(self.stall)
+        return os.write(fd, data)
+
+def benchRecord(frames=6000, rate=1000):
+    print(f'record: recording at {rate} frames/s ({rate*8192/1e6:.1f} MB/s) while streaming to a client')
+    for name, disk in (('disk', os), ('stalls 2 s every 4 MiB', StallingDisk(4, 2.0)),
+                       ('stalls 5 s every 8 MiB', StallingDisk(8, 5.0))):
+        recorder.os = disk
+        with tempfile.TemporaryDirectory() as d:
+            listener, sink, tcps = runServer(['-w', d + ':8'], SimRadio(rate * 2048, frames))
+            sink.join()
+            stopServer(listener, tcps)
+            rec = listener.recorder
+            rec.join(30)
+            notes = sum(len(json.load(open(os.path.join(d, f)))['annotations'])
+                        for f in os.listdir(d) if f.endswith('.sigmf-meta'))
+            print(f'  {name:<24} {rec.recorded:6} recorded {rec.dropped:5} left out ({notes} gaps noted)'
+                  f' {rec.written/1e6:6.1f} MB written, longest write {1e3*rec.longestWrite:5.0f} ms')
+            print(f'  {"":<24} {100*sink.count/(frames*8):6.1f}% of IQ reached the client, {listener.ring.report()}')
+    recorder.os = os
+    with tempfile.TemporaryDirectory() as d:
+        listener, sink, tcps = runServer(['-w', d], SimRadio())
+        sleep(0.5)
+        clientLoad(tcps[0], bc.BWKHZ_50)
+        sleep(0.5)
+        stopServer(listener, tcps)
+        listener.recorder.join(5)
+        rates = [json.load(open(os.path.join(d, f)))['global']['core:sample_rate']
+                 for f in sorted(os.listdir(d)) if f.endswith('.sigmf-meta')]
+        ok = rates == [196078, 55556]
+        print(f'  {"50 kHz program loaded":<24} files at {", ".join(map(str, rates))} S/s, {"ok" if ok else "WRONG"}')
+        if not ok:
+            sys.exit(1)
+
+def benchPlayback(frames=3000):
+    print('playback: a recording served in place of the radio (cpu includes the sink)')
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, 'bench.sigmf-data')
+        with open(path, 'wb') as f:
+            for msg in toneFrames(frames):
+                f.write(msg)
+        for speed in (1, 10, 0):
+            w, c = perf_counter(), process_time()
+            listener, sink, tcps = runServer([], Playback(path, speed))
+            sink.join()
+            wall, cpu = sink.last - w, process_time() - c
+            stopServer(listener, tcps)
+            name = f'{speed}x real time' if speed else 'as fast as it goes'
+            print(f'  {name:<24} {frames/wall:12.0f} frames/s {1e6*cpu/frames:8.1f} us cpu/frame'
+                  f' {100*sink.count/(frames*8):6.1f}% received, {listener.ring.report()}')
+
+class NakRadio(SimRadio):
+    # NAKs one AD6620 register write, once.
+    def __init__(self, nakAt, **kw):
+        super(NakRadio, self).__init__(**kw)
+        self.nakAt = nakAt
+
+    def control(self, msg):
+        if msg[1] >> 5 == 5 and len(self.program) == self.nakAt:
+            self.nakAt = None
+            self.controls = self.controls + 1
+            self.reply(b'\x02\x00')
+            return
+        super(NakRadio, self).control(msg)
+
+def oldSetDSP(radio):
+    # what Listener.SetDSP used to do
+    for cmd in bc.BWKHZ_190:
+        radio.write(cmd)
+        radio.read(3)
+    radio.flush()
+
+def clientLoad(tcp, commands):
+    # the way SdrDx sets a bandwidth: one register, wait for its ack, next
+    for cmd in commands:
+        tcp.sendall(cmd)
+        got = b''
+        while len(got) < 3:
+            got = got + tcp.recv(3 - len(got))
+
+def benchBoot():
+    print('boot: cold boot, AD6620 load and all, USB writes 1 ms each, FTDI latency timer 16 ms')
+    usb = {'writeTime': 0.001, 'latencyTimer': 0.016}
+    t = perf_counter()
+    radio = SimRadio(**usb)
+    oldSetDSP(radio)
+    print(f'  {"old SetDSP (no acks)":<28} {1e3*(perf_counter()-t):8.0f} ms {radio.writes:4} USB writes'
+          f' {len(radio.program):4} registers')
+    with tempfile.TemporaryDirectory() as d:
+        for name, argv, radio in (('one at a time', ['-B', '1'], SimRadio(**usb)),
+                                  ('bulk, 64 a write', [], SimRadio(**usb)),
+                                  ('bulk, all in one write', ['-B', '300'], SimRadio(**usb)),
+                                  ('bulk, NAK at register 100', [], NakRadio(100, **usb))):
+            state = os.path.join(d, name.replace(' ', '_'))
+            listener = server.Listener(argv + ['-D', state], radio)
+            print(f'  {name:<28} {1e3*listener.bootSeconds:8.0f} ms {radio.writes:4} USB writes'
+                  f' {len(radio.program):4} registers ({listener.dsp.mode})')
+        # the server restarting while the radio stays powered
+        writes = radio.writes
+        t = perf_counter()
+        server.Listener(['-D', state], radio)
+        print(f'  {"restart, radio still warm":<28} {1e3*(perf_counter()-t):8.0f} ms'
+              f' {radio.writes - writes:4} USB writes')
+        # and with the radio still streaming from before
+        radio.write(bc.FreeRun)
+        sleep(0.1)
+        writes = radio.writes
+        t = perf_counter()
+        listener = server.Listener(['-D', state], radio)
+        serial = listener.dspState.serial == radio.serial.decode()
+        print(f'  {"restart, radio streaming":<28} {1e3*(perf_counter()-t):8.0f} ms'
+              f' {radio.writes - writes:4} USB writes, serial {"ok" if serial else "WRONG"}')
+        if not serial:
+            sys.exit(1)
+    print('  a client loading the 190 kHz program register by register, through the server')
+    radio = SimRadio(**usb)
+    listener, sink, tcps = runServer([], radio)
+    for name in ('new program', 'same program again'):
+        writes = radio.writes
+        t = perf_counter()
+        clientLoad(tcps[0], bc.BWKHZ_190)
+        took = perf_counter() - t
+        sleep(0.2)                  # for the bulk write to land
+        print(f'  {name:<28} {1e3*took:8.0f} ms {radio.writes - writes:4} USB writes')
+    stopServer(listener, tcps)
+    t = perf_counter()
+    radio = SimRadio(**usb)
+    clientLoad(SimpleNamespace(sendall=radio.write, recv=lambda n: radio.read(n) or b''), bc.BWKHZ_190[:50])
+    print(f'  {"straight to the radio":<28} {1e3*(perf_counter()-t)*267/50:8.0f} ms {267:4} USB writes')
+
+# SHA-256 of each AD6620 program as it was when they were spelled out as
+# bytes literals; the generated tables have to come out the same.
+programDigests = {
+    'BWKHZ_5'   : '1cb4e9a391cb767b02c7cdb12c53e531599c822d827cedab099f09d9c91ad333',
+    'BWKHZ_10'  : '72e1c9ddb6ee3be14d5696a2cb5d3a862582cce5c387f1987027795709cbda07',
+    'BWKHZ_25'  : 'a720a9da6db30231dd2e08f91baf13ef701a3a12d23dbda59229a38bc9ecfc6b',
+    'BWKHZ_50'  : '73e1bbaf6798c9b8cc4e213bbbc1165153344fb8e39f575864dfec955b9bf103',
+    'BWKHZ_100' : '0a7f028848d63459c9d53c8309cfd454f4364193a8d45742137b6ecfa0c08373',
+    'BWKHZ_150' : '29cdcb8e470f887f36d6396e41333d87611d82f3ad4612640482b351bc3d052c',
+    'BWKHZ_190' : '782145f0255759a94ea2fba0cf50a8a9848e3412b60e5a8b243e178f752fb721',
+}
+
+importCost = '''
+import gc, sys, tracemalloc
+from time import perf_counter
+tracemalloc.start()
+t = perf_counter()
+import sdrcmds
+took = perf_counter() - t
+gc.collect()
+print(took, tracemalloc.get_traced_memory()[0])
+'''
+
+def benchCommands(runs=5):
+    print('sdrcmds: import cost and the AD6620 tables')
+    costs = []
+    for k in range(runs):
+        out = subprocess.run([sys.executable, '-c', importCost], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+        costs.append([float(x) for x in out.stdout.split()])
+    took, memory = min(costs)
+    print(f'  {"import sdrcmds":<24} {1e3*took:8.2f} ms {memory/1024:8.0f} KiB allocated')
+    from sdrcmds import SdrIQByteCommands, AD6620Program
+    for name, digest in programDigests.items():
+        program = vars(SdrIQByteCommands)[name]
+        t = perf_counter()
+        commands = program.commands() if isinstance(program, AD6620Program) else program
+        took = perf_counter() - t
+        same = hashlib.sha256(b''.join(commands)).hexdigest() == digest
+        print(f'  {name:<24} {1e6*took:8.0f} us to build {len(commands)} writes,'
+              f' {"identical to" if same else "DIFFERENT from"} the old table')
+        if not same:
+            sys.exit(1)
+
+
+def sinkProcess(conn, idle=1.0):
+    # UDP sink in its own process so its CPU isn't counted as the server's.
+    # Sends back what it saw once the stream has been quiet for `idle`.
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8 << 20)
+    sock.bind(('127.0.0.1', 0))
+    conn.send(sock.getsockname())
+    buf = bytearray(9000)
+    view = memoryview(buf)
+    latency = []
+    count = gaps = 0
+    last = None
+    sock.settimeout(30)
+    while True:
+        try:
+            n = sock.recv_into(buf)
+        except socket.timeout:
+            break
+        sock.settimeout(idle)
+        now = perf_counter()
+        count = count + 1
+        seq = buf[2] + (buf[3] << 8)
+        if last is not None:
+            gaps = gaps + (seq - last - 1) % 0xFFFE
+        last = seq
+        t = stampOf(view[4:n])
+        if t:
+            latency.append(now - t)
+    conn.send((count, gaps, latency))
+
+class SinkProcess:
+    def __init__(self):
+        self.conn, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=sinkProcess, args=(child,), daemon=True)
+        self.process.start()
+        self.address = self.conn.recv()
+
+    def start(self):
+        pass
+
+    def join(self):
+        self.count, self.gaps, self.latency = self.conn.recv()
+        self.process.join()
+
+def percentiles(values, ps=(50, 90, 99, 100)):
+    if not values:
+        return [float('nan')] * len(ps)
+    v = sorted(values)
+    return [v[min(len(v) - 1, int(len(v) * p / 100))] for p in ps]
+
+def controlRoundTrips(tcp, until, every=0.05):
+    # Status polls over the client's TCP connection while the stream runs.
+    tcp.settimeout(2)
+    times = []
+    while perf_counter() < until:
+        t = perf_counter()
+        tcp.sendall(bc.Status)
+        reply = b''
+        while len(reply) < 2 or len(reply) < reply[0] + (reply[1] & 0x1F) * 256:
+            reply = reply + tcp.recv(64)
+        if reply[2:4] == bc.Status[2:4]:
+            times.append(perf_counter() - t)
+        sleep(every)
+    return times
+
+class NoCache(dict):
+    # a hub cache that never keeps anything, for the before figures
+    def __setitem__(self, key, value):
+        pass
+
+def staticRoundTrips(tcp, rounds):
+    # What gqrx and friends ask for on every connect, `rounds` times over.
+    tcp.settimeout(2)
+    times = []
+    for k in range(rounds):
+        for query in (bc.Name, bc.SerialNumber, bc.InterfaceVersion, bc.PIC0Version, bc.PIC1Version):
+            t = perf_counter()
+            tcp.sendall(query)
+            reply = b''
+            while len(reply) < 4 or reply[2:4] != query[2:4]:
+                if len(reply) >= 2 and len(reply) >= reply[0] + (reply[1] & 0x1F) * 256:
+                    reply = reply[reply[0] + (reply[1] & 0x1F) * 256:]
+                    continue
+                reply = reply + tcp.recv(64)
+            times.append(perf_counter() - t)
+    return times
+
+def benchStaticCache(rounds=40):
+    print('cache: name, serial and version queries, radio streaming, FTDI latency timer 16 ms')
+    for name, cache in (('to the radio', NoCache()), ('from the cache', None)):
+        radio = SimRadio(frames=None, writeTime=0.001, latencyTimer=0.016)
+        listener, sink, tcps = runServer(['-P', '0'], radio)
+        if cache is not None:
+            listener.hub.cache = cache
+        controls = radio.controls
+        times = staticRoundTrips(tcps[0], rounds)
+        usb = radio.controls - controls - 1         # less the Run
+        stopServer(listener, tcps)
+        ms = ' '.join(f'{1e3*x:.2f}' for x in percentiles(times))
+        print(f'  {name:<20} {len(times):5} queries {usb:5} USB round trips,'
+              f' {listener.hub.cacheHits:5} cached, ms p50/p90/p99/max {ms}')
+
+def benchStatus(seconds=3, every=0.05):
+    print(f'status: each client polls Status every {1e3*every:.0f} ms, FTDI latency timer 16 ms')
+    for name, argv in (('no poller, -P 0', ['-P', '0']), ('poller, -P 0.5', []), ('poller, -P 0.1', ['-P', '0.1'])):
+        for clients in (1, 4, 8):
+            radio = SimRadio(frames=None, writeTime=0.001, latencyTimer=0.016)
+            listener, sink, tcps = runServer(argv, radio, clients)
+            tcps[0].settimeout(2)
+            tcps[0].recv(len(bc.FreeRun))      # the Run echo
+            until = perf_counter() + seconds
+            times = [[] for tcp in tcps]
+            pollers = [Thread(target=lambda k: times[k].extend(controlRoundTrips(tcps[k], until, every)),
+                              args=(k,)) for k in range(clients)]
+            polls = listener.hub.statusPolls
+            for p in pollers:
+                p.start()
+            for p in pollers:
+                p.join()
+            usb = listener.hub.statusPolls - polls
+            stopServer(listener, tcps)
+            times = sum(times, [])
+            ms = ' '.join(f'{1e3*x:.2f}' for x in percentiles(times, (50, 99)))
+            print(f'  {name:<18} {clients} client(s) {len(times)/seconds:6.0f} polls/s'
+                  f' {usb/seconds:6.1f} USB polls/s, ms p50/p99 {ms}')
+
+def oldWriterRun(self):
+    # what RadioWriter.run used to do: a USB write for every message
+    while not self.makeItStop.is_set():
+        try:
+            msg = self.framer.read()
+        except OSError:
+            msg = None
+        if not msg:
+            break
+        out = self.handle(msg)
+        if out:
+            self.write(out)
+    self.hub.remove(self.client)
+    self.tcp.close()
+    self.makeItStop.set()
+
+def setFreqs(freqs):
+    msgs = []
+    for f in freqs:
+        msg = bytearray(bc.SetFreq)
+        msg[5:9] = f.to_bytes(4, 'little')
+        msgs.append(bytes(msg))
+    return msgs
+
+def burstRoundTrips(tcp, bursts, size, gap):
+    # `size` frequency sets at a time, `gap` apart (0: in one send), timed
+    # from the first going out to the last reply coming back.
+    tcp.settimeout(2)
+    times = []
+    buf = b''
+    for k in range(bursts):
+        msgs = setFreqs(range(7000000 + k * size, 7000000 + (k + 1) * size))
+        t = perf_counter()
+        if gap:
+            for msg in msgs:
+                tcp.sendall(msg)
+                sleep(gap)
+        else:
+            tcp.sendall(b''.join(msgs))
+        replies = 0
+        while replies < size:
+            while len(buf) >= 2 and len(buf) >= buf[0] + (buf[1] & 0x1F) * 256:
+                n = buf[0] + (buf[1] & 0x1F) * 256
+                replies = replies + (buf[2:4] == bc.SetFreq[2:4])
+                buf = buf[n:]
+            if replies < size:
+                buf = buf + tcp.recv(256)
+        times.append(perf_counter() - t)
+        sleep(0.02 + 0.0104 * np.random.random())   # anywhere in an IQ frame
+    return times
+
+def benchWrites(bursts=50, size=16):
+    print(f'writes: bursts of {size} frequency sets, USB writes 1 ms each, FTDI latency timer 16 ms')
+    for gap, how in ((0, 'in one send'), (0.0002, 'one send each, 0.2 ms apart')):
+        print(f'  {how}')
+        for name, argv in (('a write per message', None), ('-C 0', ['-C', '0']), ('-C 0.002', ['-C', '0.002']),
+                           ('-C 0.005', ['-C', '0.005'])):
+            run = server.RadioWriter.run
+            if argv is None:
+                server.RadioWriter.run = oldWriterRun
+            try:
+                radio = SimRadio(frames=None, writeTime=0.001, latencyTimer=0.016)
+                listener, sink, tcps = runServer(['-P', '0'] + (argv or []), radio)
+                tcps[0].settimeout(2)
+                tcps[0].recv(len(bc.FreeRun))  # the Run echo
+                writes = listener.usbWrites
+                times = burstRoundTrips(tcps[0], bursts, size, gap)
+                writes = listener.usbWrites - writes
+                stopServer(listener, tcps)
+            finally:
+                server.RadioWriter.run = run
+            ms = ' '.join(f'{1e3*x:.1f}' for x in percentiles(times, (50, 90, 99)))
+            print(f'    {name:<22} {writes/bursts:6.1f} USB writes a burst, ms p50/p90/p99 {ms}')
+    # a burst bigger than one USB write goes out in several, all of it
+    radio = SimRadio(frames=None, writeTime=0.001, latencyTimer=0.016)
+    written = []
+    write = radio.write
+    radio.write = lambda data: written.append(len(data)) or write(data)
+    listener, sink, tcps = runServer(['-P', '0', '-C', '0.005'], radio)
+    tcps[0].settimeout(2)
+    tcps[0].recv(len(bc.FreeRun))          # the Run echo
+    sent, writes = len(written), sum(written)
+    msgs = b''.join(setFreqs(range(7000000, 7000600)))
+    tcps[0].sendall(msgs)
+    deadline = perf_counter() + 5
+    while sum(written) - writes < len(msgs) and perf_counter() < deadline:
+        sleep(0.01)
+    sleep(0.1)
+    stopServer(listener, tcps)
+    got = sum(written) - writes
+    print(f'  600 sets in one send       {len(msgs)} bytes sent, {got} written in {len(written) - sent} USB writes'
+          f' of at most {server.maxWrite}, {"ok" if got == len(msgs) and max(written[sent:]) <= server.maxWrite else "WRONG"}')
+
+class CountingRadio:
+    # Counts the library calls a reading pattern makes.
+    def __init__(self, radio):
+        self.radio = radio
+        self.calls = 0
+
+    def read(self, n):
+        self.calls = self.calls + 1
+        return self.radio.read(n)
+
+    def readinto(self, view):
+        self.calls = self.calls + 1
+        return self.radio.readinto(view)
+
+def benchUSB(frames=4000):
+    print('usb: reading the radio message by message vs in bulk (cpu per frame, calls at 196 kS/s)')
+    def perMessage(radio):
+        while server.readMsg(radio.read):
+            pass
+    def bulk(size):
+        def read(radio):
+            reader = FrameReader(radio.readinto, size)
+            while reader.read():
+                pass
+        return read
+    for name, pattern in (('readMsg, 2 bytes then the rest', perMessage),
+                          ('FrameReader, 16 KiB buffer', bulk(16384)),
+                          ('FrameReader, 64 KiB buffer', bulk(65536)),
+                          ('FrameReader, 256 KiB buffer', bulk(262144))):
+        # everything there at once, so only the reading is timed
+        radio = CountingRadio(SimRadio(1e12, frames))
+        radio.radio.write(bc.FreeRun)
+        _, wall, cpu = timed(lambda: pattern(radio))
+        print(f'  {name:<34} {radio.calls/frames:6.2f} calls/frame {96*radio.calls/frames:7.0f} calls/s'
+              f' {1e6*cpu/frames:7.2f} us cpu/frame')
+    print('  control round trips through the server, radio streaming, FTDI latency timer as set')
+    def wholeBuffer(readinto, size, resync=False, most=None):
+        # what the capture thread used to ask for: all the room there is
+        return FrameReader(readinto, size, resync)
+    for argv, reader in (([], None), ([], wholeBuffer), (['-L', '2'], None),
+                         (['-L', '2:16384'], None), (['-L', '2:65536'], None)):
+        old = capture.FrameReader
+        if reader:
+            capture.FrameReader = reader
+        try:
+            radio = SimRadio(frames=None, latencyTimer=0.016)
+            listener, sink, tcps = runServer(argv, radio)
+            tcps[0].settimeout(2)
+            tcps[0].recv(len(bc.FreeRun))  # the Run echo
+            times = burstRoundTrips(tcps[0], 50, 1, 0)
+            stopServer(listener, tcps)
+        finally:
+            capture.FrameReader = old
+        ms = ' '.join(f'{1e3*x:.1f}' for x in percentiles(times, (50, 90, 99)))
+        name = (" ".join(argv) or "defaults (16 ms)") + (", whole buffer" if reader else "")
+        print(f'  {name:<34} frequency set ms p50/p90/p99 {ms}'
+              f', {listener.capture.framer.reads / max(listener.capture.iqFrames, 1):.2f} reads/frame')
+
+def oldCaptureRun(self):
+    # what Capture.run used to do: sleep 10 ms after every empty read
+    while not self.makeItStop.is_set():
+        msg = self.framer.read()
+        if not msg:
+            sleep(0.01)
+            continue
+        if msg[1] != 0x80 or msg[0] != 0:
+            self.controls = self.controls + 1
+            if self.swallow and self.swallow(msg):
+                continue
+        self.ring.put(msg)
+    self.ring.close()
+
+def benchWakeup(seconds=3, sets=60):
+    print('wakeup: control replies and idle CPU, sleeping after empty reads vs waiting in the read'
+          ' (Status poller at its default -P 0.5)')
+    print(f'  {"":<26} {"frequency set ms p50/p90/p99/max":>34} {"idle cpu %":>11}')
+    for name, run in (('sleep(0.01)', oldCaptureRun), ('blocking read', None)):
+        for latency, streaming in ((16, False), (16, True), (2, False), (2, True)):
+            old = server.Capture.run
+            if run:
+                server.Capture.run = run
+            try:
+                radio = SimRadio(frames=None, latencyTimer=latency / 1000)
+                listener, sink, tcps = runServer([], radio)
+                tcps[0].settimeout(2)
+                tcps[0].recv(len(bc.FreeRun))  # the Run echo
+                if not streaming:
+                    tcps[0].sendall(bc.Stop)
+                    tcps[0].recv(len(bc.Stop))
+                times = burstRoundTrips(tcps[0], sets, 1, 0)
+                idle = None
+                if not streaming:
+                    sleep(1)                # for the server to notice it's idle
+                    c, w = process_time(), perf_counter()
+                    sleep(seconds)
+                    idle = 100 * (process_time() - c) / (perf_counter() - w)
+                stopServer(listener, tcps)
+            finally:
+                server.Capture.run = old
+            ms = ' '.join(f'{1e3*x:.1f}' for x in percentiles(times))
+            case = f'{name}, {latency} ms timer, {"streaming" if streaming else "idle"}'
+            print(f'  {case:<40} {ms:>20} {"" if idle is None else f"{idle:.2f}":>11}')
+
+def serveRadio(rate, seconds, address, conn=None):
+    # One simulated radio served to a local client for `seconds`, its IQ
+    # going to the UDP sink at address.  Returns (or sends back) the frames
+    # the radio made and the frames the capture ring dropped.
+    radio = SimRadio(rate, frames=int(rate / 2048 * seconds))
+    sink = SimpleNamespace(address=address, start=lambda: None)
+    listener, sink, tcps = runServer([], radio, sink=sink)
+    sleep(seconds + 0.5)
+    stopServer(listener, tcps)
+    result = (radio.produced(), listener.ring.dropped)
+    if conn:
+        conn.send(result)
+    return result
+
+class FakeSupervisor(supervisor.Supervisor):
+    # Two "radios" whose servers are stand-ins: one serves a client for a
+    # while and exits cleanly, the other fails as soon as it starts.
+    def radios(self):
+        return ['CLEAN', 'FAILING']
+
+    def command(self, serial, k):
+        code = 'import time; time.sleep(1.5)' if serial == 'CLEAN' else 'import sys; sys.exit(1)'
+        return [sys.executable, '-c', code]
+
+def benchMulti(seconds=3, rate=2000000, radios=(1, 2, 4)):
+    print(f'multi: N simulated radios at {rate/1e3:.0f} kS/s each, one server process vs a process per radio'
+          f' ({os.cpu_count()} cpus)')
+    print(f'  {"":<22} {"radios":>6} {"frames/s":>9} {"of":>6} {"loss %":>7} {"ring drops":>10}'
+          f' {"latency ms p50/p99":>20}')
+    for name in ('threads, one process', 'process per radio (-M)'):
+        for n in radios:
+            sinks = [SinkProcess() for k in range(n)]
+            if name.startswith('threads'):
+                results = [None] * n
+                def one(k):
+                    results[k] = serveRadio(rate, seconds, sinks[k].address)
+                threads = [Thread(target=one, args=(k,)) for k in range(n)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+            else:
+                pipes = [multiprocessing.Pipe() for k in range(n)]
+                workers = [multiprocessing.Process(target=serveRadio, args=(rate, seconds, sinks[k].address, pipes[k][1]))
+                           for k in range(n)]
+                for w in workers:
+                    w.start()
+                results = [conn.recv() for conn, child in pipes]
+                for w in workers:
+                    w.join()
+            for sink in sinks:
+                sink.join()
+            frames = sum(r[0] for r in results)
+            expected = frames * 8192 // server.iqDataSendBlockSize
+            received = sum(sink.count for sink in sinks)
+            lat = ' '.join(f'{1e3*x:.1f}' for x in percentiles(sum((s.latency for s in sinks), []), (50, 99)))
+            print(f'  {name:<22} {n:6} {frames/seconds:9.0f} {n*rate/2048:6.0f}'
+                  f' {100*(1-received/max(expected,1)):7.2f} {sum(r[1] for r in results):10} {lat:>20}')
+    print('  supervisor restarts over 8 s: a server that exits cleanly after 1.5 s, one that fails at once')
+    listener = SimpleNamespace(makeItStop=Event(), print=lambda *args: None, radioName=b'SDR-IQ',
+                               workerArgs=[], tcpPort=0, metricsPort=0, dspStatePath='dsp.json',
+                               recordDir=None, recordBytes=0, recordSeconds=0)
+    boss = FakeSupervisor(listener)
+    runner = Thread(target=boss.run)
+    runner.start()
+    sleep(8)
+    listener.makeItStop.set()
+    runner.join()
+    for worker in boss.workers:
+        print(f'  {worker.serial:<22} started {worker.starts} times, {worker.failures} failures,'
+              f' last delay {worker.delay:.0f} s')
+
+
+class UnpluggableRadio(SimRadio):
+    # A SimRadio that can be pulled out: reads and writes fail while it is,
+    # the way libftdi's do once the device has gone.
+    unplugged = False
+
+    def readinto(self, view):
+        if self.unplugged:
+            raise IOError('USB device unavailable')
+        return super(UnpluggableRadio, self).readinto(view)
+
+    def write(self, data):
+        if self.unplugged:
+            raise IOError('USB device unavailable')
+        return super(UnpluggableRadio, self).write(data)
+
+    def close(self):
+        pass
+
+def exchange(tcp, msg, timeout=2.0):
+    # Send a control message and wait for the reply to its item, passing
+    # over anything else.  None if none comes.
+    tcp.settimeout(timeout)
+    tcp.sendall(msg)
+    buf = b''
+    deadline = perf_counter() + timeout
+    while perf_counter() < deadline:
+        while len(buf) >= 2 and len(buf) >= buf[0] + (buf[1] & 0x1F) * 256:
+            n = buf[0] + (buf[1] & 0x1F) * 256
+            reply, buf = buf[:n], buf[n:]
+            if reply[2:4] == msg[2:4]:
+                return reply
+        try:
+            buf = buf + tcp.recv(256)
+        except socket.timeout:
+            break
+    return None
+
+def benchReconnect(away=1.0):
+    print(f'reconnect: the radio gone for {away:.0f} s mid-stream and back, USB writes 1 ms each, FTDI latency timer 16 ms')
+    usb = {'writeTime': 0.001, 'latencyTimer': 0.016}
+    failed = False
+    with tempfile.TemporaryDirectory() as d:
+        for name in ('unplugged, back cold', 'link reset, radio warm'):
+            radio = UnpluggableRadio(**usb)
+            listener, sink, tcps = runServer(['-D', os.path.join(d, 'state.json')], radio)
+            tcp = tcps[0]
+            tcp.settimeout(2)
+            tcp.recv(len(bc.FreeRun))              # the Run echo
+            clientLoad(tcp, bc.BWKHZ_50)
+            clock = bytes(bc.SetSampleRate[:5]) + (66666000).to_bytes(4, 'little')
+            for msg in (clock, setFreqs([7100000])[0], b'\x06\x00\x38\x00\x00\xF6', b'\x06\x00\x40\x00\x00\x0C'):
+                exchange(tcp, msg)
+            back = radio if name.startswith('link') else UnpluggableRadio(**usb)
+            backAt = perf_counter() + away
+            def openRadio(serial, listener=listener, back=back):
+                if perf_counter() < backAt:
+                    return False
+                back.unplugged = False
+                listener.radio = back
+                return True
+            listener.openRadio = openRadio
+            radio.unplugged = True
+            t = perf_counter()
+            tcp.sendall(setFreqs([7200000])[0])     # while it's away
+            while not listener.reconnects and perf_counter() - t < 10:
+                sleep(0.01)
+            recovered = perf_counter() - t
+            before = listener.hub.datagrams()      # (the sink has given up by now)
+            sleep(0.5)
+            status = exchange(tcp, bc.Status)
+            checks = {
+                'frequency'   : back.freq & 0xFFFFFFFF == 7200000,
+                'RF gain'     : back.rfGain == 0xF6,
+                'IF gain'     : back.ifGain == 12,
+                'A/D clock'   : back.adClock == 66666000,
+                'IQ rate'     : back.sampleRate == 55556,
+                'DSP program' : back.program[-len(bc.BWKHZ_50):] == list(bc.BWKHZ_50),
+                'running'     : back.running,
+                'IQ flowing'  : listener.hub.datagrams() > before,
+                'TCP session' : status is not None,
+            }
+            stopServer(listener, tcps)
+            restore = listener.restoreSeconds
+            print(f'  {name:<24} back in {1e3*recovered:6.0f} ms, restore {1e3*restore if restore else float("nan"):5.0f} ms,'
+                  f' {listener.recoverTime.count()} in sdriq_recover_seconds')
+            print(f'  {"":<24} ' + ', '.join(f'{k} {"ok" if v else "LOST"}' for k, v in checks.items()))
+            failed = failed or not all(checks.values())
+    if failed:
+        sys.exit(1)
+
+
+def benchEndToEnd(seconds=4, rates=(196078, 1000000, 4000000)):
+    print('e2e: simulated SDR-IQ -> server -> local TCP/UDP client (cpu is server + simulator)')
+    print(f'  {"":<20} {"kS/s":>6} {"frames/s":>9} {"us cpu/fr":>9} {"loss %":>7}'
+          f' {"latency ms p50/p90/p99/max":>28} {"control ms p50/p99":>20}')
+    for name, argv in (('threaded', []), ('asyncio -a', ['-a'])):
+        for rate in rates:
+            sink = SinkProcess()
+            radio = SimRadio(rate, frames=int(rate / 2048 * seconds))
+            c = process_time()
+            listener, sink, tcps = runServer(argv, radio, sink=sink)
+            tcps[0].settimeout(2)
+            tcps[0].recv(len(bc.FreeRun))      # the Run echo
+            control = controlRoundTrips(tcps[0], perf_counter() + seconds)
+            sink.join()
+            cpu = process_time() - c
+            stopServer(listener, tcps)
+            frames = radio.produced()
+            expected = frames * 8192 // listener.blockSize
+            lat = ' '.join(f'{1e3*x:.1f}' for x in percentiles(sink.latency))
+            ctl = ' '.join(f'{1e3*x:.1f}' for x in percentiles(control, (50, 99)))
+            print(f'  {name:<20} {rate/1e3:6.0f} {frames/seconds:9.0f} {1e6*cpu/max(frames,1):9.1f}'
+                  f' {100*(1-sink.count/max(expected,1)):7.2f} {lat:>28} {ctl:>20}')
+
+
+benchmarks = {
+    'framer' : benchFramer,
+    'resync' : benchResync,
+    'meter'  : benchMeter,
+    'sender' : benchSender,
+    'blocksize' : benchBlockSize,
+    'ddc'    : benchDDC,
+    'compress' : benchCompress,
+    'serve'  : benchServe,
+    'fanout' : benchFanout,
+    'ring'   : benchRing,
+    'record' : benchRecord,
+    'playback' : benchPlayback,
+    'boot'   : benchBoot,
+    'sdrcmds' : benchCommands,
+    'cache'  : benchStaticCache,
+    'status' : benchStatus,
+    'writes' : benchWrites,
+    'usb'    : benchUSB,
+    'wakeup' : benchWakeup,
+    'multi'  : benchMulti,
+    'reconnect' : benchReconnect,
+    'e2e'    : benchEndToEnd,
+}
+
+if __name__ == '__main__':
+    for name in sys.argv[1:] or benchmarks:
+        if name not in benchmarks:
+            print(f'unknown benchmark: {name} (have {", ".join(benchmarks)})')
+            sys.exit(2)
+        benchmarks[name]()
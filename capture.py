@@ -0,0 +1,194 @@
+# USB capture, decoupled from everything downstream.
+#
+# The Capture thread does nothing but drain the radio into a FrameRing, a
+# fixed set of preallocated frame slots.  Whatever happens on the network
+# side, the USB FIFO keeps getting emptied.  When the ring is full the
+# newest frame is dropped and counted rather than holding up the capture
+# thread or overwriting a slot a consumer may still be looking at.
+#
+# A source that can wait, like a recording played faster than real time,
+# says so with `lossless` and the capture thread then waits for room instead.
+#
+# A read that fails means the radio has gone.  The capture thread then
+# waits in Listener.reconnect until it is back and carries on reading the
+# new device into the same ring, so everything downstream just sees a gap.
+#
+# Consumers each have their own cursor.  next() and take() hand out views of
+# the next slots and, at the same time, give back the ones handed out last.
+
+from threading import Thread, Condition, Event
+from time import perf_counter
+
+from framer import FrameReader, ftdiReadInto, maxFrameLength
+
+
+quietAfter = 0.5                    # seconds of silence before capture stops reading
+
+
+class FrameRing:
+    def __init__(self,frames=64):
+        self.size      = frames
+        self.buffer    = bytearray(frames * maxFrameLength)
+        self.view      = memoryview(self.buffer)
+        self.lengths   = [0] * frames
+        self.times     = [0.0] * frames # when each slot was filled
+        self.cond      = Condition()
+        self.head      = 0          # frames written, ever
+        self.consumers = []
+        self.dropped   = 0
+        self.highWater = 0
+        self.closed    = False
+        self.full      = False      # the capture thread is waiting for room
+
+    def consumer(self):
+        c = RingConsumer(self)
+        with self.cond:
+            self.consumers = self.consumers + [c]
+        return c
+
+    def remove(self,consumer):
+        with self.cond:
+            self.consumers = [c for c in self.consumers if c is not consumer]
+
+    def room(self):
+        consumers = self.consumers
+        tail = min([c.tail for c in consumers]) if consumers else self.head
+        return self.size - (self.head - tail)
+
+    def waitForRoom(self,timeout):
+        with self.cond:
+            if self.room() <= 0 and not self.closed:
+                self.full = True
+                self.cond.wait(timeout)
+                self.full = False
+        return self.room() > 0
+
+    def put(self,msg):
+        # Capture thread only.  Never blocks on consumers.
+        used = self.size - self.room()
+        if used >= self.size:
+            self.dropped = self.dropped + 1
+            return False
+        k = self.head % self.size
+        n = len(msg)
+        self.view[k*maxFrameLength:k*maxFrameLength+n] = msg
+        self.lengths[k] = n
+        self.times[k] = perf_counter()
+        if used + 1 > self.highWater:
+            self.highWater = used + 1
+        with self.cond:
+            self.head = self.head + 1
+            self.cond.notify_all()
+        return True
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+    def stats(self):
+        consumers = self.consumers
+        return {
+            'frames'    : self.head,
+            'dropped'   : self.dropped,
+            'highWater' : self.highWater,
+            'size'      : self.size,
+            'lag'       : max([self.head - c.tail for c in consumers], default=0)
+        }
+
+    def report(self):
+        s = self.stats()
+        return f'ring {s["lag"]}/{s["size"]} high water {s["highWater"]} dropped {s["dropped"]}'
+
+
+class RingConsumer:
+    def __init__(self,ring):
+        self.ring = ring
+        self.tail = ring.head
+        self.held = 0
+        self.times = []             # capture times of the frames last handed out
+
+    def next(self,timeout=None):
+        # The next frame as a view into the ring, or None on timeout or
+        # once the ring is closed.
+        frames = self.take(1,timeout)
+        return frames[0] if frames else None
+
+    def take(self,most,timeout=None):
+        # Up to `most` frames, waiting only if there are none.  The views
+        # handed out by the previous call are given back.
+        ring = self.ring
+        with ring.cond:
+            self.tail = self.tail + self.held
+            self.held = 0
+            if ring.full:
+                ring.cond.notify_all()
+            if self.tail == ring.head and not ring.closed:
+                ring.cond.wait(timeout)
+            count = min(ring.head - self.tail, most)
+        self.held = count
+        frames = []
+        self.times = []
+        for t in range(self.tail, self.tail + count):
+            k = t % ring.size
+            frames.append(ring.view[k*maxFrameLength:k*maxFrameLength+ring.lengths[k]])
+            self.times.append(ring.times[k])
+        return frames
+
+
+class Capture(Thread):
+    def __init__(self,listener,ring):
+        super(Capture,self).__init__()
+        self.makeItStop = listener.makeItStop
+        self.radio      = listener.radio
+        self.reconnect  = listener.reconnect
+        self.ring       = ring
+        # A libftdi read keeps going until it has all it asked for, so a
+        # read the size of the buffer would hold control replies up behind
+        # tens of KB of IQ.  Reads ask for two of the radio's USB transfers.
+        most = 2 * (listener.usbChunk or 4096)
+        size = max(8 * maxFrameLength, 2 * most)
+        self.framer     = FrameReader(ftdiReadInto(self.radio),size,resync=True,most=most)
+        self.lossless   = getattr(self.radio, 'lossless', False)
+        self.swallow    = None      # a test for control messages nobody wants
+        self.wakeup     = Event()   # set on every write to the radio
+        self.iqFrames   = 0
+        self.controls   = 0
+        self.daemon     = True
+
+    def run(self):
+        # A read with nothing to give waits in libusb until the FTDI chip
+        # sends what it has, at the latest when its latency timer runs
+        # out, so an empty read is the wait and there is no need to sleep.
+        # Once the radio has gone quiet (stopped, and nothing asked of it)
+        # reading would only poll it every latency timer; then we wait for
+        # the next write to it instead, looking once a second for anything
+        # it sends on its own.
+        heard = perf_counter()
+        while not self.makeItStop.isSet():
+            try:
+                msg = self.framer.read()
+            except OSError as err:
+                self.radio = self.reconnect(err)
+                if self.radio is None:
+                    break
+                self.framer.reset(ftdiReadInto(self.radio))
+                heard = perf_counter()
+                continue
+            if not msg:
+                if perf_counter() - heard > quietAfter and self.wakeup.wait(1.0):
+                    self.wakeup.clear()
+                    heard = perf_counter()
+                continue
+            heard = perf_counter()
+            if msg[1] == 0x80 and msg[0] == 0:
+                self.iqFrames = self.iqFrames + 1
+            else:
+                self.controls = self.controls + 1
+                if self.swallow and self.swallow(msg):
+                    continue
+            if self.lossless:
+                while not self.ring.waitForRoom(0.1) and not self.makeItStop.isSet():
+                    pass
+            self.ring.put(msg)
+        self.ring.close()
@@ -0,0 +1,371 @@
+# Several SDR clients sharing one radio.
+#
+# The radio is read once and every IQ frame is handed to each client's own
+# IQSender (each client keeps its own sequence numbers), so another client
+# costs one more send per frame and no parsing or copying.
+#
+# Control policy: the oldest connected client owns the radio.  Its messages
+# go to the radio as they are.  Other clients may ask (Get and range
+# requests go through), but anything that would change the radio -- Set
+# control items and AD6620 data -- is answered locally the way the radio
+# would answer it and never reaches the USB link.  When the owner leaves,
+# the next oldest client takes over.
+#
+# The owner's AD6620 programs go through dspstate.py, which answers the
+# register writes itself and only loads a program the radio doesn't have.
+#
+# Replies from the radio go back to whoever asked for that control item;
+# unsolicited messages go to everyone and anything unclaimed to the owner.
+#
+# The radio's name, serial number and interface and PIC versions can't
+# change while it stays connected, and clients ask for them over and over.
+# The server asks once when it connects to the radio, and again whenever
+# it reconnects (Listener.primeCache), and the hub answers those Gets from
+# its cache without going near USB.
+#
+# Status (0x0005) does change, but clients poll it all the time.  A poller
+# in the server asks the radio every so often (server.py -P) and the hub
+# answers every client's Status from the latest reply, as long as it is no
+# older than statusMaxAge.  Past that a client's poll goes to the radio,
+# unless one is already on its way, and everyone waiting gets its reply.
+# Either way the radio sees the same few polls however many clients there are.
+# The poller only asks while the radio is running (the last Run/Stop that
+# went to it was a Run), so a stopped radio is left alone and the capture
+# thread can go quiet; clients' polls then go to the radio as above.
+#
+# Each client has its own IQ datagram size.  It starts at the server's
+# choice for that host and a client can ask for another with the NetSDR
+# "UDP packet size" control item (0x00C4: 0 large, 1 small).  The SDR-IQ
+# doesn't have that item, so the server answers it itself.  As on a NetSDR
+# with 16-bit samples, large is 1024 data bytes a datagram and small 512;
+# other sizes are for -d to give a host that expects them.
+#
+# A client can also get a down-converted stream (ddc.py): a narrower slice
+# of the band at a fraction of the rate, for links that can't carry it all.
+# Each such client has its own DDC, since the filter state follows the
+# stream; clients without one cost nothing extra.  The offsets are worked
+# out against the rate of the AD6620 program in the radio, as the DSPState
+# knows it, and follow it when a client loads another.  (The sample rate
+# item, 0x00B0, is the radio's A/D clock and goes to the radio as ever.)
+#
+# Or a compressed one (compress.py), decoded back to ordinary datagrams at
+# the far end.
+#
+# The owner's last Set of each control item that went to the radio is kept
+# in settings, so that a radio that went away and came back can be put back
+# the way the clients had it (server.py, Listener.restore).
+#
+# With a multicast group set the IQ datagrams go to the group once instead
+# of to each client, so the cost no longer grows with the listeners.
+
+from collections import deque
+from threading import Lock
+from time import perf_counter
+
+from sender import IQSender
+from compress import CompressedSender
+from metrics import Histogram
+from sdrcmds import SdrIQByteCommands as bc
+
+
+# message types, the top three bits of the second header byte
+SET, GET, RANGE, ACK, DATA0, DATA1 = 0, 1, 2, 3, 4, 5
+dataItemAck = b'\x03\x60\x00'
+packetSizeItem = b'\xC4\x00'
+largeBlock, smallBlock = 1024, 512
+statusItem = b'\x05\x00'
+runItem = b'\x18\x00'
+statusTimeout = 1.0                 # seconds to wait for a Status reply before asking again
+staticQueries = (bc.Name, bc.SerialNumber, bc.InterfaceVersion, bc.PIC0Version, bc.PIC1Version)
+
+
+def msgType(msg):
+    return msg[1] >> 5
+
+def replyKey(msg, request):
+    # What a reply is matched on: the control item code, or 'ack' for the
+    # data item acks the radio sends for AD6620 programming.
+    kind = msgType(msg)
+    if (request and kind == DATA1) or (not request and kind == ACK):
+        return 'ack'
+    if len(msg) >= 4:
+        return bytes(msg[2:4])
+    return None
+
+def staticRequest(msg):
+    # The Get a radio reply answers, if it is one of staticQueries.  The
+    # PIC version replies carry which PIC they are about.
+    if msgType(msg) != SET or len(msg) < 5:
+        return None
+    item = bytes(msg[2:4])
+    if item == b'\x04\x00':
+        return b'\x05\x20' + item + bytes(msg[4:5])
+    if item in (b'\x01\x00', b'\x02\x00', b'\x03\x00'):
+        return b'\x04\x20' + item
+    return None
+
+
+class Client:
+    def __init__(self,send,address,udp,blockSize,sendMode,ddc=None,codec=None,offset=0.0):
+        self.send    = send         # control replies, over TCP
+        self.address = address      # where the IQ datagrams go
+        self.udp     = udp
+        self.sendMode = sendMode
+        self.ddc     = ddc          # a DDC, or None for the full stream
+        self.offset  = offset       # its offset, Hz
+        self.codec   = codec        # a compress.py codec name, or None
+        if codec is None:
+            self.sender = IQSender(udp, blockSize, sendMode)
+        else:
+            self.sender = CompressedSender(udp, codec)
+
+    def sendData(self,data):
+        if self.ddc is None:
+            self.sender.send(data, self.address)
+            return
+        for frame in self.ddc.feed(data):
+            self.sender.send(frame, self.address)
+
+    def setBlockSize(self,blockSize):
+        # a compressed stream sizes its own datagrams
+        if self.codec is not None or blockSize == self.sender.blockSize:
+            return
+        old = self.sender
+        sender = IQSender(self.udp, blockSize, self.sendMode)
+        sender.sequence = old.sequence
+        sender.datagrams = old.datagrams
+        sender.wraps = old.wraps
+        sender.dropped = old.dropped
+        self.sender = sender
+
+
+class ClientHub:
+    def __init__(self,output):
+        self.print   = output
+        self.lock    = Lock()
+        self.clients = ()           # oldest first; replaced, never mutated
+        self.pending = {}
+        self.multicast = None       # a Client with no TCP side
+        self.fromClients = 0        # control messages, by direction
+        self.toRadio = 0
+        self.radioReplies = 0
+        self.retired = [0, 0, 0]    # datagrams, wraps and dropped frames of departed clients
+        self.dsp     = None         # a DSPState, if keeping track of programs
+        self.cache   = {}           # staticQueries -> the radio's replies
+        self.cacheHits = 0          # queries answered from it, USB round trips saved
+        self.replyTime = {'cache': Histogram(), 'radio': Histogram(), 'status': Histogram()}
+        self.status  = None         # the radio's latest Status reply
+        self.statusTime = 0.0       # and when it came
+        self.statusMaxAge = 0.0     # oldest a reply may be to answer a client with
+        self.statusAsked = 0.0      # when a Status went to the radio, 0 once answered
+        self.statusPolls = 0        # Status queries sent to the radio
+        self.statusHits = 0         # client polls answered from self.status
+        self.settings = {}          # control item -> the last Set of it sent to the radio, oldest first
+        self.sampleRate = 196078    # the IQ rate, that of the AD6620 program in the radio
+
+    def __len__(self):
+        return len(self.clients)
+
+    def owner(self):
+        clients = self.clients
+        return clients[0] if clients else None
+
+    def add(self,client):
+        with self.lock:
+            self.clients = self.clients + (client,)
+            if len(self.clients) == 1:
+                self.print(f'{client.address[0]} owns the radio')
+        return client
+
+    def remove(self,client):
+        with self.lock:
+            owner = self.owner()
+            if client in self.clients:
+                self.retired[0] = self.retired[0] + client.sender.datagrams
+                self.retired[1] = self.retired[1] + client.sender.wraps
+                self.retired[2] = self.retired[2] + client.sender.dropped
+            self.clients = tuple(c for c in self.clients if c is not client)
+            if owner is client and self.clients:
+                self.print(f'{self.clients[0].address[0]} owns the radio')
+
+    def fromClient(self,client,msg):
+        # What should go on to the radio for msg, or None.
+        self.fromClients = self.fromClients + 1
+        kind = msgType(msg)
+        if msg[2:4] == packetSizeItem and kind in (SET, GET):
+            self.packetSize(client, msg, kind)
+            return None
+        if kind == GET:
+            reply = self.cache.get(bytes(msg))
+            if reply is not None:
+                t = perf_counter()
+                self.cacheHits = self.cacheHits + 1
+                client.send(reply)
+                self.replyTime['cache'].observe(perf_counter() - t)
+                return None
+        if kind == GET and msg[2:4] == statusItem:
+            return self.pollStatus(client, msg)
+        if client is not self.owner() and kind in (SET, DATA1):
+            client.send(dataItemAck if kind == DATA1 else msg)
+            return None
+        if kind == DATA1 and self.dsp:
+            handled, out = self.dsp.fromClient(msg)
+            self.rateChanged(self.dsp.rate)
+            if handled:
+                client.send(dataItemAck)
+                if out:
+                    self.toRadio = self.toRadio + 1
+                return out
+        key = replyKey(msg, True)
+        if key is not None:
+            with self.lock:
+                self.pending.setdefault(key, deque(maxlen=64)).append((client, perf_counter()))
+                if kind == SET:
+                    self.settings.pop(key, None)
+                    self.settings[key] = bytes(msg)
+        self.toRadio = self.toRadio + 1
+        return msg
+
+    def pollStatus(self,client,msg):
+        # A client's Status poll: the latest reply if it's recent enough,
+        # else wait for the next one, asking the radio if nobody has.
+        now = perf_counter()
+        status = self.status
+        if status is not None and now - self.statusTime <= self.statusMaxAge:
+            self.statusHits = self.statusHits + 1
+            client.send(status)
+            self.replyTime['status'].observe(perf_counter() - now)
+            return None
+        with self.lock:
+            self.pending.setdefault(statusItem, deque(maxlen=64)).append((client, now))
+            if self.statusAsked and now - self.statusAsked < statusTimeout:
+                return None
+            self.statusAsked = now
+        self.statusPolls = self.statusPolls + 1
+        self.toRadio = self.toRadio + 1
+        return msg
+
+    def statusDue(self):
+        # The poller's turn: True if it should ask the radio for Status now.
+        # Nobody to tell, the radio stopped, or a poll already on its way,
+        # and it needn't.
+        now = perf_counter()
+        with self.lock:
+            if not self.clients or not self.running() or \
+               (self.statusAsked and now - self.statusAsked < statusTimeout):
+                return False
+            self.statusAsked = now
+        self.statusPolls = self.statusPolls + 1
+        return True
+
+    def running(self):
+        # Run/Stop byte 1 is 0x02 to run (free or for N samples), 0x01 to stop
+        run = self.settings.get(runItem)
+        return run is not None and run[5] == 0x02
+
+    def statusAge(self):
+        return perf_counter() - self.statusTime if self.status is not None else None
+
+    def fromStatus(self,msg):
+        # A Status reply: keep it, and give it to everyone waiting for one.
+        self.status = bytes(msg)
+        self.statusTime = perf_counter()
+        with self.lock:
+            self.statusAsked = 0.0
+            waiting = self.pending.pop(statusItem, ())
+        for client, t in waiting:
+            if client in self.clients:
+                self.trySend(client, msg)
+                self.replyTime['radio'].observe(perf_counter() - t)
+
+    def rateChanged(self,rate):
+        # The IQ rate of the program in the radio, if known: DDC offsets
+        # are fractions of it.
+        if not rate or rate == self.sampleRate:
+            return
+        self.sampleRate = rate
+        clients = self.clients + ((self.multicast,) if self.multicast else ())
+        for c in clients:
+            if c.ddc is not None:
+                c.ddc.retune(c.offset / rate)
+
+    def packetSize(self,client,msg,kind):
+        if kind == SET and len(msg) >= 6:
+            client.setBlockSize(smallBlock if msg[5] else largeBlock)
+            self.print(f'{client.address[0]} gets {client.sender.blockSize} byte IQ datagrams')
+        small = 1 if client.sender.blockSize == smallBlock else 0
+        client.send(b'\x06\x00' + packetSizeItem + bytes([0, small]))
+
+    def fromRadio(self,msg):
+        # Control traffic from the radio (not IQ data).
+        self.radioReplies = self.radioReplies + 1
+        if self.dsp:
+            self.dsp.observe(msg)
+        if msgType(msg) == GET:
+            # unsolicited control item
+            for c in self.clients:
+                self.trySend(c, msg)
+            return
+        if msgType(msg) == SET and msg[2:4] == statusItem:
+            self.fromStatus(msg)
+            return
+        request = staticRequest(msg)
+        if request is not None:
+            self.cache[request] = bytes(msg)
+        client = None
+        key = replyKey(msg, False)
+        with self.lock:
+            waiting = self.pending.get(key)
+            while waiting and client is None:
+                client, t = waiting.popleft()
+                if client not in self.clients:
+                    client = None
+        if client:
+            self.trySend(client, msg)
+            self.replyTime['radio'].observe(perf_counter() - t)
+            return
+        client = self.owner()
+        if client:
+            self.trySend(client, msg)
+
+    def trySend(self,client,msg):
+        # A client that went away is its writer's business; don't let it
+        # take the radio down for everyone else.
+        try:
+            client.send(msg)
+        except OSError as err:
+            self.print(f'send to {client.address[0]} failed: {err}')
+
+    def senders(self):
+        clients = self.clients + ((self.multicast,) if self.multicast else ())
+        return [c.sender for c in clients]
+
+    def datagrams(self):
+        return self.retired[0] + sum(s.datagrams for s in self.senders())
+
+    def wraps(self):
+        return self.retired[1] + sum(s.wraps for s in self.senders())
+
+    def dropped(self):
+        return self.retired[2] + sum(s.dropped for s in self.senders())
+
+    def compressionRatio(self):
+        senders = [s for s in self.senders() if isinstance(s, CompressedSender)]
+        sent = sum(s.sentBytes for s in senders)
+        return sum(s.rawBytes for s in senders) / sent if sent else None
+
+    def compressionCost(self):
+        senders = [s for s in self.senders() if isinstance(s, CompressedSender)]
+        frames = sum(s.frames for s in senders)
+        return sum(s.cpu for s in senders) / frames if frames else None
+
+    def sendData(self,data):
+        # data is a view of one frame's samples, shared by every client
+        if self.multicast:
+            self.multicast.sendData(data)
+            return
+        for c in self.clients:
+            try:
+                c.sendData(data)
+            except OSError as err:
+                self.print(f'IQ to {c.address[0]} failed: {err}')
@@ -0,0 +1,102 @@
+# Digital down-conversion for clients on thin links (server.py -x).
+#
+# A DDC shifts the stream by a frequency offset, low-pass filters it and
+# keeps every Nth sample, so a client gets a narrower slice of the band at
+# 1/N of the rate, in the same 00 80 frames and UDP datagrams as before.
+#
+# Everything works a whole 2048 sample frame at a time with numpy.  The
+# oscillator phase and the last taps-1 input samples carry over from one
+# frame to the next, so the output is the same as if the stream had been
+# filtered in one piece: no clicks or steps at frame edges.  The filter only
+# computes the outputs that are kept, one dot product per output, which is
+# what a polyphase decimator does.
+#
+# Output is gathered into 8192 byte frames; feed() hands back whichever are
+# complete, usually none or one, each in a buffer of its own.
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+frameBytes = 8192
+fullScale = 32767
+
+
+def lowPass(decimation, tapsPerPhase=12, beta=8.0):
+    # Kaiser windowed sinc with unity gain at DC, passing 0.8 of the output
+    # band and reaching the stop band by the output's Nyquist frequency.
+    n = tapsPerPhase * decimation
+    cutoff = 0.9 / (2.0 * decimation)
+    t = np.arange(n) - (n - 1) / 2.0
+    taps = 2.0 * cutoff * np.sinc(2.0 * cutoff * t) * np.kaiser(n, beta)
+    return (taps / taps.sum()).astype(np.float32)
+
+
+class DDC:
+    def __init__(self,decimation,offset=0.0,taps=None):
+        # offset is in cycles per input sample, i.e. Hz / sample rate
+        if decimation < 1:
+            raise ValueError(f'decimation must be at least 1, not {decimation}')
+        self.decimation = decimation
+        self.offset     = offset
+        self.taps       = lowPass(decimation) if taps is None else np.asarray(taps, np.float32)
+        self.reversed   = self.taps[::-1].copy()
+        self.history    = np.zeros(len(self.taps) - 1, np.complex64)
+        self.phase      = 0.0       # oscillator phase at the next input sample, in cycles
+        self.skip       = 0         # input samples to the next kept output
+        self.mixer      = None
+        self.out        = bytearray(frameBytes)
+        self.filled     = 0
+        self.frames     = 0         # output frames made
+
+    def retune(self,offset):
+        # A new offset, in cycles per input sample; the phase carries on.
+        self.offset = offset
+        self.mixer  = None
+
+    def mix(self,x):
+        # the oscillator for a frame is one fixed table turned by the phase
+        n = len(x)
+        if self.mixer is None or len(self.mixer) != n:
+            self.mixer = np.exp(-2j * np.pi * self.offset * np.arange(n)).astype(np.complex64)
+        x = x * (self.mixer * np.complex64(np.exp(-2j * np.pi * self.phase)))
+        self.phase = (self.phase + self.offset * n) % 1.0
+        return x
+
+    def process(self,data):
+        # One frame's int16 I/Q samples in, the decimated complex samples out.
+        x = np.frombuffer(data, dtype='<i2').astype(np.float32).view(np.complex64)
+        if self.offset:
+            x = self.mix(x)
+        if self.decimation == 1:
+            return x
+        x = np.concatenate((self.history, x))
+        ntaps = len(self.taps)
+        windows = sliding_window_view(x, ntaps)[self.skip::self.decimation]
+        y = windows @ self.reversed
+        # where the next output's window starts, counted from the samples
+        # that will be the history next time
+        self.skip = self.skip + len(windows) * self.decimation - (len(x) - ntaps + 1)
+        self.history = x[len(x) - ntaps + 1:]
+        return y
+
+    def feed(self,data):
+        # Complete 8192 byte output frames.
+        y = self.process(data)
+        iq = np.empty(2 * len(y), np.float32)
+        iq[0::2] = y.real
+        iq[1::2] = y.imag
+        out = np.clip(np.rint(iq), -fullScale, fullScale).astype('<i2').tobytes()
+        frames = []
+        k = 0
+        while k < len(out):
+            m = min(len(out) - k, frameBytes - self.filled)
+            self.out[self.filled:self.filled+m] = out[k:k+m]
+            self.filled = self.filled + m
+            k = k + m
+            if self.filled == frameBytes:
+                frames.append(self.out)
+                self.out = bytearray(frameBytes)
+                self.filled = 0
+                self.frames = self.frames + 1
+        return frames
@@ -0,0 +1,88 @@
+# Loading an AD6620 program into the radio (Listener.SetDSP).
+#
+# A cold SDR-IQ has to be sent its whole DSP program, some 270 nine-byte
+# register writes, each acked by the radio with 03 60 00.  Written and acked
+# one at a time that is a USB round trip per register, and every short ack
+# sits in the FTDI chip until its latency timer runs out.
+#
+# DSPProgrammer sends the program in a few bulk writes of `batch` registers
+# instead and then counts the acks for the whole batch.  A NAK, a missing
+# ack or a timeout and it starts again from the top one register at a time,
+# waiting for each ack, which is slow but tells exactly where it went wrong.
+
+from time import perf_counter, sleep
+
+from framer import frameLength
+
+
+dataItemAck = b'\x03\x60\x00'
+nak = b'\x02\x00'
+
+
+class DSPProgrammer:
+    def __init__(self,radio,output=print,batch=64,timeout=1.0):
+        self.radio   = radio
+        self.print   = output
+        self.batch   = batch
+        self.timeout = timeout          # for the acks to one write
+        self.pending = b''
+        self.mode    = None             # how the last program went in
+        self.writes  = 0
+        self.seconds = 0.0
+
+    def program(self,commands):
+        # True once every register write has been acked.
+        t = perf_counter()
+        self.writes = 0
+        ok = self.batch > 1 and self.load(commands, self.batch)
+        self.mode = 'bulk'
+        if not ok:
+            if self.batch > 1:
+                self.print('bulk DSP load failed, loading one register at a time')
+            self.radio.flush()
+            self.pending = b''
+            ok = self.load(commands, 1)
+            self.mode = 'single'
+        self.seconds = perf_counter() - t
+        return ok
+
+    def load(self,commands,batch):
+        for k in range(0, len(commands), batch):
+            group = commands[k:k+batch]
+            self.radio.write(b''.join(group))
+            self.writes = self.writes + 1
+            acks, problem = self.acks(len(group))
+            if problem:
+                self.print(f'DSP load: {problem} after {k + acks} of {len(commands)} registers')
+                return False
+        return True
+
+    def acks(self,expected):
+        # Read until `expected` acks have come back.  Returns how many did,
+        # and what went wrong if not all of them.
+        got = 0
+        deadline = perf_counter() + self.timeout
+        buf = self.pending
+        while got < expected:
+            while len(buf) >= 2:
+                n = frameLength(buf[0], buf[1])
+                if len(buf) < n:
+                    break
+                msg, buf = buf[:n], buf[n:]
+                if msg == dataItemAck:
+                    got = got + 1
+                elif msg == nak:
+                    self.pending = buf
+                    return got, 'NAK'
+            if got == expected:
+                break
+            data = self.radio.read(256)
+            if data:
+                buf = buf + data
+            elif perf_counter() > deadline:
+                self.pending = buf
+                return got, 'timeout'
+            else:
+                sleep(0.0005)
+        self.pending = buf
+        return got, None
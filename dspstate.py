@@ -0,0 +1,189 @@
+# What each radio was last told, kept on disk (server.py -D).
+#
+# The AD6620 keeps its program until the radio loses power, and a cold boot
+# shows as the 680000 Hz power-on frequency.  So when the radio is warm,
+# the program in it is whatever was last loaded, and if we know what that
+# was there is no need to load it again.  DSPState remembers, per serial
+# number, the last program (its registers and a SHA-256 of them) and the
+# frequency and gains, so that:
+#
+#   - a cold boot restores that program and those settings instead of the
+#     stock 190 kHz one;
+#   - a client loading a bandwidth gets acks straight from the server while
+#     it sends the registers, and the program only goes to the radio, in one
+#     bulk write, if it differs from the one already there.  Clients that
+#     load the same program on every connect no longer cost a reload.
+#
+# A program is the register writes from a soft reset (mode register 0x300,
+# bit 0 set) to the write that takes the chip out of reset again.  Register
+# writes outside a program go to the radio as they are, and after one of
+# those we no longer know what the radio holds.
+#
+# The IQ rate is the program's (sdrcmds.programRate), so DSPState is also
+# where the server learns it: rate is that of the program in the radio, or
+# None while that isn't known.
+#
+# Frequency and gain replies come in on the thread that hands IQ to the
+# clients, so observe() only notes them; a thread of our own (start())
+# writes the file every saveEvery seconds, so a slow disk never holds up
+# the stream.
+
+import hashlib
+import json
+import os
+from threading import Lock, Thread
+from time import monotonic
+
+from sdrcmds import programRate
+
+
+dataItemAck = b'\x03\x60\x00'
+nak = b'\x02\x00'
+modeRegister = b'\x00\x03'
+maxProgram = 1024                   # registers, before we give up holding on
+
+
+def programHash(commands):
+    return hashlib.sha256(b''.join(commands)).hexdigest()
+
+
+class DSPState:
+    def __init__(self,path,output=print,saveEvery=5.0):
+        self.path       = path
+        self.print      = output
+        self.saveEvery  = saveEvery
+        self.records    = {}
+        self.serial     = None
+        self.active     = None      # hash of the program in the radio, if known
+        self.rate       = None      # and its IQ rate, S/s
+        self.collecting = None      # the registers of a program on its way in
+        self.acks       = 0         # acks still to come for our bulk writes
+        self.lock       = Lock()    # acks are counted down on the capture thread
+        self.reloads    = 0         # programs sent to the radio
+        self.skipped    = 0         # and ones it already had
+        self.naks       = 0
+        self.dirty      = False
+        self.saved      = 0.0
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.records = json.load(f)
+            except (OSError, ValueError) as err:
+                self.print(f'ignoring {path}: {err}')
+
+    def select(self,serial,warm):
+        # The radio is serial; warm if it kept its program since last time.
+        self.serial = serial
+        record = self.record()
+        self.active = record.get('program') if warm else None
+        program = self.program() if self.active else None
+        self.rate = programRate(program) if program else None
+        return record
+
+    def record(self):
+        return self.records.setdefault(self.serial or '', {})
+
+    def program(self):
+        # the registers of the last program loaded, or None
+        registers = self.record().get('registers')
+        return [bytes.fromhex(r) for r in registers] if registers else None
+
+    def loaded(self,commands):
+        record = self.record()
+        with self.lock:
+            record['program'] = self.active = programHash(commands)
+            record['registers'] = [c.hex() for c in commands]
+        self.rate = programRate(commands)
+        self.save(True)
+
+    def start(self,makeItStop):
+        # Save whatever observe() has noted, every saveEvery, until told to stop.
+        def run():
+            while not makeItStop.wait(self.saveEvery):
+                self.save()
+        Thread(target=run,daemon=True).start()
+
+    def save(self,force=False):
+        if not self.path or self.serial is None:
+            return
+        if not force and (not self.dirty or monotonic() - self.saved < self.saveEvery):
+            return
+        with self.lock:
+            text = json.dumps(self.records, indent=1)
+            self.dirty = False
+        temp = f'{self.path}.{os.getpid()}.new'
+        try:
+            with open(temp, 'w') as f:
+                f.write(text)
+            os.replace(temp, self.path)
+        except OSError as err:
+            self.print(f'could not save {self.path}: {err}')
+        self.saved = monotonic()
+
+    def fromClient(self,msg):
+        # An AD6620 register write from the radio's owner.  Returns
+        # (handled, toRadio): handled means the client should get its ack
+        # from us; toRadio is what to write to the radio instead, if anything.
+        register = msg[2:4]
+        reset = len(msg) > 4 and msg[4] & 1
+        if self.collecting is None:
+            if register == modeRegister and reset:
+                self.collecting = [bytes(msg)]
+                return True, None
+            self.active = self.rate = None
+            return False, msg
+        self.collecting.append(bytes(msg))
+        if register == modeRegister and not reset:
+            commands, self.collecting = self.collecting, None
+            if programHash(commands) == self.active:
+                self.skipped = self.skipped + 1
+                self.print('DSP program already loaded')
+                return True, None
+            self.reloads = self.reloads + 1
+            with self.lock:
+                self.acks = self.acks + len(commands)
+            self.loaded(commands)
+            return True, b''.join(commands)
+        if len(self.collecting) >= maxProgram:
+            # not a program after all; let it all through
+            commands, self.collecting = self.collecting, None
+            self.active = self.rate = None
+            with self.lock:
+                self.acks = self.acks + len(commands)
+            return True, b''.join(commands)
+        return True, None
+
+    def fromRadio(self,msg):
+        # True for the radio's acks to our own bulk writes, which nobody
+        # is waiting for.
+        if not self.acks:
+            return False
+        if msg == dataItemAck:
+            with self.lock:
+                self.acks = self.acks - 1
+            return True
+        if msg[0:2] == nak:
+            self.naks = self.naks + 1
+            with self.lock:
+                self.acks = self.acks - 1
+            self.active = self.rate = None
+            self.print('radio refused a DSP register; the program may be incomplete')
+            return True
+        return False
+
+    def observe(self,msg):
+        # Frequency and gain replies, to restore after a cold boot.
+        item = bytes(msg[2:4])
+        if item == b'\x20\x00' and len(msg) >= 10:
+            key, value = 'frequency', int.from_bytes(msg[5:10], 'little')
+        elif item == b'\x38\x00' and len(msg) >= 6:
+            key, value = 'rfGain', msg[5]
+        elif item == b'\x40\x00' and len(msg) >= 6:
+            key, value = 'ifGain', msg[5]
+        else:
+            return
+        record = self.record()
+        if record.get(key) != value:
+            with self.lock:
+                record[key] = value
+                self.dirty = True
@@ -0,0 +1,237 @@
+# Zero-copy message framing for the SDR-IQ byte stream.
+#
+# Every SDR-IQ message starts with a 16-bit little-endian header.  The lower
+# 13 bits are the total message length (header included) and the upper 3 bits
+# are the message type.  A data item message with a zero length is the special
+# case used for IQ samples: 2 header bytes plus 8192 data bytes, which shows
+# up on the wire as 00 80.
+#
+# FrameReader reads into one preallocated bytearray and hands out memoryview
+# slices of it, so a frame is never copied after it lands in the buffer.  A
+# view is only good until the next call to read(); anything that has to keep
+# the bytes around longer must copy them itself.
+#
+# One byte lost or garbled on USB and every length after it is garbage.  So
+# for the radio's stream FrameReader can check each header (resync=True):
+# an IQ header, a NAK, or a short control message of a type the radio
+# sends.  Anything else and the framing is lost.  It then looks through the
+# buffer for 00 80 followed one IQ frame later by another plausible header,
+# skips to it and carries on, normally within a frame or two.  The frames
+# around the fault may be corrupt; everything after it is not.  While the
+# radio isn't streaming there are no IQ headers to find, so the framing
+# only comes back with the next IQ frame.
+
+from ctypes import byref, c_char
+from time import perf_counter
+
+import numpy as np
+
+
+iqFrameHeader = b'\x00\x80'
+iqFrameLength = 8194
+maxFrameLength = iqFrameLength
+maxControlLength = 128              # longer than any control message the radio sends
+
+
+def frameLength(b0, b1):
+    length = b0 + (b1 & 0x1F) * 256
+    if length == 0 and b1 & 0x80:
+        # data item with a zero length field means 8192 data bytes
+        return iqFrameLength
+    # lengths below 2 can't be real messages; consume the header so we
+    # don't spin on it
+    return max(length, 2)
+
+
+def plausible(b0, b1):
+    # Could a message from the radio start with these two bytes?
+    if b1 == 0x80:
+        return b0 == 0
+    if b1 >> 5 > 3:
+        # the radio sends IQ data, replies, unsolicited items, ranges and acks
+        return False
+    length = b0 + (b1 & 0x1F) * 256
+    if length == 2:
+        return b1 == 0          # NAK
+    return 3 <= length <= maxControlLength
+
+
+def readIntoFrom(read):
+    # Adapt a read(n) -> bytes source to readinto(view) -> n.  This costs
+    # one copy per read; sources that can fill a buffer directly should be
+    # handed to FrameReader as is.
+    def readinto(view):
+        data = read(len(view))
+        n = len(data)
+        view[:n] = data
+        return n
+    return readinto
+
+
+def ftdiReadInto(device):
+    # Let libftdi write straight into our buffer instead of going through
+    # Device.read, which allocates a ctypes buffer and a bytes object per
+    # call.  Devices that don't look like a pylibftdi Device (no fdll/ctx)
+    # use their own readinto, or fall back to the copying adapter.
+    if hasattr(device, 'readinto'):
+        return device.readinto
+    fdll = getattr(device, 'fdll', None)
+    if fdll is None or not hasattr(device, 'ctx'):
+        return readIntoFrom(device.read)
+    read = fdll.ftdi_read_data
+    ctx = byref(device.ctx)
+
+    def readinto(view):
+        n = len(view)
+        buf = (c_char * n).from_buffer(view)
+        rlen = read(ctx, buf, n)
+        if rlen < 0:
+            raise IOError(device.get_error_string())
+        return rlen
+    return readinto
+
+
+def ftdiTune(device, latency=None, chunk=None):
+    # Set the FTDI chip's latency timer (ms: how long it holds on to less
+    # than a USB packet) and libftdi's transfer size for reads and writes.
+    # A SimRadio takes the same settings through its tune().
+    fn = getattr(device, 'ftdi_fn', None)
+    if fn is None:
+        device.tune(latency, chunk)
+        return
+    if latency is not None and fn.ftdi_set_latency_timer(latency) < 0:
+        raise IOError(device.get_error_string())
+    if chunk and (fn.ftdi_read_data_set_chunksize(chunk) < 0 or
+                  fn.ftdi_write_data_set_chunksize(chunk) < 0):
+        raise IOError(device.get_error_string())
+
+
+class FrameReader:
+    def __init__(self, readinto, size=8 * maxFrameLength, resync=False, most=None):
+        self.readinto = readinto
+        self.resync = resync
+        self.size = max(size, 2 * maxFrameLength)
+        self.most = most or self.size   # bytes asked for per read, at most
+        self.buffer = bytearray(self.size)
+        self.view = memoryview(self.buffer)
+        self.start = 0
+        self.end = 0
+        self.reads = 0
+        self.bytes = 0
+        self.errors = 0             # headers with impossible lengths
+        self.lostAt = None          # when the framing was lost, while it is
+        self.desyncs = 0
+        self.skipped = 0            # bytes thrown away finding it again
+        self.recoveryTime = 0.0     # seconds without framing, all told
+        self.lastRecovery = None
+
+    def reset(self, readinto):
+        # Start again from nothing on a new source, keeping the counts.
+        self.readinto = readinto
+        self.start = self.end = 0
+        self.lostAt = None
+
+    def pending(self):
+        return self.end - self.start
+
+    def frame(self):
+        # Return the next complete frame already in the buffer, or None.
+        # An IQ header, nearly every message there is, is checked first.
+        start = self.start
+        if self.end - start < 2:
+            return None
+        buf = self.buffer
+        if buf[start + 1] == 0x80 and buf[start] == 0 and self.lostAt is None:
+            length = iqFrameLength
+        else:
+            if self.resync and (self.lostAt is not None or not plausible(buf[start], buf[start + 1])):
+                if not self.findFraming():
+                    return None
+                start = self.start
+            length = frameLength(buf[start], buf[start + 1])
+            if length == 2 and buf[start] != 2:
+                self.errors = self.errors + 1
+        if self.end - start < length:
+            return None
+        self.start = start + length
+        return self.view[start:self.start]
+
+    def findFraming(self):
+        # Skip to the first 00 80 with a plausible header one IQ frame on.
+        # False if there isn't one yet, keeping what might still turn out
+        # to be one.
+        if self.lostAt is None:
+            self.lostAt = perf_counter()
+            self.desyncs = self.desyncs + 1
+            # a frame a byte short took the start of this header with it
+            back = min(self.start, 2)
+            self.start = self.start - back
+        start, end = self.start, self.end
+        data = np.frombuffer(self.buffer, dtype=np.uint8, count=end - start, offset=start)
+        hits = np.flatnonzero((data[:-1] == 0) & (data[1:] == 0x80)) + start
+        del data
+        keep = end - 1              # the last byte may be the 00 of a header
+        for p in hits.tolist():
+            q = p + iqFrameLength
+            if q + 2 > end:
+                keep = p            # can't tell yet
+                break
+            if plausible(self.buffer[q], self.buffer[q + 1]):
+                self.skip(p)
+                took = perf_counter() - self.lostAt
+                self.lostAt = None
+                self.recoveryTime = self.recoveryTime + took
+                self.lastRecovery = took
+                return True
+        self.skip(keep)
+        return False
+
+    def skip(self, to):
+        self.skipped = self.skipped + to - self.start
+        self.start = to
+
+    def need(self):
+        # Bytes still missing before frame() can return something.
+        if self.lostAt is not None:
+            return 1
+        start = self.start
+        if self.end - start < 2:
+            return 2 - (self.end - start)
+        return frameLength(self.buffer[start], self.buffer[start + 1]) - (self.end - start)
+
+    def fill(self):
+        # One call to the source.  Makes room first: an empty buffer is just
+        # rewound, otherwise the partial frame at the tail is moved to the
+        # front once there is no longer space for a whole frame behind it.
+        if self.start == self.end:
+            self.start = self.end = 0
+        elif self.size - self.end < maxFrameLength:
+            pending = self.end - self.start
+            self.buffer[:pending] = self.view[self.start:self.end]
+            self.start = 0
+            self.end = pending
+        n = self.readinto(self.view[self.end:min(self.size, self.end + self.most)])
+        self.reads = self.reads + 1
+        if n:
+            self.end = self.end + n
+            self.bytes = self.bytes + n
+        return n
+
+    def read(self):
+        # Same contract as readMsg: a complete message, or an empty result
+        # when the source has nothing more to give right now.  Unlike readMsg
+        # a partial message is kept for the next call instead of spinning.
+        frame = self.frame()
+        if frame is not None:
+            return frame
+        need = self.need()
+        while True:
+            n = self.fill()
+            if not n:
+                return b''
+            need = need - n
+            if need <= 0:
+                frame = self.frame()
+                if frame is not None:
+                    return frame
+                need = self.need()
@@ -0,0 +1,83 @@
+# Per-frame IQ metering.
+#
+# An IQ frame is 8192 bytes of little-endian int16 samples, I and Q
+# interleaved, so 2048 complex samples.  IQMeter works on the whole frame at
+# once with numpy instead of unpacking samples one at a time, which is cheap
+# enough to leave running on the live stream (~96 frames/s at 196 kS/s).
+#
+# Each frame's figures go into a small preallocated ring so averages over the
+# last N frames can be read at any time from another thread.
+
+import math
+import numpy as np
+
+
+fullScale = 32768.0
+
+# columns of the per-frame ring
+POWER, PEAK, DCI, DCQ, CLIPS = range(5)
+
+
+def dBFS(power):
+    if power <= 0.0:
+        return -math.inf
+    return 10.0 * math.log10(power / (fullScale * fullScale))
+
+
+class IQMeter:
+    def __init__(self, windows=(10, 100, 1000), clipLevel=32767):
+        self.windows = tuple(sorted(windows))
+        self.clipLevel = clipLevel
+        self.ring = np.zeros((self.windows[-1], 5))
+        self.frames = 0
+        self.last = None
+
+    def update(self, data):
+        # data is the 8192 byte payload of an IQ frame (header stripped)
+        x = np.frombuffer(data, dtype='<i2').astype(np.float64)
+        n = len(x) // 2
+        if n == 0:
+            return
+        row = self.ring[self.frames % len(self.ring)]
+        row[POWER] = np.dot(x, x) / n
+        row[PEAK]  = max(x.max(), -x.min())
+        row[DCI]   = x[0::2].sum() / n
+        row[DCQ]   = x[1::2].sum() / n
+        row[CLIPS] = np.count_nonzero(np.abs(x) >= self.clipLevel)
+        self.frames = self.frames + 1
+        self.last = self.stats(row[None, :])
+
+    def stats(self, rows):
+        power = float(rows[:, POWER].mean())
+        return {
+            'power'  : power,
+            'dBFS'   : dBFS(power),
+            'peak'   : float(rows[:, PEAK].max()),
+            'dcI'    : float(rows[:, DCI].mean()),
+            'dcQ'    : float(rows[:, DCQ].mean()),
+            'clips'  : int(rows[:, CLIPS].sum())
+        }
+
+    def window(self, frames):
+        # Figures over the most recent `frames` frames (or fewer at start up).
+        count = min(frames, self.frames, len(self.ring))
+        if count == 0:
+            return None
+        end = self.frames % len(self.ring)
+        idx = np.arange(end - count, end) % len(self.ring)
+        return self.stats(self.ring[idx])
+
+    def snapshot(self):
+        snap = {'frames': self.frames, 'last': self.last}
+        for w in self.windows:
+            snap[w] = self.window(w)
+        return snap
+
+    def report(self):
+        parts = [f'frames {self.frames}']
+        for w in self.windows:
+            s = self.window(w)
+            if s:
+                parts.append(f'[{w}] {s["dBFS"]:6.1f} dBFS peak {s["peak"]:5.0f}'
+                             f' dc {s["dcI"]:+6.1f},{s["dcQ"]:+6.1f} clips {s["clips"]}')
+        return ' '.join(parts)
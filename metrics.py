@@ -0,0 +1,113 @@
+# Runtime metrics in the Prometheus text format (server.py -p <port>).
+#
+# Most figures are counters the pipeline keeps anyway (ring.head,
+# sender.datagrams, ...).  They are registered here as functions and only
+# read when someone scrapes, so keeping them costs nothing on the hot path.
+# The one thing recorded as it happens is latency, in a fixed-bucket
+# Histogram: a bisect and two adds per observation.
+#
+#   curl http://localhost:<port>/metrics
+
+from bisect import bisect_left
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from threading import Thread
+
+
+latencyBuckets = (0.0001, 0.0002, 0.0005, 0.001, 0.002, 0.005,
+                  0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0)
+
+
+class Histogram:
+    def __init__(self,buckets=latencyBuckets):
+        self.buckets = tuple(buckets)
+        self.counts  = [0] * (len(self.buckets) + 1)
+        self.sum     = 0.0
+
+    def observe(self,value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum = self.sum + value
+
+    def count(self):
+        return sum(self.counts)
+
+    def lines(self,name,labels):
+        out = []
+        total = 0
+        sep = ',' if labels else ''
+        for le, n in zip(self.buckets + ('+Inf',), self.counts):
+            total = total + n
+            out.append(f'{name}_bucket{{{labels}{sep}le="{le}"}} {total}')
+        tag = f'{{{labels}}}' if labels else ''
+        out.append(f'{name}_sum{tag} {self.sum}')
+        out.append(f'{name}_count{tag} {total}')
+        return out
+
+
+class Metrics:
+    def __init__(self):
+        self.families = {}          # name -> (type, text, [(labels, source)])
+
+    def add(self,name,kind,text,source,labels=''):
+        family = self.families.setdefault(name, (kind, text, []))
+        family[2].append((labels, source))
+        return source
+
+    def counter(self,name,text,fn,labels=''):
+        return self.add(name, 'counter', text, fn, labels)
+
+    def gauge(self,name,text,fn,labels=''):
+        return self.add(name, 'gauge', text, fn, labels)
+
+    def histogram(self,name,text,labels='',buckets=latencyBuckets):
+        return self.add(name, 'histogram', text, Histogram(buckets), labels)
+
+    def render(self):
+        out = []
+        for name, (kind, text, series) in self.families.items():
+            out.append(f'# HELP {name} {text}')
+            out.append(f'# TYPE {name} {kind}')
+            for labels, source in series:
+                if kind == 'histogram':
+                    out.extend(source.lines(name, labels))
+                    continue
+                try:
+                    value = source()
+                except Exception:
+                    continue
+                if value is None:
+                    continue
+                tag = f'{{{labels}}}' if labels else ''
+                out.append(f'{name}{tag} {value}')
+        return '\n'.join(out) + '\n'
+
+
+class MetricsServer(Thread):
+    def __init__(self,metrics,port,host='127.0.0.1'):
+        super(MetricsServer,self).__init__()
+        self.metrics = metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                if handler.path not in ('/', '/metrics'):
+                    handler.send_error(404)
+                    return
+                body = metrics.render().encode()
+                handler.send_response(200)
+                handler.send_header('Content-Type', 'text/plain; version=0.0.4')
+                handler.send_header('Content-Length', str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler,*args):
+                return
+
+        self.http   = HTTPServer((host, port), Handler)
+        self.port   = self.http.server_address[1]
+        self.daemon = True
+
+    def run(self):
+        self.http.serve_forever()
+
+    def stop(self):
+        self.http.shutdown()
+        self.http.server_close()
@@ -0,0 +1,74 @@
+# Serving a recording in place of the radio (server.py -f).
+#
+# Playback is a SimRadio whose IQ comes from a file: the raw int16 samples
+# of a recording such as recorder.py makes, with its .sigmf-meta if there is
+# one for the sample rate and frequency.  The file is memory-mapped and each
+# frame is a slice of the mapping, so samples go from the page cache into
+# the capture buffer the way they would from USB, with nothing in between.
+#
+# It plays at the recording's own rate, or `speed` times that, or with speed
+# 0 as fast as the server takes it.  Control queries get SimRadio's answers.
+
+import json
+import os
+from mmap import mmap, ACCESS_READ
+from struct import pack
+
+from simradio import SimRadio
+from framer import iqFrameLength
+
+
+frameBytes = iqFrameLength - 2
+
+
+def recordingPaths(path):
+    # the data and metadata files for whichever one was named
+    for suffix in ('.sigmf-data', '.sigmf-meta'):
+        if path.endswith(suffix):
+            path = path[:-len(suffix)]
+    if os.path.exists(path + '.sigmf-data'):
+        return path + '.sigmf-data', path + '.sigmf-meta'
+    return path, None
+
+
+class Playback(SimRadio):
+    lossless = True                 # capture waits rather than drop frames
+
+    def __init__(self,path,speed=1.0,loop=False,chunk=4096):
+        data, metaPath = recordingPaths(path)
+        meta = {}
+        if metaPath and os.path.exists(metaPath):
+            with open(metaPath) as f:
+                meta = json.load(f)
+        self.file  = open(data, 'rb')
+        self.map   = mmap(self.file.fileno(), 0, access=ACCESS_READ)
+        self.data  = memoryview(self.map)
+        self.count = len(self.data) // frameBytes
+        if self.count == 0:
+            raise ValueError(f'{data} holds less than one IQ frame')
+        rate = meta.get('global', {}).get('core:sample_rate', 196078)
+        super(Playback,self).__init__(rate, None if loop else self.count, chunk)
+        self.speed = speed
+        self.path  = data
+        captures = meta.get('captures') or [{}]
+        self.freq  = captures[0].get('core:frequency', 0)
+
+    def frameRate(self):
+        return max(self.sampleRate, 1) / 2048.0 * (self.speed or 1.0)
+
+    def available(self):
+        if self.running and not self.speed:
+            # as fast as it's read, a few frames at a time
+            limit = self.pos + 16 * iqFrameLength
+            if self.frames is not None:
+                limit = min(limit, self.frames * iqFrameLength)
+            return max(limit, self.pos)
+        return super(Playback,self).available()
+
+    def frameAt(self,k,off):
+        k = k % self.count
+        return self.data[k*frameBytes:(k+1)*frameBytes]
+
+    def item00B0(self,value,args):
+        # the recording's rate is the rate
+        return b'\x00' + pack('<I', int(self.sampleRate))
@@ -0,0 +1,237 @@
+# Recording the IQ stream to disk as SigMF captures (server.py -w).
+#
+# Each recording is a pair of files: <name>.sigmf-data, the raw samples as
+# they come from the radio (little-endian int16, I then Q, i.e. ci16_le),
+# and <name>.sigmf-meta, JSON with the sample rate, start time, and a capture
+# segment for every change of frequency or gain seen in the radio's control
+# replies.  The sample rate is that of the AD6620 program in the radio, as
+# the server's DSPState knows it (the server's guess until it does); SigMF
+# has one rate per file, so loading a program with another rate starts a
+# new file.  Clients stop the radio to load one, so the break falls in the
+# pause.
+#
+# The Recorder is one more consumer of the capture ring and only copies
+# frames into 1 MiB blocks taken from a fixed pool.  A second thread writes
+# full blocks out, whole and in order, to a file preallocated to the
+# rotation size.  If the disk stalls (SD cards do, for seconds at a time)
+# the pool runs dry and frames are dropped from the recording, and noted in
+# the metadata as annotations; neither the ring nor USB capture ever waits
+# for the disk.
+
+import json
+import os
+from datetime import datetime, timezone
+from queue import SimpleQueue
+from threading import Thread
+from time import perf_counter, time, monotonic
+
+
+frameBytes = 8192
+blockBytes = 128 * frameBytes       # 1 MiB, a whole number of frames
+
+
+def isoTime(t):
+    return datetime.fromtimestamp(t, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+class Recorder(Thread):
+    def __init__(self,listener,ring,directory,rotateBytes=1<<30,rotateSeconds=0,blocks=32):
+        super(Recorder,self).__init__()
+        self.makeItStop = listener.makeItStop
+        self.print      = listener.print
+        self.sampleRate = listener.sampleRate
+        self.dsp        = listener.dspState
+        self.frames     = ring.consumer()
+        self.directory  = directory
+        self.rotateBytes = max(rotateBytes // blockBytes, 1) * blockBytes
+        self.rotateSeconds = rotateSeconds
+        self.free       = SimpleQueue()
+        for k in range(blocks):
+            self.free.put(bytearray(blockBytes))
+        self.writer     = Thread(target=self.write,daemon=True)
+        self.work       = SimpleQueue()
+        self.block      = None
+        self.filled     = 0
+        self.path       = None      # the recording being written, less its suffix
+        self.state      = {}        # core:frequency and the gains, as last seen
+        self.meta       = None
+        self.fileBytes  = 0
+        self.opened     = 0.0
+        self.recorded   = 0         # frames
+        self.dropped    = 0
+        self.written    = 0         # bytes, by the writer
+        self.handed     = 0         # blocks given to the writer
+        self.done       = 0         # and written (or failed)
+        self.longestWrite = 0.0
+        self.files      = 0
+        self.daemon     = True
+
+    def waiting(self):
+        # blocks on their way to the disk
+        return self.handed - self.done
+
+    def run(self):
+        self.writer.start()
+        while not self.makeItStop.isSet():
+            frames = self.frames.take(32,0.1)
+            for msg, t in zip(frames, self.frames.times):
+                if msg[0:2] == b'\x00\x80':
+                    self.frame(msg[2:],t)
+                else:
+                    self.control(msg)
+        self.frames.ring.remove(self.frames)
+        self.finish()
+        self.work.put(None)
+        self.writer.join()
+
+    # the ring side: copy and hand on, never wait
+
+    def frame(self,data,t):
+        if len(data) != frameBytes:
+            return
+        rate = self.dsp.rate
+        if rate and rate != self.sampleRate:
+            self.sampleRate = rate
+            self.finish()
+        if self.path is None or self.fileBytes >= self.rotateBytes or \
+           (self.rotateSeconds and monotonic() - self.opened >= self.rotateSeconds):
+            self.finish()
+            self.begin(t)
+        if self.block is None:
+            self.block = self.nextBlock()
+            if self.block is None:
+                self.drop()
+                return
+        self.block[self.filled:self.filled+frameBytes] = data
+        self.filled = self.filled + frameBytes
+        self.fileBytes = self.fileBytes + frameBytes
+        self.recorded = self.recorded + 1
+        if self.filled == blockBytes:
+            self.handOn()
+
+    def nextBlock(self):
+        if self.free.empty():
+            return None
+        self.filled = 0
+        return self.free.get()
+
+    def drop(self):
+        # Frames missing from the file: note where, once per gap.
+        self.dropped = self.dropped + 1
+        notes = self.meta['annotations']
+        start = self.fileBytes // 4
+        if notes and notes[-1]['core:sample_start'] == start:
+            notes[-1]['sdriq:dropped_frames'] += 1
+        else:
+            notes.append({'core:sample_start': start, 'core:sample_count': 0,
+                          'core:comment': 'frames dropped here, writes fell behind',
+                          'sdriq:dropped_frames': 1})
+
+    def handOn(self):
+        if self.block is not None and self.filled:
+            self.handed = self.handed + 1
+            self.work.put(('data', self.block, self.filled))
+        elif self.block is not None:
+            self.free.put(self.block)
+        self.block = None
+        self.filled = 0
+
+    def begin(self,t):
+        # t is the perf_counter time the first frame was captured
+        wall = time() - (perf_counter() - t)
+        stamp = datetime.fromtimestamp(wall, timezone.utc).strftime('%Y%m%dT%H%M%S')
+        self.path = os.path.join(self.directory, f'sdriq-{stamp}-{self.files:04d}')
+        self.files = self.files + 1
+        self.fileBytes = 0
+        self.opened = monotonic()
+        self.meta = {
+            'global': {
+                'core:datatype'   : 'ci16_le',
+                'core:sample_rate': self.sampleRate,
+                'core:version'    : '1.0.0',
+                'core:hw'         : 'RFSpace SDR-IQ',
+                'core:recorder'   : 'sdriq server.py'
+            },
+            'captures': [dict(self.state, **{'core:sample_start': 0, 'core:datetime': isoTime(wall)})],
+            'annotations': []
+        }
+        self.work.put(('open', self.path + '.sigmf-data', self.rotateBytes))
+        self.print(f'recording to {self.path}')
+
+    def finish(self):
+        if self.path is None:
+            return
+        self.handOn()
+        self.work.put(('close', self.path, self.meta))
+        self.path = None
+
+    def control(self,msg):
+        # Replies carrying the tuning or a gain start a new capture segment.
+        item = bytes(msg[2:4])
+        if item == b'\x20\x00' and len(msg) >= 10:
+            change = {'core:frequency': int.from_bytes(msg[5:10], 'little')}
+        elif item == b'\x38\x00' and len(msg) >= 6:
+            change = {'sdriq:rf_gain': int.from_bytes(msg[5:6], 'little', signed=True)}
+        elif item == b'\x40\x00' and len(msg) >= 6:
+            change = {'sdriq:if_gain': msg[5]}
+        else:
+            return
+        if all(self.state.get(k) == v for k, v in change.items()):
+            return
+        self.state.update(change)
+        if self.path is None:
+            return
+        captures = self.meta['captures']
+        start = self.fileBytes // 4
+        segment = dict(self.state, **{'core:sample_start': start})
+        if captures[-1]['core:sample_start'] == start:
+            segment = dict(captures.pop(), **segment)
+        captures.append(segment)
+
+    # the disk side
+
+    def write(self):
+        fd = None
+        size = 0
+        while True:
+            job = self.work.get()
+            if job is None:
+                break
+            if job[0] == 'open':
+                size = 0
+                try:
+                    fd = os.open(job[1], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                except OSError as err:
+                    self.print(f'recording not started: {err}')
+                    continue
+                if hasattr(os, 'posix_fallocate'):
+                    try:
+                        os.posix_fallocate(fd, 0, job[2])
+                    except OSError:
+                        pass
+            elif job[0] == 'data':
+                block, n = job[1], job[2]
+                t = perf_counter()
+                try:
+                    if fd is not None:
+                        os.write(fd, memoryview(block)[:n])
+                        size = size + n
+                        self.written = self.written + n
+                except OSError as err:
+                    self.print(f'recording write failed: {err}')
+                self.longestWrite = max(self.longestWrite, perf_counter() - t)
+                self.done = self.done + 1
+                self.free.put(block)
+            elif job[0] == 'close':
+                name, meta = job[1], job[2]
+                if fd is None:
+                    continue
+                try:
+                    os.ftruncate(fd, size)
+                    os.close(fd)
+                    with open(name + '.sigmf-meta', 'w') as f:
+                        json.dump(meta, f, indent=2)
+                    self.print(f'recorded {size // 4} samples to {name}')
+                except OSError as err:
+                    self.print(f'recording not finished: {err}')
+                fd = None
@@ -1,3 +1,66 @@
+# SDR-IQ commands as the bytes that go down the USB link.
+#
+# The AD6620 programs, one per bandwidth, are kept as their register values
+# and filter coefficients, written out as text, and only turned into the
+# 267 nine-byte 09 A0 register writes the first time one is used.  The
+# result replaces the AD6620Program on the class, so after that
+# SdrIQByteCommands.BWKHZ_190 is a plain tuple of bytes as it always was.
+
+from struct import pack
+
+
+# Every program writes the same registers in the same order: the mode
+# register (0x300) with the chip held in soft reset, the NCO control and the
+# CIC2/CIC5/RCF set-up registers (0x301, 0x305-0x30C), the 256 RCF filter
+# coefficients (0x000-0x0FF), and the mode register again to let it run.
+controlRegisters = (0x300, 0x301) + tuple(range(0x305, 0x30D))
+coefficientRegisters = tuple(range(0x100))
+releaseMode = 8
+
+# The IQ rate is the A/D clock (item 0x00B0, nominally 66.67 MHz and only
+# ever changed to calibrate it) over the decimation of the three stages,
+# whose registers (0x306, 0x308, 0x30A) hold it less one.  The 190 kHz
+# program decimates by 10 * 17 * 2 for 196078 S/s.
+adClock = 66666667
+decimationRegisters = (0x306, 0x308, 0x30A)
+
+
+def programRate(commands):
+    # The IQ output rate, S/s, of the AD6620 program in these register
+    # writes, or None if they don't set all the decimations.
+    values = {}
+    for c in commands:
+        if len(c) >= 8 and c[1] == 0xA0:
+            values[c[2] + (c[3] << 8)] = int.from_bytes(c[4:8], 'little')
+    decimation = 1
+    for register in decimationRegisters:
+        if register not in values:
+            return None
+        decimation = decimation * (values[register] + 1)
+    return int(round(adClock / decimation))
+
+
+class AD6620Program:
+    def __init__(self,control,coefficients):
+        self.control = control
+        self.coefficients = coefficients
+
+    def __set_name__(self,owner,name):
+        self.name = name
+
+    def __get__(self,obj,owner):
+        commands = self.commands()
+        setattr(owner, self.name, commands)
+        return commands
+
+    def commands(self):
+        values = [int(v) for v in self.control.split()]
+        writes = list(zip(controlRegisters, values))
+        writes += zip(coefficientRegisters, [int(v) for v in self.coefficients.split()])
+        writes.append((0x300, releaseMode))
+        return tuple(pack('<BBHiB', 0x09, 0xA0, register, value, 0) for register, value in writes)
+
+
 class SdrIQByteCommands:
     ValidHeader = {
         b'\x04\x20' : True,
@@ -27,1885 +90,184 @@ class SdrIQByteCommands:
     GetIFGain        = b'\x05\x20\x40\x00\x00'
     SetSampleRate    = b'\x09\x00\xB0\x00\x00\x00\x00\x00\x00'
 
-    BWKHZ_5 = (
-        b'\x09\xA0\x00\x03\x09\x00\x00\x00\x00',
-        b'\x09\xA0\x01\x03\x06\x00\x00\x00\x00',
-        b'\x09\xA0\x05\x03\x06\x00\x00\x00\x00',
-        b'\x09\xA0\x06\x03\x0F\x00\x00\x00\x00',
-        b'\x09\xA0\x07\x03\x14\x00\x00\x00\x00',
-        b'\x09\xA0\x08\x03\x1F\x00\x00\x00\x00',
-        b'\x09\xA0\x09\x03\x04\x00\x00\x00\x00',
-        b'\x09\xA0\x0A\x03\x0F\x00\x00\x00\x00',
-        b'\x09\xA0\x0B\x03\x00\x00\x00\x00\x00',
-        b'\x09\xA0\x0C\x03\xFF\x00\x00\x00\x00',
-        b'\x09\xA0\x00\x00\xA0\x02\x00\x00\x00',
-        b'\x09\xA0\x01\x00\x0A\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x02\x00\xBA\x01\x00\x00\x00',
-        b'\x09\xA0\x03\x00\x18\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x04\x00\xE4\x00\x00\x00\x00',
-        b'\x09\xA0\x05\x00\x8B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x06\x00\x70\x00\x00\x00\x00',
-        b'\x09\xA0\x07\x00\xA7\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x08\x00\x20\x00\x00\x00\x00',
-        b'\x09\xA0\x09\x00\x99\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0A\x00\xDA\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0B\x00\x76\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0C\x00\x97\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0D\x00\x48\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0E\x00\x5A\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0F\x00\x1B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x10\x00\x27\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x11\x00\xF9\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x12\x00\x05\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x13\x00\xE8\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x14\x00\xFC\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x15\x00\xF2\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x16\x00\x12\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x17\x00\x1B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x18\x00\x49\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x19\x00\x65\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x1A\x00\xA1\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x1B\x00\xCE\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x1C\x00\x16\x00\x00\x00\x00',
-        b'\x09\xA0\x1D\x00\x50\x00\x00\x00\x00',
-        b'\x09\xA0\x1E\x00\x9F\x00\x00\x00\x00',
-        b'\x09\xA0\x1F\x00\xE0\x00\x00\x00\x00',
-        b'\x09\xA0\x20\x00\x2F\x01\x00\x00\x00',
-        b'\x09\xA0\x21\x00\x6F\x01\x00\x00\x00',
-        b'\x09\xA0\x22\x00\xB7\x01\x00\x00\x00',
-        b'\x09\xA0\x23\x00\xED\x01\x00\x00\x00',
-        b'\x09\xA0\x24\x00\x25\x02\x00\x00\x00',
-        b'\x09\xA0\x25\x00\x47\x02\x00\x00\x00',
-        b'\x09\xA0\x26\x00\x67\x02\x00\x00\x00',
-        b'\x09\xA0\x27\x00\x6E\x02\x00\x00\x00',
-        b'\x09\xA0\x28\x00\x6D\x02\x00\x00\x00',
-        b'\x09\xA0\x29\x00\x53\x02\x00\x00\x00',
-        b'\x09\xA0\x2A\x00\x2F\x02\x00\x00\x00',
-        b'\x09\xA0\x2B\x00\xF0\x01\x00\x00\x00',
-        b'\x09\xA0\x2C\x00\xA7\x01\x00\x00\x00',
-        b'\x09\xA0\x2D\x00\x45\x01\x00\x00\x00',
-        b'\x09\xA0\x2E\x00\xD9\x00\x00\x00\x00',
-        b'\x09\xA0\x2F\x00\x59\x00\x00\x00\x00',
-        b'\x09\xA0\x30\x00\xD2\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x31\x00\x3D\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x32\x00\xA8\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x33\x00\x0B\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x34\x00\x76\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x35\x00\xE2\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x36\x00\x5E\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x37\x00\xE4\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x38\x00\x83\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x39\x00\x36\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x3A\x00\x08\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x3B\x00\xF5\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x3C\x00\x08\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x3D\x00\x3A\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x3E\x00\x94\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x3F\x00\x0F\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x40\x00\xB1\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x41\x00\x72\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x42\x00\x54\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x43\x00\x4F\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x44\x00\x62\x00\x00\x00\x00',
-        b'\x09\xA0\x45\x00\x83\x01\x00\x00\x00',
-        b'\x09\xA0\x46\x00\xAF\x02\x00\x00\x00',
-        b'\x09\xA0\x47\x00\xDC\x03\x00\x00\x00',
-        b'\x09\xA0\x48\x00\x05\x05\x00\x00\x00',
-        b'\x09\xA0\x49\x00\x1D\x06\x00\x00\x00',
-        b'\x09\xA0\x4A\x00\x22\x07\x00\x00\x00',
-        b'\x09\xA0\x4B\x00\x05\x08\x00\x00\x00',
-        b'\x09\xA0\x4C\x00\xC4\x08\x00\x00\x00',
-        b'\x09\xA0\x4D\x00\x51\x09\x00\x00\x00',
-        b'\x09\xA0\x4E\x00\xAB\x09\x00\x00\x00',
-        b'\x09\xA0\x4F\x00\xC8\x09\x00\x00\x00',
-        b'\x09\xA0\x50\x00\xA5\x09\x00\x00\x00',
-        b'\x09\xA0\x51\x00\x3D\x09\x00\x00\x00',
-        b'\x09\xA0\x52\x00\x91\x08\x00\x00\x00',
-        b'\x09\xA0\x53\x00\x9C\x07\x00\x00\x00',
-        b'\x09\xA0\x54\x00\x64\x06\x00\x00\x00',
-        b'\x09\xA0\x55\x00\xE9\x04\x00\x00\x00',
-        b'\x09\xA0\x56\x00\x33\x03\x00\x00\x00',
-        b'\x09\xA0\x57\x00\x46\x01\x00\x00\x00',
-        b'\x09\xA0\x58\x00\x2E\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x59\x00\xF2\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x5A\x00\xA2\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x5B\x00\x49\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x5C\x00\xF7\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x5D\x00\xBB\xF3\xFF\xFF\x00',
-        b'\x09\xA0\x5E\x00\xA6\xF1\xFF\xFF\x00',
-        b'\x09\xA0\x5F\x00\xC7\xEF\xFF\xFF\x00',
-        b'\x09\xA0\x60\x00\x31\xEE\xFF\xFF\x00',
-        b'\x09\xA0\x61\x00\xF1\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x62\x00\x1A\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x63\x00\xB7\xEB\xFF\xFF\x00',
-        b'\x09\xA0\x64\x00\xD6\xEB\xFF\xFF\x00',
-        b'\x09\xA0\x65\x00\x81\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x66\x00\xC2\xED\xFF\xFF\x00',
-        b'\x09\xA0\x67\x00\x9E\xEF\xFF\xFF\x00',
-        b'\x09\xA0\x68\x00\x1A\xF2\xFF\xFF\x00',
-        b'\x09\xA0\x69\x00\x35\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x6A\x00\xEE\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x6B\x00\x40\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x6C\x00\x23\x02\x00\x00\x00',
-        b'\x09\xA0\x6D\x00\x8B\x07\x00\x00\x00',
-        b'\x09\xA0\x6E\x00\x6C\x0D\x00\x00\x00',
-        b'\x09\xA0\x6F\x00\xB3\x13\x00\x00\x00',
-        b'\x09\xA0\x70\x00\x4F\x1A\x00\x00\x00',
-        b'\x09\xA0\x71\x00\x2A\x21\x00\x00\x00',
-        b'\x09\xA0\x72\x00\x2D\x28\x00\x00\x00',
-        b'\x09\xA0\x73\x00\x41\x2F\x00\x00\x00',
-        b'\x09\xA0\x74\x00\x4C\x36\x00\x00\x00',
-        b'\x09\xA0\x75\x00\x34\x3D\x00\x00\x00',
-        b'\x09\xA0\x76\x00\xE0\x43\x00\x00\x00',
-        b'\x09\xA0\x77\x00\x37\x4A\x00\x00\x00',
-        b'\x09\xA0\x78\x00\x20\x50\x00\x00\x00',
-        b'\x09\xA0\x79\x00\x83\x55\x00\x00\x00',
-        b'\x09\xA0\x7A\x00\x4C\x5A\x00\x00\x00',
-        b'\x09\xA0\x7B\x00\x68\x5E\x00\x00\x00',
-        b'\x09\xA0\x7C\x00\xC7\x61\x00\x00\x00',
-        b'\x09\xA0\x7D\x00\x5A\x64\x00\x00\x00',
-        b'\x09\xA0\x7E\x00\x17\x66\x00\x00\x00',
-        b'\x09\xA0\x7F\x00\xF7\x66\x00\x00\x00',
-        b'\x09\xA0\x80\x00\xF7\x66\x00\x00\x00',
-        b'\x09\xA0\x81\x00\x17\x66\x00\x00\x00',
-        b'\x09\xA0\x82\x00\x5A\x64\x00\x00\x00',
-        b'\x09\xA0\x83\x00\xC7\x61\x00\x00\x00',
-        b'\x09\xA0\x84\x00\x68\x5E\x00\x00\x00',
-        b'\x09\xA0\x85\x00\x4C\x5A\x00\x00\x00',
-        b'\x09\xA0\x86\x00\x83\x55\x00\x00\x00',
-        b'\x09\xA0\x87\x00\x20\x50\x00\x00\x00',
-        b'\x09\xA0\x88\x00\x37\x4A\x00\x00\x00',
-        b'\x09\xA0\x89\x00\xE0\x43\x00\x00\x00',
-        b'\x09\xA0\x8A\x00\x34\x3D\x00\x00\x00',
-        b'\x09\xA0\x8B\x00\x4C\x36\x00\x00\x00',
-        b'\x09\xA0\x8C\x00\x41\x2F\x00\x00\x00',
-        b'\x09\xA0\x8D\x00\x2D\x28\x00\x00\x00',
-        b'\x09\xA0\x8E\x00\x2A\x21\x00\x00\x00',
-        b'\x09\xA0\x8F\x00\x4F\x1A\x00\x00\x00',
-        b'\x09\xA0\x90\x00\xB3\x13\x00\x00\x00',
-        b'\x09\xA0\x91\x00\x6C\x0D\x00\x00\x00',
-        b'\x09\xA0\x92\x00\x8B\x07\x00\x00\x00',
-        b'\x09\xA0\x93\x00\x23\x02\x00\x00\x00',
-        b'\x09\xA0\x94\x00\x40\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x95\x00\xEE\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x96\x00\x35\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x97\x00\x1A\xF2\xFF\xFF\x00',
-        b'\x09\xA0\x98\x00\x9E\xEF\xFF\xFF\x00',
-        b'\x09\xA0\x99\x00\xC2\xED\xFF\xFF\x00',
-        b'\x09\xA0\x9A\x00\x81\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x9B\x00\xD6\xEB\xFF\xFF\x00',
-        b'\x09\xA0\x9C\x00\xB7\xEB\xFF\xFF\x00',
-        b'\x09\xA0\x9D\x00\x1A\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x9E\x00\xF1\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x9F\x00\x31\xEE\xFF\xFF\x00',
-        b'\x09\xA0\xA0\x00\xC7\xEF\xFF\xFF\x00',
-        b'\x09\xA0\xA1\x00\xA6\xF1\xFF\xFF\x00',
-        b'\x09\xA0\xA2\x00\xBB\xF3\xFF\xFF\x00',
-        b'\x09\xA0\xA3\x00\xF7\xF5\xFF\xFF\x00',
-        b'\x09\xA0\xA4\x00\x49\xF8\xFF\xFF\x00',
-        b'\x09\xA0\xA5\x00\xA2\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xA6\x00\xF2\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xA7\x00\x2E\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xA8\x00\x46\x01\x00\x00\x00',
-        b'\x09\xA0\xA9\x00\x33\x03\x00\x00\x00',
-        b'\x09\xA0\xAA\x00\xE9\x04\x00\x00\x00',
-        b'\x09\xA0\xAB\x00\x64\x06\x00\x00\x00',
-        b'\x09\xA0\xAC\x00\x9C\x07\x00\x00\x00',
-        b'\x09\xA0\xAD\x00\x91\x08\x00\x00\x00',
-        b'\x09\xA0\xAE\x00\x3D\x09\x00\x00\x00',
-        b'\x09\xA0\xAF\x00\xA5\x09\x00\x00\x00',
-        b'\x09\xA0\xB0\x00\xC8\x09\x00\x00\x00',
-        b'\x09\xA0\xB1\x00\xAB\x09\x00\x00\x00',
-        b'\x09\xA0\xB2\x00\x51\x09\x00\x00\x00',
-        b'\x09\xA0\xB3\x00\xC4\x08\x00\x00\x00',
-        b'\x09\xA0\xB4\x00\x05\x08\x00\x00\x00',
-        b'\x09\xA0\xB5\x00\x22\x07\x00\x00\x00',
-        b'\x09\xA0\xB6\x00\x1D\x06\x00\x00\x00',
-        b'\x09\xA0\xB7\x00\x05\x05\x00\x00\x00',
-        b'\x09\xA0\xB8\x00\xDC\x03\x00\x00\x00',
-        b'\x09\xA0\xB9\x00\xAF\x02\x00\x00\x00',
-        b'\x09\xA0\xBA\x00\x83\x01\x00\x00\x00',
-        b'\x09\xA0\xBB\x00\x62\x00\x00\x00\x00',
-        b'\x09\xA0\xBC\x00\x4F\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xBD\x00\x54\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xBE\x00\x72\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xBF\x00\xB1\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xC0\x00\x0F\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xC1\x00\x94\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xC2\x00\x3A\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xC3\x00\x08\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xC4\x00\xF5\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xC5\x00\x08\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xC6\x00\x36\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xC7\x00\x83\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xC8\x00\xE4\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xC9\x00\x5E\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xCA\x00\xE2\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xCB\x00\x76\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xCC\x00\x0B\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xCD\x00\xA8\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xCE\x00\x3D\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xCF\x00\xD2\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xD0\x00\x59\x00\x00\x00\x00',
-        b'\x09\xA0\xD1\x00\xD9\x00\x00\x00\x00',
-        b'\x09\xA0\xD2\x00\x45\x01\x00\x00\x00',
-        b'\x09\xA0\xD3\x00\xA7\x01\x00\x00\x00',
-        b'\x09\xA0\xD4\x00\xF0\x01\x00\x00\x00',
-        b'\x09\xA0\xD5\x00\x2F\x02\x00\x00\x00',
-        b'\x09\xA0\xD6\x00\x53\x02\x00\x00\x00',
-        b'\x09\xA0\xD7\x00\x6D\x02\x00\x00\x00',
-        b'\x09\xA0\xD8\x00\x6E\x02\x00\x00\x00',
-        b'\x09\xA0\xD9\x00\x67\x02\x00\x00\x00',
-        b'\x09\xA0\xDA\x00\x47\x02\x00\x00\x00',
-        b'\x09\xA0\xDB\x00\x25\x02\x00\x00\x00',
-        b'\x09\xA0\xDC\x00\xED\x01\x00\x00\x00',
-        b'\x09\xA0\xDD\x00\xB7\x01\x00\x00\x00',
-        b'\x09\xA0\xDE\x00\x6F\x01\x00\x00\x00',
-        b'\x09\xA0\xDF\x00\x2F\x01\x00\x00\x00',
-        b'\x09\xA0\xE0\x00\xE0\x00\x00\x00\x00',
-        b'\x09\xA0\xE1\x00\x9F\x00\x00\x00\x00',
-        b'\x09\xA0\xE2\x00\x50\x00\x00\x00\x00',
-        b'\x09\xA0\xE3\x00\x16\x00\x00\x00\x00',
-        b'\x09\xA0\xE4\x00\xCE\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE5\x00\xA1\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE6\x00\x65\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE7\x00\x49\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE8\x00\x1B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE9\x00\x12\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xEA\x00\xF2\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xEB\x00\xFC\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xEC\x00\xE8\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xED\x00\x05\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xEE\x00\xF9\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xEF\x00\x27\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF0\x00\x1B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF1\x00\x5A\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF2\x00\x48\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF3\x00\x97\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF4\x00\x76\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF5\x00\xDA\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF6\x00\x99\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF7\x00\x20\x00\x00\x00\x00',
-        b'\x09\xA0\xF8\x00\xA7\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF9\x00\x70\x00\x00\x00\x00',
-        b'\x09\xA0\xFA\x00\x8B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xFB\x00\xE4\x00\x00\x00\x00',
-        b'\x09\xA0\xFC\x00\x18\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xFD\x00\xBA\x01\x00\x00\x00',
-        b'\x09\xA0\xFE\x00\x0A\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xFF\x00\xA0\x02\x00\x00\x00',
-        b'\x09\xA0\x00\x03\x08\x00\x00\x00\x00')
+    BWKHZ_5 = AD6620Program(
+        '9 6 6 15 20 31 4 15 0 255', '''
+           672   -502    442   -232    228   -117    112    -89     32   -103    -38   -138
+          -105   -184   -166   -229   -217   -263   -251   -280   -260   -270   -238   -229
+          -183   -155    -95    -50     22     80    159    224    303    367    439    493
+           549    583    615    622    621    595    559    496    423    325    217     89
+           -46   -195   -344   -501   -650   -798   -930  -1052  -1149  -1226  -1272  -1291
+         -1272  -1222  -1132  -1009   -847   -654   -428   -177     98    387    687    988
+          1285   1565   1826   2053   2244   2385   2475   2504   2469   2365   2193   1948
+          1636   1257    819    326   -210   -782  -1374  -1975  -2569  -3141  -3674  -4153
+         -4559  -4879  -5094  -5193  -5162  -4991  -4670  -4194  -3558  -2763  -1810   -704
+           547   1931   3436   5043   6735   8490  10285  12097  13900  15668  17376  18999
+         20512  21891  23116  24168  25031  25690  26135  26359  26359  26135  25690  25031
+         24168  23116  21891  20512  18999  17376  15668  13900  12097  10285   8490   6735
+          5043   3436   1931    547   -704  -1810  -2763  -3558  -4194  -4670  -4991  -5162
+         -5193  -5094  -4879  -4559  -4153  -3674  -3141  -2569  -1975  -1374   -782   -210
+           326    819   1257   1636   1948   2193   2365   2469   2504   2475   2385   2244
+          2053   1826   1565   1285    988    687    387     98   -177   -428   -654   -847
+         -1009  -1132  -1222  -1272  -1291  -1272  -1226  -1149  -1052   -930   -798   -650
+          -501   -344   -195    -46     89    217    325    423    496    559    595    621
+           622    615    583    549    493    439    367    303    224    159     80     22
+           -50    -95   -155   -183   -229   -238   -270   -260   -280   -251   -263   -217
+          -229   -166   -184   -105   -138    -38   -103     32    -89    112   -117    228
+          -232    442   -502    672
+        ''')
 
-    BWKHZ_10 = (
-        b'\x09\xA0\x00\x03\x09\x00\x00\x00\x00',
-        b'\x09\xA0\x01\x03\x06\x00\x00\x00\x00',
-        b'\x09\xA0\x05\x03\x04\x00\x00\x00\x00',
-        b'\x09\xA0\x06\x03\x07\x00\x00\x00\x00',
-        b'\x09\xA0\x07\x03\x14\x00\x00\x00\x00',
-        b'\x09\xA0\x08\x03\x1F\x00\x00\x00\x00',
-        b'\x09\xA0\x09\x03\x04\x00\x00\x00\x00',
-        b'\x09\xA0\x0A\x03\x0F\x00\x00\x00\x00',
-        b'\x09\xA0\x0B\x03\x00\x00\x00\x00\x00',
-        b'\x09\xA0\x0C\x03\xFF\x00\x00\x00\x00',
-        b'\x09\xA0\x00\x00\xA0\x02\x00\x00\x00',
-        b'\x09\xA0\x01\x00\x0A\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x02\x00\xBA\x01\x00\x00\x00',
-        b'\x09\xA0\x03\x00\x18\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x04\x00\xE4\x00\x00\x00\x00',
-        b'\x09\xA0\x05\x00\x8B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x06\x00\x70\x00\x00\x00\x00',
-        b'\x09\xA0\x07\x00\xA7\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x08\x00\x20\x00\x00\x00\x00',
-        b'\x09\xA0\x09\x00\x99\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0A\x00\xDA\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0B\x00\x76\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0C\x00\x97\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0D\x00\x48\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0E\x00\x5A\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0F\x00\x1B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x10\x00\x27\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x11\x00\xF9\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x12\x00\x05\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x13\x00\xE8\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x14\x00\xFC\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x15\x00\xF2\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x16\x00\x12\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x17\x00\x1B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x18\x00\x49\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x19\x00\x65\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x1A\x00\xA1\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x1B\x00\xCE\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x1C\x00\x16\x00\x00\x00\x00',
-        b'\x09\xA0\x1D\x00\x50\x00\x00\x00\x00',
-        b'\x09\xA0\x1E\x00\x9F\x00\x00\x00\x00',
-        b'\x09\xA0\x1F\x00\xE0\x00\x00\x00\x00',
-        b'\x09\xA0\x20\x00\x2F\x01\x00\x00\x00',
-        b'\x09\xA0\x21\x00\x6F\x01\x00\x00\x00',
-        b'\x09\xA0\x22\x00\xB7\x01\x00\x00\x00',
-        b'\x09\xA0\x23\x00\xED\x01\x00\x00\x00',
-        b'\x09\xA0\x24\x00\x25\x02\x00\x00\x00',
-        b'\x09\xA0\x25\x00\x47\x02\x00\x00\x00',
-        b'\x09\xA0\x26\x00\x67\x02\x00\x00\x00',
-        b'\x09\xA0\x27\x00\x6E\x02\x00\x00\x00',
-        b'\x09\xA0\x28\x00\x6D\x02\x00\x00\x00',
-        b'\x09\xA0\x29\x00\x53\x02\x00\x00\x00',
-        b'\x09\xA0\x2A\x00\x2F\x02\x00\x00\x00',
-        b'\x09\xA0\x2B\x00\xF0\x01\x00\x00\x00',
-        b'\x09\xA0\x2C\x00\xA7\x01\x00\x00\x00',
-        b'\x09\xA0\x2D\x00\x45\x01\x00\x00\x00',
-        b'\x09\xA0\x2E\x00\xD9\x00\x00\x00\x00',
-        b'\x09\xA0\x2F\x00\x59\x00\x00\x00\x00',
-        b'\x09\xA0\x30\x00\xD2\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x31\x00\x3D\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x32\x00\xA8\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x33\x00\x0B\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x34\x00\x76\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x35\x00\xE2\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x36\x00\x5E\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x37\x00\xE4\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x38\x00\x83\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x39\x00\x36\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x3A\x00\x08\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x3B\x00\xF5\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x3C\x00\x08\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x3D\x00\x3A\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x3E\x00\x94\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x3F\x00\x0F\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x40\x00\xB1\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x41\x00\x72\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x42\x00\x54\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x43\x00\x4F\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x44\x00\x62\x00\x00\x00\x00',
-        b'\x09\xA0\x45\x00\x83\x01\x00\x00\x00',
-        b'\x09\xA0\x46\x00\xAF\x02\x00\x00\x00',
-        b'\x09\xA0\x47\x00\xDC\x03\x00\x00\x00',
-        b'\x09\xA0\x48\x00\x05\x05\x00\x00\x00',
-        b'\x09\xA0\x49\x00\x1D\x06\x00\x00\x00',
-        b'\x09\xA0\x4A\x00\x22\x07\x00\x00\x00',
-        b'\x09\xA0\x4B\x00\x05\x08\x00\x00\x00',
-        b'\x09\xA0\x4C\x00\xC4\x08\x00\x00\x00',
-        b'\x09\xA0\x4D\x00\x51\x09\x00\x00\x00',
-        b'\x09\xA0\x4E\x00\xAB\x09\x00\x00\x00',
-        b'\x09\xA0\x4F\x00\xC8\x09\x00\x00\x00',
-        b'\x09\xA0\x50\x00\xA5\x09\x00\x00\x00',
-        b'\x09\xA0\x51\x00\x3D\x09\x00\x00\x00',
-        b'\x09\xA0\x52\x00\x91\x08\x00\x00\x00',
-        b'\x09\xA0\x53\x00\x9C\x07\x00\x00\x00',
-        b'\x09\xA0\x54\x00\x64\x06\x00\x00\x00',
-        b'\x09\xA0\x55\x00\xE9\x04\x00\x00\x00',
-        b'\x09\xA0\x56\x00\x33\x03\x00\x00\x00',
-        b'\x09\xA0\x57\x00\x46\x01\x00\x00\x00',
-        b'\x09\xA0\x58\x00\x2E\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x59\x00\xF2\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x5A\x00\xA2\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x5B\x00\x49\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x5C\x00\xF7\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x5D\x00\xBB\xF3\xFF\xFF\x00',
-        b'\x09\xA0\x5E\x00\xA6\xF1\xFF\xFF\x00',
-        b'\x09\xA0\x5F\x00\xC7\xEF\xFF\xFF\x00',
-        b'\x09\xA0\x60\x00\x31\xEE\xFF\xFF\x00',
-        b'\x09\xA0\x61\x00\xF1\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x62\x00\x1A\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x63\x00\xB7\xEB\xFF\xFF\x00',
-        b'\x09\xA0\x64\x00\xD6\xEB\xFF\xFF\x00',
-        b'\x09\xA0\x65\x00\x81\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x66\x00\xC2\xED\xFF\xFF\x00',
-        b'\x09\xA0\x67\x00\x9E\xEF\xFF\xFF\x00',
-        b'\x09\xA0\x68\x00\x1A\xF2\xFF\xFF\x00',
-        b'\x09\xA0\x69\x00\x35\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x6A\x00\xEE\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x6B\x00\x40\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x6C\x00\x23\x02\x00\x00\x00',
-        b'\x09\xA0\x6D\x00\x8B\x07\x00\x00\x00',
-        b'\x09\xA0\x6E\x00\x6C\x0D\x00\x00\x00',
-        b'\x09\xA0\x6F\x00\xB3\x13\x00\x00\x00',
-        b'\x09\xA0\x70\x00\x4F\x1A\x00\x00\x00',
-        b'\x09\xA0\x71\x00\x2A\x21\x00\x00\x00',
-        b'\x09\xA0\x72\x00\x2D\x28\x00\x00\x00',
-        b'\x09\xA0\x73\x00\x41\x2F\x00\x00\x00',
-        b'\x09\xA0\x74\x00\x4C\x36\x00\x00\x00',
-        b'\x09\xA0\x75\x00\x34\x3D\x00\x00\x00',
-        b'\x09\xA0\x76\x00\xE0\x43\x00\x00\x00',
-        b'\x09\xA0\x77\x00\x37\x4A\x00\x00\x00',
-        b'\x09\xA0\x78\x00\x20\x50\x00\x00\x00',
-        b'\x09\xA0\x79\x00\x83\x55\x00\x00\x00',
-        b'\x09\xA0\x7A\x00\x4C\x5A\x00\x00\x00',
-        b'\x09\xA0\x7B\x00\x68\x5E\x00\x00\x00',
-        b'\x09\xA0\x7C\x00\xC7\x61\x00\x00\x00',
-        b'\x09\xA0\x7D\x00\x5A\x64\x00\x00\x00',
-        b'\x09\xA0\x7E\x00\x17\x66\x00\x00\x00',
-        b'\x09\xA0\x7F\x00\xF7\x66\x00\x00\x00',
-        b'\x09\xA0\x80\x00\xF7\x66\x00\x00\x00',
-        b'\x09\xA0\x81\x00\x17\x66\x00\x00\x00',
-        b'\x09\xA0\x82\x00\x5A\x64\x00\x00\x00',
-        b'\x09\xA0\x83\x00\xC7\x61\x00\x00\x00',
-        b'\x09\xA0\x84\x00\x68\x5E\x00\x00\x00',
-        b'\x09\xA0\x85\x00\x4C\x5A\x00\x00\x00',
-        b'\x09\xA0\x86\x00\x83\x55\x00\x00\x00',
-        b'\x09\xA0\x87\x00\x20\x50\x00\x00\x00',
-        b'\x09\xA0\x88\x00\x37\x4A\x00\x00\x00',
-        b'\x09\xA0\x89\x00\xE0\x43\x00\x00\x00',
-        b'\x09\xA0\x8A\x00\x34\x3D\x00\x00\x00',
-        b'\x09\xA0\x8B\x00\x4C\x36\x00\x00\x00',
-        b'\x09\xA0\x8C\x00\x41\x2F\x00\x00\x00',
-        b'\x09\xA0\x8D\x00\x2D\x28\x00\x00\x00',
-        b'\x09\xA0\x8E\x00\x2A\x21\x00\x00\x00',
-        b'\x09\xA0\x8F\x00\x4F\x1A\x00\x00\x00',
-        b'\x09\xA0\x90\x00\xB3\x13\x00\x00\x00',
-        b'\x09\xA0\x91\x00\x6C\x0D\x00\x00\x00',
-        b'\x09\xA0\x92\x00\x8B\x07\x00\x00\x00',
-        b'\x09\xA0\x93\x00\x23\x02\x00\x00\x00',
-        b'\x09\xA0\x94\x00\x40\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x95\x00\xEE\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x96\x00\x35\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x97\x00\x1A\xF2\xFF\xFF\x00',
-        b'\x09\xA0\x98\x00\x9E\xEF\xFF\xFF\x00',
-        b'\x09\xA0\x99\x00\xC2\xED\xFF\xFF\x00',
-        b'\x09\xA0\x9A\x00\x81\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x9B\x00\xD6\xEB\xFF\xFF\x00',
-        b'\x09\xA0\x9C\x00\xB7\xEB\xFF\xFF\x00',
-        b'\x09\xA0\x9D\x00\x1A\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x9E\x00\xF1\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x9F\x00\x31\xEE\xFF\xFF\x00',
-        b'\x09\xA0\xA0\x00\xC7\xEF\xFF\xFF\x00',
-        b'\x09\xA0\xA1\x00\xA6\xF1\xFF\xFF\x00',
-        b'\x09\xA0\xA2\x00\xBB\xF3\xFF\xFF\x00',
-        b'\x09\xA0\xA3\x00\xF7\xF5\xFF\xFF\x00',
-        b'\x09\xA0\xA4\x00\x49\xF8\xFF\xFF\x00',
-        b'\x09\xA0\xA5\x00\xA2\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xA6\x00\xF2\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xA7\x00\x2E\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xA8\x00\x46\x01\x00\x00\x00',
-        b'\x09\xA0\xA9\x00\x33\x03\x00\x00\x00',
-        b'\x09\xA0\xAA\x00\xE9\x04\x00\x00\x00',
-        b'\x09\xA0\xAB\x00\x64\x06\x00\x00\x00',
-        b'\x09\xA0\xAC\x00\x9C\x07\x00\x00\x00',
-        b'\x09\xA0\xAD\x00\x91\x08\x00\x00\x00',
-        b'\x09\xA0\xAE\x00\x3D\x09\x00\x00\x00',
-        b'\x09\xA0\xAF\x00\xA5\x09\x00\x00\x00',
-        b'\x09\xA0\xB0\x00\xC8\x09\x00\x00\x00',
-        b'\x09\xA0\xB1\x00\xAB\x09\x00\x00\x00',
-        b'\x09\xA0\xB2\x00\x51\x09\x00\x00\x00',
-        b'\x09\xA0\xB3\x00\xC4\x08\x00\x00\x00',
-        b'\x09\xA0\xB4\x00\x05\x08\x00\x00\x00',
-        b'\x09\xA0\xB5\x00\x22\x07\x00\x00\x00',
-        b'\x09\xA0\xB6\x00\x1D\x06\x00\x00\x00',
-        b'\x09\xA0\xB7\x00\x05\x05\x00\x00\x00',
-        b'\x09\xA0\xB8\x00\xDC\x03\x00\x00\x00',
-        b'\x09\xA0\xB9\x00\xAF\x02\x00\x00\x00',
-        b'\x09\xA0\xBA\x00\x83\x01\x00\x00\x00',
-        b'\x09\xA0\xBB\x00\x62\x00\x00\x00\x00',
-        b'\x09\xA0\xBC\x00\x4F\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xBD\x00\x54\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xBE\x00\x72\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xBF\x00\xB1\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xC0\x00\x0F\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xC1\x00\x94\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xC2\x00\x3A\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xC3\x00\x08\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xC4\x00\xF5\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xC5\x00\x08\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xC6\x00\x36\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xC7\x00\x83\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xC8\x00\xE4\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xC9\x00\x5E\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xCA\x00\xE2\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xCB\x00\x76\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xCC\x00\x0B\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xCD\x00\xA8\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xCE\x00\x3D\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xCF\x00\xD2\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xD0\x00\x59\x00\x00\x00\x00',
-        b'\x09\xA0\xD1\x00\xD9\x00\x00\x00\x00',
-        b'\x09\xA0\xD2\x00\x45\x01\x00\x00\x00',
-        b'\x09\xA0\xD3\x00\xA7\x01\x00\x00\x00',
-        b'\x09\xA0\xD4\x00\xF0\x01\x00\x00\x00',
-        b'\x09\xA0\xD5\x00\x2F\x02\x00\x00\x00',
-        b'\x09\xA0\xD6\x00\x53\x02\x00\x00\x00',
-        b'\x09\xA0\xD7\x00\x6D\x02\x00\x00\x00',
-        b'\x09\xA0\xD8\x00\x6E\x02\x00\x00\x00',
-        b'\x09\xA0\xD9\x00\x67\x02\x00\x00\x00',
-        b'\x09\xA0\xDA\x00\x47\x02\x00\x00\x00',
-        b'\x09\xA0\xDB\x00\x25\x02\x00\x00\x00',
-        b'\x09\xA0\xDC\x00\xED\x01\x00\x00\x00',
-        b'\x09\xA0\xDD\x00\xB7\x01\x00\x00\x00',
-        b'\x09\xA0\xDE\x00\x6F\x01\x00\x00\x00',
-        b'\x09\xA0\xDF\x00\x2F\x01\x00\x00\x00',
-        b'\x09\xA0\xE0\x00\xE0\x00\x00\x00\x00',
-        b'\x09\xA0\xE1\x00\x9F\x00\x00\x00\x00',
-        b'\x09\xA0\xE2\x00\x50\x00\x00\x00\x00',
-        b'\x09\xA0\xE3\x00\x16\x00\x00\x00\x00',
-        b'\x09\xA0\xE4\x00\xCE\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE5\x00\xA1\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE6\x00\x65\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE7\x00\x49\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE8\x00\x1B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE9\x00\x12\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xEA\x00\xF2\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xEB\x00\xFC\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xEC\x00\xE8\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xED\x00\x05\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xEE\x00\xF9\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xEF\x00\x27\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF0\x00\x1B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF1\x00\x5A\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF2\x00\x48\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF3\x00\x97\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF4\x00\x76\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF5\x00\xDA\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF6\x00\x99\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF7\x00\x20\x00\x00\x00\x00',
-        b'\x09\xA0\xF8\x00\xA7\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF9\x00\x70\x00\x00\x00\x00',
-        b'\x09\xA0\xFA\x00\x8B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xFB\x00\xE4\x00\x00\x00\x00',
-        b'\x09\xA0\xFC\x00\x18\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xFD\x00\xBA\x01\x00\x00\x00',
-        b'\x09\xA0\xFE\x00\x0A\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xFF\x00\xA0\x02\x00\x00\x00',
-        b'\x09\xA0\x00\x03\x08\x00\x00\x00\x00')
+    BWKHZ_10 = AD6620Program(
+        '9 6 4 7 20 31 4 15 0 255', '''
+           672   -502    442   -232    228   -117    112    -89     32   -103    -38   -138
+          -105   -184   -166   -229   -217   -263   -251   -280   -260   -270   -238   -229
+          -183   -155    -95    -50     22     80    159    224    303    367    439    493
+           549    583    615    622    621    595    559    496    423    325    217     89
+           -46   -195   -344   -501   -650   -798   -930  -1052  -1149  -1226  -1272  -1291
+         -1272  -1222  -1132  -1009   -847   -654   -428   -177     98    387    687    988
+          1285   1565   1826   2053   2244   2385   2475   2504   2469   2365   2193   1948
+          1636   1257    819    326   -210   -782  -1374  -1975  -2569  -3141  -3674  -4153
+         -4559  -4879  -5094  -5193  -5162  -4991  -4670  -4194  -3558  -2763  -1810   -704
+           547   1931   3436   5043   6735   8490  10285  12097  13900  15668  17376  18999
+         20512  21891  23116  24168  25031  25690  26135  26359  26359  26135  25690  25031
+         24168  23116  21891  20512  18999  17376  15668  13900  12097  10285   8490   6735
+          5043   3436   1931    547   -704  -1810  -2763  -3558  -4194  -4670  -4991  -5162
+         -5193  -5094  -4879  -4559  -4153  -3674  -3141  -2569  -1975  -1374   -782   -210
+           326    819   1257   1636   1948   2193   2365   2469   2504   2475   2385   2244
+          2053   1826   1565   1285    988    687    387     98   -177   -428   -654   -847
+         -1009  -1132  -1222  -1272  -1291  -1272  -1226  -1149  -1052   -930   -798   -650
+          -501   -344   -195    -46     89    217    325    423    496    559    595    621
+           622    615    583    549    493    439    367    303    224    159     80     22
+           -50    -95   -155   -183   -229   -238   -270   -260   -280   -251   -263   -217
+          -229   -166   -184   -105   -138    -38   -103     32    -89    112   -117    228
+          -232    442   -502    672
+        ''')
 
-    BWKHZ_25 = (
-        b'\x09\xA0\x00\x03\x09\x00\x00\x00\x00',
-        b'\x09\xA0\x01\x03\x06\x00\x00\x00\x00',
-        b'\x09\xA0\x05\x03\x04\x00\x00\x00\x00',
-        b'\x09\xA0\x06\x03\x06\x00\x00\x00\x00',
-        b'\x09\xA0\x07\x03\x11\x00\x00\x00\x00',
-        b'\x09\xA0\x08\x03\x14\x00\x00\x00\x00',
-        b'\x09\xA0\x09\x03\x04\x00\x00\x00\x00',
-        b'\x09\xA0\x0A\x03\x0B\x00\x00\x00\x00',
-        b'\x09\xA0\x0B\x03\x00\x00\x00\x00\x00',
-        b'\x09\xA0\x0C\x03\xFF\x00\x00\x00\x00',
-        b'\x09\xA0\x00\x00\xAF\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x01\x00\x17\x01\x00\x00\x00',
-        b'\x09\xA0\x02\x00\x9D\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x03\x00\xB0\x00\x00\x00\x00',
-        b'\x09\xA0\x04\x00\xFA\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x05\x00\x83\x00\x00\x00\x00',
-        b'\x09\xA0\x06\x00\x25\x00\x00\x00\x00',
-        b'\x09\xA0\x07\x00\x69\x00\x00\x00\x00',
-        b'\x09\xA0\x08\x00\x2C\x00\x00\x00\x00',
-        b'\x09\xA0\x09\x00\x4B\x00\x00\x00\x00',
-        b'\x09\xA0\x0A\x00\x19\x00\x00\x00\x00',
-        b'\x09\xA0\x0B\x00\x1F\x00\x00\x00\x00',
-        b'\x09\xA0\x0C\x00\xEF\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0D\x00\xE6\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0E\x00\xB8\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0F\x00\xA7\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x10\x00\x7E\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x11\x00\x6D\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x12\x00\x4E\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x13\x00\x47\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x14\x00\x39\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x15\x00\x42\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x16\x00\x49\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x17\x00\x67\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x18\x00\x86\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x19\x00\xB8\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x1A\x00\xEB\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x1B\x00\x2C\x00\x00\x00\x00',
-        b'\x09\xA0\x1C\x00\x6C\x00\x00\x00\x00',
-        b'\x09\xA0\x1D\x00\xB3\x00\x00\x00\x00',
-        b'\x09\xA0\x1E\x00\xF2\x00\x00\x00\x00',
-        b'\x09\xA0\x1F\x00\x31\x01\x00\x00\x00',
-        b'\x09\xA0\x20\x00\x61\x01\x00\x00\x00',
-        b'\x09\xA0\x21\x00\x88\x01\x00\x00\x00',
-        b'\x09\xA0\x22\x00\x9B\x01\x00\x00\x00',
-        b'\x09\xA0\x23\x00\x9E\x01\x00\x00\x00',
-        b'\x09\xA0\x24\x00\x88\x01\x00\x00\x00',
-        b'\x09\xA0\x25\x00\x60\x01\x00\x00\x00',
-        b'\x09\xA0\x26\x00\x1E\x01\x00\x00\x00',
-        b'\x09\xA0\x27\x00\xCA\x00\x00\x00\x00',
-        b'\x09\xA0\x28\x00\x61\x00\x00\x00\x00',
-        b'\x09\xA0\x29\x00\xEC\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x2A\x00\x6B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x2B\x00\xE8\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x2C\x00\x66\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x2D\x00\xEF\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x2E\x00\x87\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x2F\x00\x38\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x30\x00\x05\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x31\x00\xF6\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x32\x00\x0B\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x33\x00\x4B\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x34\x00\xB2\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x35\x00\x40\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x36\x00\xF0\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x37\x00\xBD\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x38\x00\x9C\x00\x00\x00\x00',
-        b'\x09\xA0\x39\x00\x87\x01\x00\x00\x00',
-        b'\x09\xA0\x3A\x00\x6F\x02\x00\x00\x00',
-        b'\x09\xA0\x3B\x00\x4C\x03\x00\x00\x00',
-        b'\x09\xA0\x3C\x00\x0D\x04\x00\x00\x00',
-        b'\x09\xA0\x3D\x00\xAB\x04\x00\x00\x00',
-        b'\x09\xA0\x3E\x00\x17\x05\x00\x00\x00',
-        b'\x09\xA0\x3F\x00\x4B\x05\x00\x00\x00',
-        b'\x09\xA0\x40\x00\x3E\x05\x00\x00\x00',
-        b'\x09\xA0\x41\x00\xED\x04\x00\x00\x00',
-        b'\x09\xA0\x42\x00\x56\x04\x00\x00\x00',
-        b'\x09\xA0\x43\x00\x7C\x03\x00\x00\x00',
-        b'\x09\xA0\x44\x00\x64\x02\x00\x00\x00',
-        b'\x09\xA0\x45\x00\x19\x01\x00\x00\x00',
-        b'\x09\xA0\x46\x00\xA6\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x47\x00\x1D\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x48\x00\x8F\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x49\x00\x0F\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x4A\x00\xB2\xF9\xFF\xFF\x00',
-        b'\x09\xA0\x4B\x00\x8C\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x4C\x00\xB0\xF7\xFF\xFF\x00',
-        b'\x09\xA0\x4D\x00\x2F\xF7\xFF\xFF\x00',
-        b'\x09\xA0\x4E\x00\x15\xF7\xFF\xFF\x00',
-        b'\x09\xA0\x4F\x00\x6B\xF7\xFF\xFF\x00',
-        b'\x09\xA0\x50\x00\x36\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x51\x00\x74\xF9\xFF\xFF\x00',
-        b'\x09\xA0\x52\x00\x1E\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x53\x00\x26\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x54\x00\x7A\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x55\x00\x02\x02\x00\x00\x00',
-        b'\x09\xA0\x56\x00\xA1\x04\x00\x00\x00',
-        b'\x09\xA0\x57\x00\x39\x07\x00\x00\x00',
-        b'\x09\xA0\x58\x00\xA7\x09\x00\x00\x00',
-        b'\x09\xA0\x59\x00\xCA\x0B\x00\x00\x00',
-        b'\x09\xA0\x5A\x00\x81\x0D\x00\x00\x00',
-        b'\x09\xA0\x5B\x00\xAD\x0E\x00\x00\x00',
-        b'\x09\xA0\x5C\x00\x35\x0F\x00\x00\x00',
-        b'\x09\xA0\x5D\x00\x05\x0F\x00\x00\x00',
-        b'\x09\xA0\x5E\x00\x10\x0E\x00\x00\x00',
-        b'\x09\xA0\x5F\x00\x53\x0C\x00\x00\x00',
-        b'\x09\xA0\x60\x00\xD1\x09\x00\x00\x00',
-        b'\x09\xA0\x61\x00\x99\x06\x00\x00\x00',
-        b'\x09\xA0\x62\x00\xC5\x02\x00\x00\x00',
-        b'\x09\xA0\x63\x00\x75\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x64\x00\xD5\xF9\xFF\xFF\x00',
-        b'\x09\xA0\x65\x00\x15\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x66\x00\x6E\xF0\xFF\xFF\x00',
-        b'\x09\xA0\x67\x00\x1B\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x68\x00\x59\xE8\xFF\xFF\x00',
-        b'\x09\xA0\x69\x00\x66\xE5\xFF\xFF\x00',
-        b'\x09\xA0\x6A\x00\x7A\xE3\xFF\xFF\x00',
-        b'\x09\xA0\x6B\x00\xC9\xE2\xFF\xFF\x00',
-        b'\x09\xA0\x6C\x00\x80\xE3\xFF\xFF\x00',
-        b'\x09\xA0\x6D\x00\xC0\xE5\xFF\xFF\x00',
-        b'\x09\xA0\x6E\x00\xA0\xE9\xFF\xFF\x00',
-        b'\x09\xA0\x6F\x00\x29\xEF\xFF\xFF\x00',
-        b'\x09\xA0\x70\x00\x54\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x71\x00\x0E\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x72\x00\x34\x09\x00\x00\x00',
-        b'\x09\xA0\x73\x00\x94\x14\x00\x00\x00',
-        b'\x09\xA0\x74\x00\xF1\x20\x00\x00\x00',
-        b'\x09\xA0\x75\x00\x02\x2E\x00\x00\x00',
-        b'\x09\xA0\x76\x00\x75\x3B\x00\x00\x00',
-        b'\x09\xA0\x77\x00\xF2\x48\x00\x00\x00',
-        b'\x09\xA0\x78\x00\x1D\x56\x00\x00\x00',
-        b'\x09\xA0\x79\x00\x9A\x62\x00\x00\x00',
-        b'\x09\xA0\x7A\x00\x11\x6E\x00\x00\x00',
-        b'\x09\xA0\x7B\x00\x2D\x78\x00\x00\x00',
-        b'\x09\xA0\x7C\x00\xA5\x80\x00\x00\x00',
-        b'\x09\xA0\x7D\x00\x39\x87\x00\x00\x00',
-        b'\x09\xA0\x7E\x00\xB8\x8B\x00\x00\x00',
-        b'\x09\xA0\x7F\x00\x00\x8E\x00\x00\x00',
-        b'\x09\xA0\x80\x00\x00\x8E\x00\x00\x00',
-        b'\x09\xA0\x81\x00\xB8\x8B\x00\x00\x00',
-        b'\x09\xA0\x82\x00\x39\x87\x00\x00\x00',
-        b'\x09\xA0\x83\x00\xA5\x80\x00\x00\x00',
-        b'\x09\xA0\x84\x00\x2D\x78\x00\x00\x00',
-        b'\x09\xA0\x85\x00\x11\x6E\x00\x00\x00',
-        b'\x09\xA0\x86\x00\x9A\x62\x00\x00\x00',
-        b'\x09\xA0\x87\x00\x1D\x56\x00\x00\x00',
-        b'\x09\xA0\x88\x00\xF2\x48\x00\x00\x00',
-        b'\x09\xA0\x89\x00\x75\x3B\x00\x00\x00',
-        b'\x09\xA0\x8A\x00\x02\x2E\x00\x00\x00',
-        b'\x09\xA0\x8B\x00\xF1\x20\x00\x00\x00',
-        b'\x09\xA0\x8C\x00\x94\x14\x00\x00\x00',
-        b'\x09\xA0\x8D\x00\x34\x09\x00\x00\x00',
-        b'\x09\xA0\x8E\x00\x0E\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x8F\x00\x54\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x90\x00\x29\xEF\xFF\xFF\x00',
-        b'\x09\xA0\x91\x00\xA0\xE9\xFF\xFF\x00',
-        b'\x09\xA0\x92\x00\xC0\xE5\xFF\xFF\x00',
-        b'\x09\xA0\x93\x00\x80\xE3\xFF\xFF\x00',
-        b'\x09\xA0\x94\x00\xC9\xE2\xFF\xFF\x00',
-        b'\x09\xA0\x95\x00\x7A\xE3\xFF\xFF\x00',
-        b'\x09\xA0\x96\x00\x66\xE5\xFF\xFF\x00',
-        b'\x09\xA0\x97\x00\x59\xE8\xFF\xFF\x00',
-        b'\x09\xA0\x98\x00\x1B\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x99\x00\x6E\xF0\xFF\xFF\x00',
-        b'\x09\xA0\x9A\x00\x15\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x9B\x00\xD5\xF9\xFF\xFF\x00',
-        b'\x09\xA0\x9C\x00\x75\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x9D\x00\xC5\x02\x00\x00\x00',
-        b'\x09\xA0\x9E\x00\x99\x06\x00\x00\x00',
-        b'\x09\xA0\x9F\x00\xD1\x09\x00\x00\x00',
-        b'\x09\xA0\xA0\x00\x53\x0C\x00\x00\x00',
-        b'\x09\xA0\xA1\x00\x10\x0E\x00\x00\x00',
-        b'\x09\xA0\xA2\x00\x05\x0F\x00\x00\x00',
-        b'\x09\xA0\xA3\x00\x35\x0F\x00\x00\x00',
-        b'\x09\xA0\xA4\x00\xAD\x0E\x00\x00\x00',
-        b'\x09\xA0\xA5\x00\x81\x0D\x00\x00\x00',
-        b'\x09\xA0\xA6\x00\xCA\x0B\x00\x00\x00',
-        b'\x09\xA0\xA7\x00\xA7\x09\x00\x00\x00',
-        b'\x09\xA0\xA8\x00\x39\x07\x00\x00\x00',
-        b'\x09\xA0\xA9\x00\xA1\x04\x00\x00\x00',
-        b'\x09\xA0\xAA\x00\x02\x02\x00\x00\x00',
-        b'\x09\xA0\xAB\x00\x7A\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xAC\x00\x26\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xAD\x00\x1E\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xAE\x00\x74\xF9\xFF\xFF\x00',
-        b'\x09\xA0\xAF\x00\x36\xF8\xFF\xFF\x00',
-        b'\x09\xA0\xB0\x00\x6B\xF7\xFF\xFF\x00',
-        b'\x09\xA0\xB1\x00\x15\xF7\xFF\xFF\x00',
-        b'\x09\xA0\xB2\x00\x2F\xF7\xFF\xFF\x00',
-        b'\x09\xA0\xB3\x00\xB0\xF7\xFF\xFF\x00',
-        b'\x09\xA0\xB4\x00\x8C\xF8\xFF\xFF\x00',
-        b'\x09\xA0\xB5\x00\xB2\xF9\xFF\xFF\x00',
-        b'\x09\xA0\xB6\x00\x0F\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xB7\x00\x8F\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xB8\x00\x1D\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xB9\x00\xA6\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xBA\x00\x19\x01\x00\x00\x00',
-        b'\x09\xA0\xBB\x00\x64\x02\x00\x00\x00',
-        b'\x09\xA0\xBC\x00\x7C\x03\x00\x00\x00',
-        b'\x09\xA0\xBD\x00\x56\x04\x00\x00\x00',
-        b'\x09\xA0\xBE\x00\xED\x04\x00\x00\x00',
-        b'\x09\xA0\xBF\x00\x3E\x05\x00\x00\x00',
-        b'\x09\xA0\xC0\x00\x4B\x05\x00\x00\x00',
-        b'\x09\xA0\xC1\x00\x17\x05\x00\x00\x00',
-        b'\x09\xA0\xC2\x00\xAB\x04\x00\x00\x00',
-        b'\x09\xA0\xC3\x00\x0D\x04\x00\x00\x00',
-        b'\x09\xA0\xC4\x00\x4C\x03\x00\x00\x00',
-        b'\x09\xA0\xC5\x00\x6F\x02\x00\x00\x00',
-        b'\x09\xA0\xC6\x00\x87\x01\x00\x00\x00',
-        b'\x09\xA0\xC7\x00\x9C\x00\x00\x00\x00',
-        b'\x09\xA0\xC8\x00\xBD\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xC9\x00\xF0\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xCA\x00\x40\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xCB\x00\xB2\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xCC\x00\x4B\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xCD\x00\x0B\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xCE\x00\xF6\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xCF\x00\x05\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xD0\x00\x38\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xD1\x00\x87\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xD2\x00\xEF\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xD3\x00\x66\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xD4\x00\xE8\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xD5\x00\x6B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xD6\x00\xEC\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xD7\x00\x61\x00\x00\x00\x00',
-        b'\x09\xA0\xD8\x00\xCA\x00\x00\x00\x00',
-        b'\x09\xA0\xD9\x00\x1E\x01\x00\x00\x00',
-        b'\x09\xA0\xDA\x00\x60\x01\x00\x00\x00',
-        b'\x09\xA0\xDB\x00\x88\x01\x00\x00\x00',
-        b'\x09\xA0\xDC\x00\x9E\x01\x00\x00\x00',
-        b'\x09\xA0\xDD\x00\x9B\x01\x00\x00\x00',
-        b'\x09\xA0\xDE\x00\x88\x01\x00\x00\x00',
-        b'\x09\xA0\xDF\x00\x61\x01\x00\x00\x00',
-        b'\x09\xA0\xE0\x00\x31\x01\x00\x00\x00',
-        b'\x09\xA0\xE1\x00\xF2\x00\x00\x00\x00',
-        b'\x09\xA0\xE2\x00\xB3\x00\x00\x00\x00',
-        b'\x09\xA0\xE3\x00\x6C\x00\x00\x00\x00',
-        b'\x09\xA0\xE4\x00\x2C\x00\x00\x00\x00',
-        b'\x09\xA0\xE5\x00\xEB\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE6\x00\xB8\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE7\x00\x86\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE8\x00\x67\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE9\x00\x49\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xEA\x00\x42\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xEB\x00\x39\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xEC\x00\x47\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xED\x00\x4E\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xEE\x00\x6D\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xEF\x00\x7E\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF0\x00\xA7\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF1\x00\xB8\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF2\x00\xE6\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF3\x00\xEF\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF4\x00\x1F\x00\x00\x00\x00',
-        b'\x09\xA0\xF5\x00\x19\x00\x00\x00\x00',
-        b'\x09\xA0\xF6\x00\x4B\x00\x00\x00\x00',
-        b'\x09\xA0\xF7\x00\x2C\x00\x00\x00\x00',
-        b'\x09\xA0\xF8\x00\x69\x00\x00\x00\x00',
-        b'\x09\xA0\xF9\x00\x25\x00\x00\x00\x00',
-        b'\x09\xA0\xFA\x00\x83\x00\x00\x00\x00',
-        b'\x09\xA0\xFB\x00\xFA\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xFC\x00\xB0\x00\x00\x00\x00',
-        b'\x09\xA0\xFD\x00\x9D\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xFE\x00\x17\x01\x00\x00\x00',
-        b'\x09\xA0\xFF\x00\xAF\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x00\x03\x08\x00\x00\x00\x00')
+    BWKHZ_25 = AD6620Program(
+        '9 6 4 6 17 20 4 11 0 255', '''
+           -81    279    -99    176     -6    131     37    105     44     75     25     31
+           -17    -26    -72    -89   -130   -147   -178   -185   -199   -190   -183   -153
+          -122    -72    -21     44    108    179    242    305    353    392    411    414
+           392    352    286    202     97    -20   -149   -280   -410   -529   -633   -712
+          -763   -778   -757   -693   -590   -448   -272    -67    156    391    623    844
+          1037   1195   1303   1355   1342   1261   1110    892    612    281    -90   -483
+          -881  -1265  -1614  -1908  -2128  -2257  -2283  -2197  -1994  -1676  -1250   -730
+          -134    514   1185   1849   2471   3018   3457   3757   3893   3845   3600   3155
+          2513   1689    709   -395  -1579  -2795  -3986  -5093  -6055  -6810  -7302  -7479
+         -7296  -6720  -5728  -4311  -2476   -242   2356   5268   8433  11778  15221  18674
+         22045  25242  28177  30765  32933  34617  35768  36352  36352  35768  34617  32933
+         30765  28177  25242  22045  18674  15221  11778   8433   5268   2356   -242  -2476
+         -4311  -5728  -6720  -7296  -7479  -7302  -6810  -6055  -5093  -3986  -2795  -1579
+          -395    709   1689   2513   3155   3600   3845   3893   3757   3457   3018   2471
+          1849   1185    514   -134   -730  -1250  -1676  -1994  -2197  -2283  -2257  -2128
+         -1908  -1614  -1265   -881   -483    -90    281    612    892   1110   1261   1342
+          1355   1303   1195   1037    844    623    391    156    -67   -272   -448   -590
+          -693   -757   -778   -763   -712   -633   -529   -410   -280   -149    -20     97
+           202    286    352    392    414    411    392    353    305    242    179    108
+            44    -21    -72   -122   -153   -183   -190   -199   -185   -178   -147   -130
+           -89    -72    -26    -17     31     25     75     44    105     37    131     -6
+           176    -99    279    -81
+        ''')
 
-    BWKHZ_50 = (
-        b'\x09\xA0\x00\x03\x09\x00\x00\x00\x00',
-        b'\x09\xA0\x01\x03\x06\x00\x00\x00\x00',
-        b'\x09\xA0\x05\x03\x04\x00\x00\x00\x00',
-        b'\x09\xA0\x06\x03\x07\x00\x00\x00\x00',
-        b'\x09\xA0\x07\x03\x14\x00\x00\x00\x00',
-        b'\x09\xA0\x08\x03\x1D\x00\x00\x00\x00',
-        b'\x09\xA0\x09\x03\x04\x00\x00\x00\x00',
-        b'\x09\xA0\x0A\x03\x04\x00\x00\x00\x00',
-        b'\x09\xA0\x0B\x03\x00\x00\x00\x00\x00',
-        b'\x09\xA0\x0C\x03\xFF\x00\x00\x00\x00',
-        b'\x09\xA0\x00\x00\x8D\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x01\x00\x3C\x02\x00\x00\x00',
-        b'\x09\xA0\x02\x00\x1E\x01\x00\x00\x00',
-        b'\x09\xA0\x03\x00\x7E\x03\x00\x00\x00',
-        b'\x09\xA0\x04\x00\x57\x03\x00\x00\x00',
-        b'\x09\xA0\x05\x00\x8C\x04\x00\x00\x00',
-        b'\x09\xA0\x06\x00\x07\x04\x00\x00\x00',
-        b'\x09\xA0\x07\x00\xCB\x03\x00\x00\x00',
-        b'\x09\xA0\x08\x00\x59\x02\x00\x00\x00',
-        b'\x09\xA0\x09\x00\x16\x01\x00\x00\x00',
-        b'\x09\xA0\x0A\x00\x64\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0B\x00\x58\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x0C\x00\xA1\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x0D\x00\xDE\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x0E\x00\x95\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x0F\x00\xDE\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x10\x00\x0D\x01\x00\x00\x00',
-        b'\x09\xA0\x11\x00\xFF\x01\x00\x00\x00',
-        b'\x09\xA0\x12\x00\x30\x02\x00\x00\x00',
-        b'\x09\xA0\x13\x00\xBD\x01\x00\x00\x00',
-        b'\x09\xA0\x14\x00\x9E\x00\x00\x00\x00',
-        b'\x09\xA0\x15\x00\x52\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x16\x00\x26\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x17\x00\x9E\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x18\x00\xD2\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x19\x00\xD4\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x1A\x00\x3E\x00\x00\x00\x00',
-        b'\x09\xA0\x1B\x00\xAF\x01\x00\x00\x00',
-        b'\x09\xA0\x1C\x00\x97\x02\x00\x00\x00',
-        b'\x09\xA0\x1D\x00\xB1\x02\x00\x00\x00',
-        b'\x09\xA0\x1E\x00\xD7\x01\x00\x00\x00',
-        b'\x09\xA0\x1F\x00\x58\x00\x00\x00\x00',
-        b'\x09\xA0\x20\x00\x9D\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x21\x00\x4A\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x22\x00\xCB\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x23\x00\x64\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x24\x00\xE6\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x25\x00\xE4\x00\x00\x00\x00',
-        b'\x09\xA0\x26\x00\xAE\x02\x00\x00\x00',
-        b'\x09\xA0\x27\x00\xAA\x03\x00\x00\x00',
-        b'\x09\xA0\x28\x00\x70\x03\x00\x00\x00',
-        b'\x09\xA0\x29\x00\x07\x02\x00\x00\x00',
-        b'\x09\xA0\x2A\x00\xD4\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x2B\x00\x92\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x2C\x00\x01\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x2D\x00\xBB\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x2E\x00\xE6\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x2F\x00\x36\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x30\x00\xEB\x01\x00\x00\x00',
-        b'\x09\xA0\x31\x00\x22\x04\x00\x00\x00',
-        b'\x09\xA0\x32\x00\x0B\x05\x00\x00\x00',
-        b'\x09\xA0\x33\x00\x49\x04\x00\x00\x00',
-        b'\x09\xA0\x34\x00\xFF\x01\x00\x00\x00',
-        b'\x09\xA0\x35\x00\xE6\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x36\x00\xFF\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x37\x00\x4F\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x38\x00\x7A\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x39\x00\x90\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x3A\x00\xF2\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x3B\x00\x8C\x03\x00\x00\x00',
-        b'\x09\xA0\x3C\x00\x20\x06\x00\x00\x00',
-        b'\x09\xA0\x3D\x00\xBF\x06\x00\x00\x00',
-        b'\x09\xA0\x3E\x00\x13\x05\x00\x00\x00',
-        b'\x09\xA0\x3F\x00\x91\x01\x00\x00\x00',
-        b'\x09\xA0\x40\x00\x4F\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x41\x00\xBE\xF9\xFF\xFF\x00',
-        b'\x09\xA0\x42\x00\x1F\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x43\x00\x21\xF9\xFF\xFF\x00',
-        b'\x09\xA0\x44\x00\x90\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x45\x00\x61\x01\x00\x00\x00',
-        b'\x09\xA0\x46\x00\x00\x06\x00\x00\x00',
-        b'\x09\xA0\x47\x00\xD2\x08\x00\x00\x00',
-        b'\x09\xA0\x48\x00\xC2\x08\x00\x00\x00',
-        b'\x09\xA0\x49\x00\xAC\x05\x00\x00\x00',
-        b'\x09\xA0\x4A\x00\x71\x00\x00\x00\x00',
-        b'\x09\xA0\x4B\x00\xC1\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x4C\x00\x89\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x4D\x00\x58\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x4E\x00\xC2\xF7\xFF\xFF\x00',
-        b'\x09\xA0\x4F\x00\x2C\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x50\x00\xE5\x03\x00\x00\x00',
-        b'\x09\xA0\x51\x00\xAF\x09\x00\x00\x00',
-        b'\x09\xA0\x52\x00\x7B\x0C\x00\x00\x00',
-        b'\x09\xA0\x53\x00\x21\x0B\x00\x00\x00',
-        b'\x09\xA0\x54\x00\xD6\x05\x00\x00\x00',
-        b'\x09\xA0\x55\x00\x2F\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x56\x00\xAA\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x57\x00\xE4\xF1\xFF\xFF\x00',
-        b'\x09\xA0\x58\x00\xB3\xF1\xFF\xFF\x00',
-        b'\x09\xA0\x59\x00\x76\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x5A\x00\xDC\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x5B\x00\x3D\x08\x00\x00\x00',
-        b'\x09\xA0\x5C\x00\x6A\x0F\x00\x00\x00',
-        b'\x09\xA0\x5D\x00\xBD\x11\x00\x00\x00',
-        b'\x09\xA0\x5E\x00\x0D\x0E\x00\x00\x00',
-        b'\x09\xA0\x5F\x00\x32\x05\x00\x00\x00',
-        b'\x09\xA0\x60\x00\xDA\xF9\xFF\xFF\x00',
-        b'\x09\xA0\x61\x00\xC6\xEF\xFF\xFF\x00',
-        b'\x09\xA0\x62\x00\x90\xEA\xFF\xFF\x00',
-        b'\x09\xA0\x63\x00\x6D\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x64\x00\x4C\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x65\x00\xB0\x02\x00\x00\x00',
-        b'\x09\xA0\x66\x00\x51\x10\x00\x00\x00',
-        b'\x09\xA0\x67\x00\x77\x19\x00\x00\x00',
-        b'\x09\xA0\x68\x00\x83\x1A\x00\x00\x00',
-        b'\x09\xA0\x69\x00\x52\x12\x00\x00\x00',
-        b'\x09\xA0\x6A\x00\xD4\x02\x00\x00\x00',
-        b'\x09\xA0\x6B\x00\xB2\xF0\xFF\xFF\x00',
-        b'\x09\xA0\x6C\x00\xFC\xE1\xFF\xFF\x00',
-        b'\x09\xA0\x6D\x00\x3D\xDC\xFF\xFF\x00',
-        b'\x09\xA0\x6E\x00\x88\xE2\xFF\xFF\x00',
-        b'\x09\xA0\x6F\x00\x27\xF4\xFF\xFF\x00',
-        b'\x09\xA0\x70\x00\x66\x0C\x00\x00\x00',
-        b'\x09\xA0\x71\x00\xAB\x23\x00\x00\x00',
-        b'\x09\xA0\x72\x00\x9F\x31\x00\x00\x00',
-        b'\x09\xA0\x73\x00\xE0\x2F\x00\x00\x00',
-        b'\x09\xA0\x74\x00\x5C\x1C\x00\x00\x00',
-        b'\x09\xA0\x75\x00\xAA\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x76\x00\xC8\xD3\xFF\xFF\x00',
-        b'\x09\xA0\x77\x00\x39\xB4\xFF\xFF\x00',
-        b'\x09\xA0\x78\x00\xDF\xA8\xFF\xFF\x00',
-        b'\x09\xA0\x79\x00\x64\xBB\xFF\xFF\x00',
-        b'\x09\xA0\x7A\x00\x2E\xEF\xFF\xFF\x00',
-        b'\x09\xA0\x7B\x00\xBF\x3F\x00\x00\x00',
-        b'\x09\xA0\x7C\x00\x11\xA1\x00\x00\x00',
-        b'\x09\xA0\x7D\x00\xF7\x01\x01\x00\x00',
-        b'\x09\xA0\x7E\x00\xE3\x4F\x01\x00\x00',
-        b'\x09\xA0\x7F\x00\x47\x7B\x01\x00\x00',
-        b'\x09\xA0\x80\x00\x47\x7B\x01\x00\x00',
-        b'\x09\xA0\x81\x00\xE3\x4F\x01\x00\x00',
-        b'\x09\xA0\x82\x00\xF7\x01\x01\x00\x00',
-        b'\x09\xA0\x83\x00\x11\xA1\x00\x00\x00',
-        b'\x09\xA0\x84\x00\xBF\x3F\x00\x00\x00',
-        b'\x09\xA0\x85\x00\x2E\xEF\xFF\xFF\x00',
-        b'\x09\xA0\x86\x00\x64\xBB\xFF\xFF\x00',
-        b'\x09\xA0\x87\x00\xDF\xA8\xFF\xFF\x00',
-        b'\x09\xA0\x88\x00\x39\xB4\xFF\xFF\x00',
-        b'\x09\xA0\x89\x00\xC8\xD3\xFF\xFF\x00',
-        b'\x09\xA0\x8A\x00\xAA\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x8B\x00\x5C\x1C\x00\x00\x00',
-        b'\x09\xA0\x8C\x00\xE0\x2F\x00\x00\x00',
-        b'\x09\xA0\x8D\x00\x9F\x31\x00\x00\x00',
-        b'\x09\xA0\x8E\x00\xAB\x23\x00\x00\x00',
-        b'\x09\xA0\x8F\x00\x66\x0C\x00\x00\x00',
-        b'\x09\xA0\x90\x00\x27\xF4\xFF\xFF\x00',
-        b'\x09\xA0\x91\x00\x88\xE2\xFF\xFF\x00',
-        b'\x09\xA0\x92\x00\x3D\xDC\xFF\xFF\x00',
-        b'\x09\xA0\x93\x00\xFC\xE1\xFF\xFF\x00',
-        b'\x09\xA0\x94\x00\xB2\xF0\xFF\xFF\x00',
-        b'\x09\xA0\x95\x00\xD4\x02\x00\x00\x00',
-        b'\x09\xA0\x96\x00\x52\x12\x00\x00\x00',
-        b'\x09\xA0\x97\x00\x83\x1A\x00\x00\x00',
-        b'\x09\xA0\x98\x00\x77\x19\x00\x00\x00',
-        b'\x09\xA0\x99\x00\x51\x10\x00\x00\x00',
-        b'\x09\xA0\x9A\x00\xB0\x02\x00\x00\x00',
-        b'\x09\xA0\x9B\x00\x4C\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x9C\x00\x6D\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x9D\x00\x90\xEA\xFF\xFF\x00',
-        b'\x09\xA0\x9E\x00\xC6\xEF\xFF\xFF\x00',
-        b'\x09\xA0\x9F\x00\xDA\xF9\xFF\xFF\x00',
-        b'\x09\xA0\xA0\x00\x32\x05\x00\x00\x00',
-        b'\x09\xA0\xA1\x00\x0D\x0E\x00\x00\x00',
-        b'\x09\xA0\xA2\x00\xBD\x11\x00\x00\x00',
-        b'\x09\xA0\xA3\x00\x6A\x0F\x00\x00\x00',
-        b'\x09\xA0\xA4\x00\x3D\x08\x00\x00\x00',
-        b'\x09\xA0\xA5\x00\xDC\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xA6\x00\x76\xF6\xFF\xFF\x00',
-        b'\x09\xA0\xA7\x00\xB3\xF1\xFF\xFF\x00',
-        b'\x09\xA0\xA8\x00\xE4\xF1\xFF\xFF\x00',
-        b'\x09\xA0\xA9\x00\xAA\xF6\xFF\xFF\x00',
-        b'\x09\xA0\xAA\x00\x2F\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xAB\x00\xD6\x05\x00\x00\x00',
-        b'\x09\xA0\xAC\x00\x21\x0B\x00\x00\x00',
-        b'\x09\xA0\xAD\x00\x7B\x0C\x00\x00\x00',
-        b'\x09\xA0\xAE\x00\xAF\x09\x00\x00\x00',
-        b'\x09\xA0\xAF\x00\xE5\x03\x00\x00\x00',
-        b'\x09\xA0\xB0\x00\x2C\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xB1\x00\xC2\xF7\xFF\xFF\x00',
-        b'\x09\xA0\xB2\x00\x58\xF5\xFF\xFF\x00',
-        b'\x09\xA0\xB3\x00\x89\xF6\xFF\xFF\x00',
-        b'\x09\xA0\xB4\x00\xC1\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xB5\x00\x71\x00\x00\x00\x00',
-        b'\x09\xA0\xB6\x00\xAC\x05\x00\x00\x00',
-        b'\x09\xA0\xB7\x00\xC2\x08\x00\x00\x00',
-        b'\x09\xA0\xB8\x00\xD2\x08\x00\x00\x00',
-        b'\x09\xA0\xB9\x00\x00\x06\x00\x00\x00',
-        b'\x09\xA0\xBA\x00\x61\x01\x00\x00\x00',
-        b'\x09\xA0\xBB\x00\x90\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xBC\x00\x21\xF9\xFF\xFF\x00',
-        b'\x09\xA0\xBD\x00\x1F\xF8\xFF\xFF\x00',
-        b'\x09\xA0\xBE\x00\xBE\xF9\xFF\xFF\x00',
-        b'\x09\xA0\xBF\x00\x4F\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xC0\x00\x91\x01\x00\x00\x00',
-        b'\x09\xA0\xC1\x00\x13\x05\x00\x00\x00',
-        b'\x09\xA0\xC2\x00\xBF\x06\x00\x00\x00',
-        b'\x09\xA0\xC3\x00\x20\x06\x00\x00\x00',
-        b'\x09\xA0\xC4\x00\x8C\x03\x00\x00\x00',
-        b'\x09\xA0\xC5\x00\xF2\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xC6\x00\x90\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xC7\x00\x7A\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xC8\x00\x4F\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xC9\x00\xFF\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xCA\x00\xE6\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xCB\x00\xFF\x01\x00\x00\x00',
-        b'\x09\xA0\xCC\x00\x49\x04\x00\x00\x00',
-        b'\x09\xA0\xCD\x00\x0B\x05\x00\x00\x00',
-        b'\x09\xA0\xCE\x00\x22\x04\x00\x00\x00',
-        b'\x09\xA0\xCF\x00\xEB\x01\x00\x00\x00',
-        b'\x09\xA0\xD0\x00\x36\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xD1\x00\xE6\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xD2\x00\xBB\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xD3\x00\x01\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xD4\x00\x92\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xD5\x00\xD4\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xD6\x00\x07\x02\x00\x00\x00',
-        b'\x09\xA0\xD7\x00\x70\x03\x00\x00\x00',
-        b'\x09\xA0\xD8\x00\xAA\x03\x00\x00\x00',
-        b'\x09\xA0\xD9\x00\xAE\x02\x00\x00\x00',
-        b'\x09\xA0\xDA\x00\xE4\x00\x00\x00\x00',
-        b'\x09\xA0\xDB\x00\xE6\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xDC\x00\x64\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xDD\x00\xCB\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xDE\x00\x4A\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xDF\x00\x9D\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xE0\x00\x58\x00\x00\x00\x00',
-        b'\x09\xA0\xE1\x00\xD7\x01\x00\x00\x00',
-        b'\x09\xA0\xE2\x00\xB1\x02\x00\x00\x00',
-        b'\x09\xA0\xE3\x00\x97\x02\x00\x00\x00',
-        b'\x09\xA0\xE4\x00\xAF\x01\x00\x00\x00',
-        b'\x09\xA0\xE5\x00\x3E\x00\x00\x00\x00',
-        b'\x09\xA0\xE6\x00\xD4\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xE7\x00\xD2\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xE8\x00\x9E\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xE9\x00\x26\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xEA\x00\x52\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xEB\x00\x9E\x00\x00\x00\x00',
-        b'\x09\xA0\xEC\x00\xBD\x01\x00\x00\x00',
-        b'\x09\xA0\xED\x00\x30\x02\x00\x00\x00',
-        b'\x09\xA0\xEE\x00\xFF\x01\x00\x00\x00',
-        b'\x09\xA0\xEF\x00\x0D\x01\x00\x00\x00',
-        b'\x09\xA0\xF0\x00\xDE\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF1\x00\x95\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xF2\x00\xDE\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xF3\x00\xA1\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xF4\x00\x58\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xF5\x00\x64\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF6\x00\x16\x01\x00\x00\x00',
-        b'\x09\xA0\xF7\x00\x59\x02\x00\x00\x00',
-        b'\x09\xA0\xF8\x00\xCB\x03\x00\x00\x00',
-        b'\x09\xA0\xF9\x00\x07\x04\x00\x00\x00',
-        b'\x09\xA0\xFA\x00\x8C\x04\x00\x00\x00',
-        b'\x09\xA0\xFB\x00\x57\x03\x00\x00\x00',
-        b'\x09\xA0\xFC\x00\x7E\x03\x00\x00\x00',
-        b'\x09\xA0\xFD\x00\x1E\x01\x00\x00\x00',
-        b'\x09\xA0\xFE\x00\x3C\x02\x00\x00\x00',
-        b'\x09\xA0\xFF\x00\x8D\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x00\x03\x08\x00\x00\x00\x00')
+    BWKHZ_50 = AD6620Program(
+        '9 6 4 7 20 29 4 4 0 255', '''
+          -115    572    286    894    855   1164   1031    971    601    278   -156   -424
+          -607   -546   -363    -34    269    511    560    445    158   -174   -474   -610
+          -558   -300     62    431    663    689    471     88   -355   -694   -821   -668
+          -282    228    686    938    880    519    -44   -622  -1023  -1093   -794   -202
+           491   1058   1291   1097    511   -282  -1025  -1457  -1414   -880    -14    908
+          1568   1727   1299    401   -689  -1602  -2017  -1759   -880    353   1536   2258
+          2242   1452    113  -1343  -2423  -2728  -2110   -724    997   2479   3195   2849
+          1494   -465  -2390  -3612  -3661  -2442   -292   2109   3946   4541   3597   1330
+         -1574  -4154  -5488  -5011  -2740    688   4177   6519   6787   4690    724  -3918
+         -7684  -9155  -7544  -3033   3174   9131  12703  12256   7260  -1366 -11320 -19399
+        -22305 -17564  -4306  16319  41233  66039  85987  97095  97095  85987  66039  41233
+         16319  -4306 -17564 -22305 -19399 -11320  -1366   7260  12256  12703   9131   3174
+         -3033  -7544  -9155  -7684  -3918    724   4690   6787   6519   4177    688  -2740
+         -5011  -5488  -4154  -1574   1330   3597   4541   3946   2109   -292  -2442  -3661
+         -3612  -2390   -465   1494   2849   3195   2479    997   -724  -2110  -2728  -2423
+         -1343    113   1452   2242   2258   1536    353   -880  -1759  -2017  -1602   -689
+           401   1299   1727   1568    908    -14   -880  -1414  -1457  -1025   -282    511
+          1097   1291   1058    491   -202   -794  -1093  -1023   -622    -44    519    880
+           938    686    228   -282   -668   -821   -694   -355     88    471    689    663
+           431     62   -300   -558   -610   -474   -174    158    445    560    511    269
+           -34   -363   -546   -607   -424   -156    278    601    971   1031   1164    855
+           894    286    572   -115
+        ''')
 
-    BWKHZ_100 = (
-        b'\x09\xA0\x00\x03\x09\x00\x00\x00\x00',
-        b'\x09\xA0\x01\x03\x06\x00\x00\x00\x00',
-        b'\x09\xA0\x05\x03\x03\x00\x00\x00\x00',
-        b'\x09\xA0\x06\x03\x04\x00\x00\x00\x00',
-        b'\x09\xA0\x07\x03\x14\x00\x00\x00\x00',
-        b'\x09\xA0\x08\x03\x1D\x00\x00\x00\x00',
-        b'\x09\xA0\x09\x03\x04\x00\x00\x00\x00',
-        b'\x09\xA0\x0A\x03\x03\x00\x00\x00\x00',
-        b'\x09\xA0\x0B\x03\x00\x00\x00\x00\x00',
-        b'\x09\xA0\x0C\x03\xFF\x00\x00\x00\x00',
-        b'\x09\xA0\x00\x00\x6F\x00\x00\x00\x00',
-        b'\x09\xA0\x01\x00\x6C\x00\x00\x00\x00',
-        b'\x09\xA0\x02\x00\xC5\x00\x00\x00\x00',
-        b'\x09\xA0\x03\x00\x96\x00\x00\x00\x00',
-        b'\x09\xA0\x04\x00\x45\x00\x00\x00\x00',
-        b'\x09\xA0\x05\x00\x6A\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x06\x00\x6B\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x07\x00\x59\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x08\x00\xB1\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x09\x00\x9E\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x0A\x00\x4F\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x0B\x00\x84\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x0C\x00\xE9\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x0D\x00\xF4\x00\x00\x00\x00',
-        b'\x09\xA0\x0E\x00\x51\x01\x00\x00\x00',
-        b'\x09\xA0\x0F\x00\xDE\x00\x00\x00\x00',
-        b'\x09\xA0\x10\x00\xE5\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x11\x00\xDE\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x12\x00\x53\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x13\x00\x8D\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x14\x00\x7D\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x15\x00\xB0\x00\x00\x00\x00',
-        b'\x09\xA0\x16\x00\x92\x01\x00\x00\x00',
-        b'\x09\xA0\x17\x00\xAA\x01\x00\x00\x00',
-        b'\x09\xA0\x18\x00\xE3\x00\x00\x00\x00',
-        b'\x09\xA0\x19\x00\x95\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x1A\x00\x6A\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x1B\x00\xFD\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x1C\x00\x97\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x1D\x00\xF8\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x1E\x00\x76\x01\x00\x00\x00',
-        b'\x09\xA0\x1F\x00\x4A\x02\x00\x00\x00',
-        b'\x09\xA0\x20\x00\xF8\x01\x00\x00\x00',
-        b'\x09\xA0\x21\x00\x95\x00\x00\x00\x00',
-        b'\x09\xA0\x22\x00\xCB\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x23\x00\x81\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x24\x00\x71\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x25\x00\xBA\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x26\x00\xC7\x00\x00\x00\x00',
-        b'\x09\xA0\x27\x00\x91\x02\x00\x00\x00',
-        b'\x09\xA0\x28\x00\x21\x03\x00\x00\x00',
-        b'\x09\xA0\x29\x00\x13\x02\x00\x00\x00',
-        b'\x09\xA0\x2A\x00\xD9\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x2B\x00\x8A\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x2C\x00\x5F\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x2D\x00\x0A\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x2E\x00\x53\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x2F\x00\x21\x02\x00\x00\x00',
-        b'\x09\xA0\x30\x00\x00\x04\x00\x00\x00',
-        b'\x09\xA0\x31\x00\xE2\x03\x00\x00\x00',
-        b'\x09\xA0\x32\x00\xB3\x01\x00\x00\x00',
-        b'\x09\xA0\x33\x00\x76\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x34\x00\xD1\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x35\x00\x35\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x36\x00\x1A\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x37\x00\xAA\x00\x00\x00\x00',
-        b'\x09\xA0\x38\x00\x1E\x04\x00\x00\x00',
-        b'\x09\xA0\x39\x00\x9E\x05\x00\x00\x00',
-        b'\x09\xA0\x3A\x00\x3D\x04\x00\x00\x00',
-        b'\x09\xA0\x3B\x00\x83\x00\x00\x00\x00',
-        b'\x09\xA0\x3C\x00\x44\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x3D\x00\xB8\xF9\xFF\xFF\x00',
-        b'\x09\xA0\x3E\x00\x57\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x3F\x00\x03\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x40\x00\xFD\x02\x00\x00\x00',
-        b'\x09\xA0\x41\x00\xB4\x06\x00\x00\x00',
-        b'\x09\xA0\x42\x00\x1A\x07\x00\x00\x00',
-        b'\x09\xA0\x43\x00\xBF\x03\x00\x00\x00',
-        b'\x09\xA0\x44\x00\x2D\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x45\x00\x35\xF9\xFF\xFF\x00',
-        b'\x09\xA0\x46\x00\x86\xF7\xFF\xFF\x00',
-        b'\x09\xA0\x47\x00\x3E\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x48\x00\x35\x00\x00\x00\x00',
-        b'\x09\xA0\x49\x00\x75\x06\x00\x00\x00',
-        b'\x09\xA0\x4A\x00\xAF\x09\x00\x00\x00',
-        b'\x09\xA0\x4B\x00\xF6\x07\x00\x00\x00',
-        b'\x09\xA0\x4C\x00\xE1\x01\x00\x00\x00',
-        b'\x09\xA0\x4D\x00\x64\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x4E\x00\x63\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x4F\x00\xB6\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x50\x00\x8C\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x51\x00\x28\x04\x00\x00\x00',
-        b'\x09\xA0\x52\x00\x23\x0B\x00\x00\x00',
-        b'\x09\xA0\x53\x00\xA6\x0C\x00\x00\x00',
-        b'\x09\xA0\x54\x00\x82\x07\x00\x00\x00',
-        b'\x09\xA0\x55\x00\xFD\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x56\x00\xE1\xF4\xFF\xFF\x00',
-        b'\x09\xA0\x57\x00\x11\xF1\xFF\xFF\x00',
-        b'\x09\xA0\x58\x00\xFA\xF4\xFF\xFF\x00',
-        b'\x09\xA0\x59\x00\x13\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x5A\x00\x69\x0A\x00\x00\x00',
-        b'\x09\xA0\x5B\x00\x02\x11\x00\x00\x00',
-        b'\x09\xA0\x5C\x00\xFB\x0E\x00\x00\x00',
-        b'\x09\xA0\x5D\x00\xC2\x04\x00\x00\x00',
-        b'\x09\xA0\x5E\x00\x30\xF7\xFF\xFF\x00',
-        b'\x09\xA0\x5F\x00\x47\xED\xFF\xFF\x00',
-        b'\x09\xA0\x60\x00\xA4\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x61\x00\x5F\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x62\x00\x1B\x06\x00\x00\x00',
-        b'\x09\xA0\x63\x00\xE5\x13\x00\x00\x00',
-        b'\x09\xA0\x64\x00\x27\x18\x00\x00\x00',
-        b'\x09\xA0\x65\x00\xBE\x0F\x00\x00\x00',
-        b'\x09\xA0\x66\x00\x0B\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x67\x00\xB9\xEB\xFF\xFF\x00',
-        b'\x09\xA0\x68\x00\x9B\xE2\xFF\xFF\x00',
-        b'\x09\xA0\x69\x00\x89\xE8\xFF\xFF\x00',
-        b'\x09\xA0\x6A\x00\xDA\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x6B\x00\x88\x13\x00\x00\x00',
-        b'\x09\xA0\x6C\x00\x3A\x23\x00\x00\x00',
-        b'\x09\xA0\x6D\x00\x7E\x21\x00\x00\x00',
-        b'\x09\xA0\x6E\x00\x2B\x0D\x00\x00\x00',
-        b'\x09\xA0\x6F\x00\xF3\xEE\xFF\xFF\x00',
-        b'\x09\xA0\x70\x00\xFD\xD5\xFF\xFF\x00',
-        b'\x09\xA0\x71\x00\xAA\xD0\xFF\xFF\x00',
-        b'\x09\xA0\x72\x00\xD7\xE4\xFF\xFF\x00',
-        b'\x09\xA0\x73\x00\x8B\x0B\x00\x00\x00',
-        b'\x09\xA0\x74\x00\xB6\x32\x00\x00\x00',
-        b'\x09\xA0\x75\x00\xDB\x44\x00\x00\x00',
-        b'\x09\xA0\x76\x00\xAC\x33\x00\x00\x00',
-        b'\x09\xA0\x77\x00\xB8\x00\x00\x00\x00',
-        b'\x09\xA0\x78\x00\xC4\xBF\xFF\xFF\x00',
-        b'\x09\xA0\x79\x00\xDB\x90\xFF\xFF\x00',
-        b'\x09\xA0\x7A\x00\xE1\x93\xFF\xFF\x00',
-        b'\x09\xA0\x7B\x00\x85\xDA\xFF\xFF\x00',
-        b'\x09\xA0\x7C\x00\x9C\x5E\x00\x00\x00',
-        b'\x09\xA0\x7D\x00\x7C\x01\x01\x00\x00',
-        b'\x09\xA0\x7E\x00\x4F\x95\x01\x00\x00',
-        b'\x09\xA0\x7F\x00\x10\xED\x01\x00\x00',
-        b'\x09\xA0\x80\x00\x10\xED\x01\x00\x00',
-        b'\x09\xA0\x81\x00\x4F\x95\x01\x00\x00',
-        b'\x09\xA0\x82\x00\x7C\x01\x01\x00\x00',
-        b'\x09\xA0\x83\x00\x9C\x5E\x00\x00\x00',
-        b'\x09\xA0\x84\x00\x85\xDA\xFF\xFF\x00',
-        b'\x09\xA0\x85\x00\xE1\x93\xFF\xFF\x00',
-        b'\x09\xA0\x86\x00\xDB\x90\xFF\xFF\x00',
-        b'\x09\xA0\x87\x00\xC4\xBF\xFF\xFF\x00',
-        b'\x09\xA0\x88\x00\xB8\x00\x00\x00\x00',
-        b'\x09\xA0\x89\x00\xAC\x33\x00\x00\x00',
-        b'\x09\xA0\x8A\x00\xDB\x44\x00\x00\x00',
-        b'\x09\xA0\x8B\x00\xB6\x32\x00\x00\x00',
-        b'\x09\xA0\x8C\x00\x8B\x0B\x00\x00\x00',
-        b'\x09\xA0\x8D\x00\xD7\xE4\xFF\xFF\x00',
-        b'\x09\xA0\x8E\x00\xAA\xD0\xFF\xFF\x00',
-        b'\x09\xA0\x8F\x00\xFD\xD5\xFF\xFF\x00',
-        b'\x09\xA0\x90\x00\xF3\xEE\xFF\xFF\x00',
-        b'\x09\xA0\x91\x00\x2B\x0D\x00\x00\x00',
-        b'\x09\xA0\x92\x00\x7E\x21\x00\x00\x00',
-        b'\x09\xA0\x93\x00\x3A\x23\x00\x00\x00',
-        b'\x09\xA0\x94\x00\x88\x13\x00\x00\x00',
-        b'\x09\xA0\x95\x00\xDA\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x96\x00\x89\xE8\xFF\xFF\x00',
-        b'\x09\xA0\x97\x00\x9B\xE2\xFF\xFF\x00',
-        b'\x09\xA0\x98\x00\xB9\xEB\xFF\xFF\x00',
-        b'\x09\xA0\x99\x00\x0B\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x9A\x00\xBE\x0F\x00\x00\x00',
-        b'\x09\xA0\x9B\x00\x27\x18\x00\x00\x00',
-        b'\x09\xA0\x9C\x00\xE5\x13\x00\x00\x00',
-        b'\x09\xA0\x9D\x00\x1B\x06\x00\x00\x00',
-        b'\x09\xA0\x9E\x00\x5F\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x9F\x00\xA4\xEC\xFF\xFF\x00',
-        b'\x09\xA0\xA0\x00\x47\xED\xFF\xFF\x00',
-        b'\x09\xA0\xA1\x00\x30\xF7\xFF\xFF\x00',
-        b'\x09\xA0\xA2\x00\xC2\x04\x00\x00\x00',
-        b'\x09\xA0\xA3\x00\xFB\x0E\x00\x00\x00',
-        b'\x09\xA0\xA4\x00\x02\x11\x00\x00\x00',
-        b'\x09\xA0\xA5\x00\x69\x0A\x00\x00\x00',
-        b'\x09\xA0\xA6\x00\x13\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xA7\x00\xFA\xF4\xFF\xFF\x00',
-        b'\x09\xA0\xA8\x00\x11\xF1\xFF\xFF\x00',
-        b'\x09\xA0\xA9\x00\xE1\xF4\xFF\xFF\x00',
-        b'\x09\xA0\xAA\x00\xFD\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xAB\x00\x82\x07\x00\x00\x00',
-        b'\x09\xA0\xAC\x00\xA6\x0C\x00\x00\x00',
-        b'\x09\xA0\xAD\x00\x23\x0B\x00\x00\x00',
-        b'\x09\xA0\xAE\x00\x28\x04\x00\x00\x00',
-        b'\x09\xA0\xAF\x00\x8C\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xB0\x00\xB6\xF5\xFF\xFF\x00',
-        b'\x09\xA0\xB1\x00\x63\xF5\xFF\xFF\x00',
-        b'\x09\xA0\xB2\x00\x64\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xB3\x00\xE1\x01\x00\x00\x00',
-        b'\x09\xA0\xB4\x00\xF6\x07\x00\x00\x00',
-        b'\x09\xA0\xB5\x00\xAF\x09\x00\x00\x00',
-        b'\x09\xA0\xB6\x00\x75\x06\x00\x00\x00',
-        b'\x09\xA0\xB7\x00\x35\x00\x00\x00\x00',
-        b'\x09\xA0\xB8\x00\x3E\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xB9\x00\x86\xF7\xFF\xFF\x00',
-        b'\x09\xA0\xBA\x00\x35\xF9\xFF\xFF\x00',
-        b'\x09\xA0\xBB\x00\x2D\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xBC\x00\xBF\x03\x00\x00\x00',
-        b'\x09\xA0\xBD\x00\x1A\x07\x00\x00\x00',
-        b'\x09\xA0\xBE\x00\xB4\x06\x00\x00\x00',
-        b'\x09\xA0\xBF\x00\xFD\x02\x00\x00\x00',
-        b'\x09\xA0\xC0\x00\x03\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xC1\x00\x57\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xC2\x00\xB8\xF9\xFF\xFF\x00',
-        b'\x09\xA0\xC3\x00\x44\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xC4\x00\x83\x00\x00\x00\x00',
-        b'\x09\xA0\xC5\x00\x3D\x04\x00\x00\x00',
-        b'\x09\xA0\xC6\x00\x9E\x05\x00\x00\x00',
-        b'\x09\xA0\xC7\x00\x1E\x04\x00\x00\x00',
-        b'\x09\xA0\xC8\x00\xAA\x00\x00\x00\x00',
-        b'\x09\xA0\xC9\x00\x1A\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xCA\x00\x35\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xCB\x00\xD1\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xCC\x00\x76\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xCD\x00\xB3\x01\x00\x00\x00',
-        b'\x09\xA0\xCE\x00\xE2\x03\x00\x00\x00',
-        b'\x09\xA0\xCF\x00\x00\x04\x00\x00\x00',
-        b'\x09\xA0\xD0\x00\x21\x02\x00\x00\x00',
-        b'\x09\xA0\xD1\x00\x53\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xD2\x00\x0A\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xD3\x00\x5F\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xD4\x00\x8A\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xD5\x00\xD9\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xD6\x00\x13\x02\x00\x00\x00',
-        b'\x09\xA0\xD7\x00\x21\x03\x00\x00\x00',
-        b'\x09\xA0\xD8\x00\x91\x02\x00\x00\x00',
-        b'\x09\xA0\xD9\x00\xC7\x00\x00\x00\x00',
-        b'\x09\xA0\xDA\x00\xBA\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xDB\x00\x71\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xDC\x00\x81\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xDD\x00\xCB\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xDE\x00\x95\x00\x00\x00\x00',
-        b'\x09\xA0\xDF\x00\xF8\x01\x00\x00\x00',
-        b'\x09\xA0\xE0\x00\x4A\x02\x00\x00\x00',
-        b'\x09\xA0\xE1\x00\x76\x01\x00\x00\x00',
-        b'\x09\xA0\xE2\x00\xF8\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE3\x00\x97\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xE4\x00\xFD\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xE5\x00\x6A\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xE6\x00\x95\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE7\x00\xE3\x00\x00\x00\x00',
-        b'\x09\xA0\xE8\x00\xAA\x01\x00\x00\x00',
-        b'\x09\xA0\xE9\x00\x92\x01\x00\x00\x00',
-        b'\x09\xA0\xEA\x00\xB0\x00\x00\x00\x00',
-        b'\x09\xA0\xEB\x00\x7D\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xEC\x00\x8D\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xED\x00\x53\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xEE\x00\xDE\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xEF\x00\xE5\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF0\x00\xDE\x00\x00\x00\x00',
-        b'\x09\xA0\xF1\x00\x51\x01\x00\x00\x00',
-        b'\x09\xA0\xF2\x00\xF4\x00\x00\x00\x00',
-        b'\x09\xA0\xF3\x00\xE9\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xF4\x00\x84\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xF5\x00\x4F\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xF6\x00\x9E\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xF7\x00\xB1\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xF8\x00\x59\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xF9\x00\x6B\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xFA\x00\x6A\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xFB\x00\x45\x00\x00\x00\x00',
-        b'\x09\xA0\xFC\x00\x96\x00\x00\x00\x00',
-        b'\x09\xA0\xFD\x00\xC5\x00\x00\x00\x00',
-        b'\x09\xA0\xFE\x00\x6C\x00\x00\x00\x00',
-        b'\x09\xA0\xFF\x00\x6F\x00\x00\x00\x00',
-        b'\x09\xA0\x00\x03\x08\x00\x00\x00\x00')
+    BWKHZ_100 = AD6620Program(
+        '9 6 3 4 20 29 4 3 0 255', '''
+           111    108    197    150     69   -150   -405   -679   -847   -866   -689   -380
+           -23    244    337    222    -27   -290   -429   -371   -131    176    402    426
+           227   -107   -406   -515   -361     -8    374    586    504    149   -309   -639
+          -655   -326    199    657    801    531    -39   -630   -929   -758   -173    545
+          1024    994    435   -394  -1071  -1227   -742    170   1054   1438   1085    131
+          -956  -1608  -1449   -509    765   1716   1818    959   -467  -1739  -2170  -1474
+            53   1653   2479   2038    481  -1436  -2717  -2634  -1140   1064   2851   3238
+          1922   -515  -2847  -3823  -2822   -237   2665   4354   3835   1218  -2256  -4793
+         -4956  -2465   1563   5093   6183   4030   -501  -5191  -7525  -6007  -1062   5000
+          9018   8574   3371  -4365 -10755 -12118  -6953   2955  12982  17627  13228    184
+        -16444 -28453 -27679  -9595  24220  65916 103759 126224 126224 103759  65916  24220
+         -9595 -27679 -28453 -16444    184  13228  17627  12982   2955  -6953 -12118 -10755
+         -4365   3371   8574   9018   5000  -1062  -6007  -7525  -5191   -501   4030   6183
+          5093   1563  -2465  -4956  -4793  -2256   1218   3835   4354   2665   -237  -2822
+         -3823  -2847   -515   1922   3238   2851   1064  -1140  -2634  -2717  -1436    481
+          2038   2479   1653     53  -1474  -2170  -1739   -467    959   1818   1716    765
+          -509  -1449  -1608   -956    131   1085   1438   1054    170   -742  -1227  -1071
+          -394    435    994   1024    545   -173   -758   -929   -630    -39    531    801
+           657    199   -326   -655   -639   -309    149    504    586    374     -8   -361
+          -515   -406   -107    227    426    402    176   -131   -371   -429   -290    -27
+           222    337    244    -23   -380   -689   -866   -847   -679   -405   -150     69
+           150    197    108    111
+        ''')
 
-    BWKHZ_150 = (
-        b'\x09\xA0\x00\x03\x09\x00\x00\x00\x00',
-        b'\x09\xA0\x01\x03\x06\x00\x00\x00\x00',
-        b'\x09\xA0\x05\x03\x03\x00\x00\x00\x00',
-        b'\x09\xA0\x06\x03\x04\x00\x00\x00\x00',
-        b'\x09\xA0\x07\x03\x14\x00\x00\x00\x00',
-        b'\x09\xA0\x08\x03\x1B\x00\x00\x00\x00',
-        b'\x09\xA0\x09\x03\x04\x00\x00\x00\x00',
-        b'\x09\xA0\x0A\x03\x02\x00\x00\x00\x00',
-        b'\x09\xA0\x0B\x03\x00\x00\x00\x00\x00',
-        b'\x09\xA0\x0C\x03\xFF\x00\x00\x00\x00',
-        b'\x09\xA0\x00\x00\x50\x00\x00\x00\x00',
-        b'\x09\xA0\x01\x00\x08\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x02\x00\x23\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x03\x00\x36\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x04\x00\x35\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x05\x00\x2B\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x06\x00\xE1\x00\x00\x00\x00',
-        b'\x09\xA0\x07\x00\xD9\x03\x00\x00\x00',
-        b'\x09\xA0\x08\x00\x29\x04\x00\x00\x00',
-        b'\x09\xA0\x09\x00\xDA\x00\x00\x00\x00',
-        b'\x09\xA0\x0A\x00\xB7\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x0B\x00\x7F\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x0C\x00\x9D\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x0D\x00\x93\x01\x00\x00\x00',
-        b'\x09\xA0\x0E\x00\x2B\x03\x00\x00\x00',
-        b'\x09\xA0\x0F\x00\xB0\x01\x00\x00\x00',
-        b'\x09\xA0\x10\x00\xD4\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x11\x00\xF7\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x12\x00\x08\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x13\x00\xDD\x00\x00\x00\x00',
-        b'\x09\xA0\x14\x00\x03\x03\x00\x00\x00',
-        b'\x09\xA0\x15\x00\x49\x02\x00\x00\x00',
-        b'\x09\xA0\x16\x00\x6F\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x17\x00\xF8\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x18\x00\x5C\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x19\x00\x3D\x00\x00\x00\x00',
-        b'\x09\xA0\x1A\x00\x0F\x03\x00\x00\x00',
-        b'\x09\xA0\x1B\x00\x09\x03\x00\x00\x00',
-        b'\x09\xA0\x1C\x00\x24\x00\x00\x00\x00',
-        b'\x09\xA0\x1D\x00\xF0\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x1E\x00\x8C\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x1F\x00\x6B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x20\x00\x06\x03\x00\x00\x00',
-        b'\x09\xA0\x21\x00\xE4\x03\x00\x00\x00',
-        b'\x09\xA0\x22\x00\x17\x01\x00\x00\x00',
-        b'\x09\xA0\x23\x00\x13\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x24\x00\xAC\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x25\x00\x55\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x26\x00\xC2\x02\x00\x00\x00',
-        b'\x09\xA0\x27\x00\xC1\x04\x00\x00\x00',
-        b'\x09\xA0\x28\x00\x4F\x02\x00\x00\x00',
-        b'\x09\xA0\x29\x00\x7F\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x2A\x00\xD7\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x2B\x00\xFC\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x2C\x00\x29\x02\x00\x00\x00',
-        b'\x09\xA0\x2D\x00\x87\x05\x00\x00\x00',
-        b'\x09\xA0\x2E\x00\xC8\x03\x00\x00\x00',
-        b'\x09\xA0\x2F\x00\x4B\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x30\x00\x28\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x31\x00\x67\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x32\x00\x25\x01\x00\x00\x00',
-        b'\x09\xA0\x33\x00\x18\x06\x00\x00\x00',
-        b'\x09\xA0\x34\x00\x76\x05\x00\x00\x00',
-        b'\x09\xA0\x35\x00\x89\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x36\x00\xBE\xF9\xFF\xFF\x00',
-        b'\x09\xA0\x37\x00\xA4\xF9\xFF\xFF\x00',
-        b'\x09\xA0\x38\x00\xA9\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x39\x00\x54\x06\x00\x00\x00',
-        b'\x09\xA0\x3A\x00\x47\x07\x00\x00\x00',
-        b'\x09\xA0\x3B\x00\x45\x01\x00\x00\x00',
-        b'\x09\xA0\x3C\x00\xB8\xF9\xFF\xFF\x00',
-        b'\x09\xA0\x3D\x00\xCB\xF7\xFF\xFF\x00',
-        b'\x09\xA0\x3E\x00\xAA\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x3F\x00\x1A\x06\x00\x00\x00',
-        b'\x09\xA0\x40\x00\x23\x09\x00\x00\x00',
-        b'\x09\xA0\x41\x00\x89\x03\x00\x00\x00',
-        b'\x09\xA0\x42\x00\x3A\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x43\x00\xF5\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x44\x00\x21\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x45\x00\x46\x05\x00\x00\x00',
-        b'\x09\xA0\x46\x00\xE9\x0A\x00\x00\x00',
-        b'\x09\xA0\x47\x00\x58\x06\x00\x00\x00',
-        b'\x09\xA0\x48\x00\x69\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x49\x00\x47\xF4\xFF\xFF\x00',
-        b'\x09\xA0\x4A\x00\x0C\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x4B\x00\xB3\x03\x00\x00\x00',
-        b'\x09\xA0\x4C\x00\x76\x0C\x00\x00\x00',
-        b'\x09\xA0\x4D\x00\xB4\x09\x00\x00\x00',
-        b'\x09\xA0\x4E\x00\x6C\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x4F\x00\xE7\xF2\xFF\xFF\x00',
-        b'\x09\xA0\x50\x00\x69\xF4\xFF\xFF\x00',
-        b'\x09\xA0\x51\x00\x33\x01\x00\x00\x00',
-        b'\x09\xA0\x52\x00\x9C\x0D\x00\x00\x00',
-        b'\x09\xA0\x53\x00\x9E\x0D\x00\x00\x00',
-        b'\x09\xA0\x54\x00\x76\x00\x00\x00\x00',
-        b'\x09\xA0\x55\x00\x09\xF2\xFF\xFF\x00',
-        b'\x09\xA0\x56\x00\x36\xF0\xFF\xFF\x00',
-        b'\x09\xA0\x57\x00\x8E\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x58\x00\x23\x0E\x00\x00\x00',
-        b'\x09\xA0\x59\x00\x1D\x12\x00\x00\x00',
-        b'\x09\xA0\x5A\x00\xCB\x04\x00\x00\x00',
-        b'\x09\xA0\x5B\x00\xEA\xF1\xFF\xFF\x00',
-        b'\x09\xA0\x5C\x00\x67\xEB\xFF\xFF\x00',
-        b'\x09\xA0\x5D\x00\x70\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x5E\x00\xC3\x0D\x00\x00\x00',
-        b'\x09\xA0\x5F\x00\x44\x17\x00\x00\x00',
-        b'\x09\xA0\x60\x00\xD7\x0A\x00\x00\x00',
-        b'\x09\xA0\x61\x00\xE6\xF2\xFF\xFF\x00',
-        b'\x09\xA0\x62\x00\xDA\xE5\xFF\xFF\x00',
-        b'\x09\xA0\x63\x00\x46\xF1\xFF\xFF\x00',
-        b'\x09\xA0\x64\x00\x08\x0C\x00\x00\x00',
-        b'\x09\xA0\x65\x00\x4D\x1D\x00\x00\x00',
-        b'\x09\xA0\x66\x00\x65\x13\x00\x00\x00',
-        b'\x09\xA0\x67\x00\x93\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x68\x00\x32\xDF\xFF\xFF\x00',
-        b'\x09\xA0\x69\x00\xE6\xE6\xFF\xFF\x00',
-        b'\x09\xA0\x6A\x00\x1C\x08\x00\x00\x00',
-        b'\x09\xA0\x6B\x00\xCE\x24\x00\x00\x00',
-        b'\x09\xA0\x6C\x00\x40\x20\x00\x00\x00',
-        b'\x09\xA0\x6D\x00\x35\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x6E\x00\x75\xD6\xFF\xFF\x00',
-        b'\x09\xA0\x6F\x00\x6E\xD6\xFF\xFF\x00',
-        b'\x09\xA0\x70\x00\xF5\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x71\x00\x77\x2F\x00\x00\x00',
-        b'\x09\xA0\x72\x00\x69\x36\x00\x00\x00',
-        b'\x09\xA0\x73\x00\x6D\x07\x00\x00\x00',
-        b'\x09\xA0\x74\x00\x90\xC8\xFF\xFF\x00',
-        b'\x09\xA0\x75\x00\x58\xB6\xFF\xFF\x00',
-        b'\x09\xA0\x76\x00\x44\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x77\x00\x6E\x43\x00\x00\x00',
-        b'\x09\xA0\x78\x00\xB0\x6A\x00\x00\x00',
-        b'\x09\xA0\x79\x00\xF3\x2B\x00\x00\x00',
-        b'\x09\xA0\x7A\x00\x40\xA7\xFF\xFF\x00',
-        b'\x09\xA0\x7B\x00\xD6\x4C\xFF\xFF\x00',
-        b'\x09\xA0\x7C\x00\x2C\x90\xFF\xFF\x00',
-        b'\x09\xA0\x7D\x00\xA5\x89\x00\x00\x00',
-        b'\x09\xA0\x7E\x00\x84\xD1\x01\x00\x00',
-        b'\x09\xA0\x7F\x00\x11\xB8\x02\x00\x00',
-        b'\x09\xA0\x80\x00\x11\xB8\x02\x00\x00',
-        b'\x09\xA0\x81\x00\x84\xD1\x01\x00\x00',
-        b'\x09\xA0\x82\x00\xA5\x89\x00\x00\x00',
-        b'\x09\xA0\x83\x00\x2C\x90\xFF\xFF\x00',
-        b'\x09\xA0\x84\x00\xD6\x4C\xFF\xFF\x00',
-        b'\x09\xA0\x85\x00\x40\xA7\xFF\xFF\x00',
-        b'\x09\xA0\x86\x00\xF3\x2B\x00\x00\x00',
-        b'\x09\xA0\x87\x00\xB0\x6A\x00\x00\x00',
-        b'\x09\xA0\x88\x00\x6E\x43\x00\x00\x00',
-        b'\x09\xA0\x89\x00\x44\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x8A\x00\x58\xB6\xFF\xFF\x00',
-        b'\x09\xA0\x8B\x00\x90\xC8\xFF\xFF\x00',
-        b'\x09\xA0\x8C\x00\x6D\x07\x00\x00\x00',
-        b'\x09\xA0\x8D\x00\x69\x36\x00\x00\x00',
-        b'\x09\xA0\x8E\x00\x77\x2F\x00\x00\x00',
-        b'\x09\xA0\x8F\x00\xF5\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x90\x00\x6E\xD6\xFF\xFF\x00',
-        b'\x09\xA0\x91\x00\x75\xD6\xFF\xFF\x00',
-        b'\x09\xA0\x92\x00\x35\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x93\x00\x40\x20\x00\x00\x00',
-        b'\x09\xA0\x94\x00\xCE\x24\x00\x00\x00',
-        b'\x09\xA0\x95\x00\x1C\x08\x00\x00\x00',
-        b'\x09\xA0\x96\x00\xE6\xE6\xFF\xFF\x00',
-        b'\x09\xA0\x97\x00\x32\xDF\xFF\xFF\x00',
-        b'\x09\xA0\x98\x00\x93\xF5\xFF\xFF\x00',
-        b'\x09\xA0\x99\x00\x65\x13\x00\x00\x00',
-        b'\x09\xA0\x9A\x00\x4D\x1D\x00\x00\x00',
-        b'\x09\xA0\x9B\x00\x08\x0C\x00\x00\x00',
-        b'\x09\xA0\x9C\x00\x46\xF1\xFF\xFF\x00',
-        b'\x09\xA0\x9D\x00\xDA\xE5\xFF\xFF\x00',
-        b'\x09\xA0\x9E\x00\xE6\xF2\xFF\xFF\x00',
-        b'\x09\xA0\x9F\x00\xD7\x0A\x00\x00\x00',
-        b'\x09\xA0\xA0\x00\x44\x17\x00\x00\x00',
-        b'\x09\xA0\xA1\x00\xC3\x0D\x00\x00\x00',
-        b'\x09\xA0\xA2\x00\x70\xF8\xFF\xFF\x00',
-        b'\x09\xA0\xA3\x00\x67\xEB\xFF\xFF\x00',
-        b'\x09\xA0\xA4\x00\xEA\xF1\xFF\xFF\x00',
-        b'\x09\xA0\xA5\x00\xCB\x04\x00\x00\x00',
-        b'\x09\xA0\xA6\x00\x1D\x12\x00\x00\x00',
-        b'\x09\xA0\xA7\x00\x23\x0E\x00\x00\x00',
-        b'\x09\xA0\xA8\x00\x8E\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xA9\x00\x36\xF0\xFF\xFF\x00',
-        b'\x09\xA0\xAA\x00\x09\xF2\xFF\xFF\x00',
-        b'\x09\xA0\xAB\x00\x76\x00\x00\x00\x00',
-        b'\x09\xA0\xAC\x00\x9E\x0D\x00\x00\x00',
-        b'\x09\xA0\xAD\x00\x9C\x0D\x00\x00\x00',
-        b'\x09\xA0\xAE\x00\x33\x01\x00\x00\x00',
-        b'\x09\xA0\xAF\x00\x69\xF4\xFF\xFF\x00',
-        b'\x09\xA0\xB0\x00\xE7\xF2\xFF\xFF\x00',
-        b'\x09\xA0\xB1\x00\x6C\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xB2\x00\xB4\x09\x00\x00\x00',
-        b'\x09\xA0\xB3\x00\x76\x0C\x00\x00\x00',
-        b'\x09\xA0\xB4\x00\xB3\x03\x00\x00\x00',
-        b'\x09\xA0\xB5\x00\x0C\xF8\xFF\xFF\x00',
-        b'\x09\xA0\xB6\x00\x47\xF4\xFF\xFF\x00',
-        b'\x09\xA0\xB7\x00\x69\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xB8\x00\x58\x06\x00\x00\x00',
-        b'\x09\xA0\xB9\x00\xE9\x0A\x00\x00\x00',
-        b'\x09\xA0\xBA\x00\x46\x05\x00\x00\x00',
-        b'\x09\xA0\xBB\x00\x21\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xBC\x00\xF5\xF5\xFF\xFF\x00',
-        b'\x09\xA0\xBD\x00\x3A\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xBE\x00\x89\x03\x00\x00\x00',
-        b'\x09\xA0\xBF\x00\x23\x09\x00\x00\x00',
-        b'\x09\xA0\xC0\x00\x1A\x06\x00\x00\x00',
-        b'\x09\xA0\xC1\x00\xAA\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xC2\x00\xCB\xF7\xFF\xFF\x00',
-        b'\x09\xA0\xC3\x00\xB8\xF9\xFF\xFF\x00',
-        b'\x09\xA0\xC4\x00\x45\x01\x00\x00\x00',
-        b'\x09\xA0\xC5\x00\x47\x07\x00\x00\x00',
-        b'\x09\xA0\xC6\x00\x54\x06\x00\x00\x00',
-        b'\x09\xA0\xC7\x00\xA9\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xC8\x00\xA4\xF9\xFF\xFF\x00',
-        b'\x09\xA0\xC9\x00\xBE\xF9\xFF\xFF\x00',
-        b'\x09\xA0\xCA\x00\x89\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xCB\x00\x76\x05\x00\x00\x00',
-        b'\x09\xA0\xCC\x00\x18\x06\x00\x00\x00',
-        b'\x09\xA0\xCD\x00\x25\x01\x00\x00\x00',
-        b'\x09\xA0\xCE\x00\x67\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xCF\x00\x28\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xD0\x00\x4B\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xD1\x00\xC8\x03\x00\x00\x00',
-        b'\x09\xA0\xD2\x00\x87\x05\x00\x00\x00',
-        b'\x09\xA0\xD3\x00\x29\x02\x00\x00\x00',
-        b'\x09\xA0\xD4\x00\xFC\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xD5\x00\xD7\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xD6\x00\x7F\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xD7\x00\x4F\x02\x00\x00\x00',
-        b'\x09\xA0\xD8\x00\xC1\x04\x00\x00\x00',
-        b'\x09\xA0\xD9\x00\xC2\x02\x00\x00\x00',
-        b'\x09\xA0\xDA\x00\x55\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xDB\x00\xAC\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xDC\x00\x13\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xDD\x00\x17\x01\x00\x00\x00',
-        b'\x09\xA0\xDE\x00\xE4\x03\x00\x00\x00',
-        b'\x09\xA0\xDF\x00\x06\x03\x00\x00\x00',
-        b'\x09\xA0\xE0\x00\x6B\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xE1\x00\x8C\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xE2\x00\xF0\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xE3\x00\x24\x00\x00\x00\x00',
-        b'\x09\xA0\xE4\x00\x09\x03\x00\x00\x00',
-        b'\x09\xA0\xE5\x00\x0F\x03\x00\x00\x00',
-        b'\x09\xA0\xE6\x00\x3D\x00\x00\x00\x00',
-        b'\x09\xA0\xE7\x00\x5C\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xE8\x00\xF8\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xE9\x00\x6F\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xEA\x00\x49\x02\x00\x00\x00',
-        b'\x09\xA0\xEB\x00\x03\x03\x00\x00\x00',
-        b'\x09\xA0\xEC\x00\xDD\x00\x00\x00\x00',
-        b'\x09\xA0\xED\x00\x08\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xEE\x00\xF7\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xEF\x00\xD4\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xF0\x00\xB0\x01\x00\x00\x00',
-        b'\x09\xA0\xF1\x00\x2B\x03\x00\x00\x00',
-        b'\x09\xA0\xF2\x00\x93\x01\x00\x00\x00',
-        b'\x09\xA0\xF3\x00\x9D\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xF4\x00\x7F\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xF5\x00\xB7\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xF6\x00\xDA\x00\x00\x00\x00',
-        b'\x09\xA0\xF7\x00\x29\x04\x00\x00\x00',
-        b'\x09\xA0\xF8\x00\xD9\x03\x00\x00\x00',
-        b'\x09\xA0\xF9\x00\xE1\x00\x00\x00\x00',
-        b'\x09\xA0\xFA\x00\x2B\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xFB\x00\x35\xF8\xFF\xFF\x00',
-        b'\x09\xA0\xFC\x00\x36\xF6\xFF\xFF\x00',
-        b'\x09\xA0\xFD\x00\x23\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xFE\x00\x08\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xFF\x00\x50\x00\x00\x00\x00',
-        b'\x09\xA0\x00\x03\x08\x00\x00\x00\x00')
+    BWKHZ_150 = AD6620Program(
+        '9 6 3 4 20 27 4 2 0 255', '''
+            80  -1272  -1501  -2506  -1995  -1237    225    985   1065    218   -585   -897
+          -355    403    811    432   -300   -777   -504    221    771    585   -145   -776
+          -676     61    783    777     36   -784   -884   -149    774    996    279   -749
+         -1108   -427    706   1217    591   -641  -1321   -772    553   1415    968   -437
+         -1496  -1177    293   1560   1398   -119  -1602  -1628    -87   1620   1863    325
+         -1608  -2101   -598   1562   2339    905  -1478  -2571  -1247   1350   2793   1624
+         -1175  -3001  -2036    947   3190   2484   -660  -3353  -2967    307   3484   3486
+           118  -3575  -4042   -626   3619   4637   1227  -3606  -5273  -1936   3523   5956
+          2775  -3354  -6694  -3770   3080   7501   4965  -2669  -8398  -6426   2076   9422
+          8256  -1227 -10635 -10642    -11  12151  13929   1901 -14192 -18856  -5052  17262
+         27312  11251 -22720 -45866 -28628  35237 119172 178193 178193 119172  35237 -28628
+        -45866 -22720  11251  27312  17262  -5052 -18856 -14192   1901  13929  12151    -11
+        -10642 -10635  -1227   8256   9422   2076  -6426  -8398  -2669   4965   7501   3080
+         -3770  -6694  -3354   2775   5956   3523  -1936  -5273  -3606   1227   4637   3619
+          -626  -4042  -3575    118   3486   3484    307  -2967  -3353   -660   2484   3190
+           947  -2036  -3001  -1175   1624   2793   1350  -1247  -2571  -1478    905   2339
+          1562   -598  -2101  -1608    325   1863   1620    -87  -1628  -1602   -119   1398
+          1560    293  -1177  -1496   -437    968   1415    553   -772  -1321   -641    591
+          1217    706   -427  -1108   -749    279    996    774   -149   -884   -784     36
+           777    783     61   -676   -776   -145    585    771    221   -504   -777   -300
+           432    811    403   -355   -897   -585    218   1065    985    225  -1237  -1995
+         -2506  -1501  -1272     80
+        ''')
 
-    BWKHZ_190 = (
-        b'\x09\xA0\x00\x03\x09\x00\x00\x00\x00',
-        b'\x09\xA0\x01\x03\x06\x00\x00\x00\x00',
-        b'\x09\xA0\x05\x03\x05\x00\x00\x00\x00',
-        b'\x09\xA0\x06\x03\x09\x00\x00\x00\x00',
-        b'\x09\xA0\x07\x03\x10\x00\x00\x00\x00',
-        b'\x09\xA0\x08\x03\x10\x00\x00\x00\x00',
-        b'\x09\xA0\x09\x03\x04\x00\x00\x00\x00',
-        b'\x09\xA0\x0A\x03\x01\x00\x00\x00\x00',
-        b'\x09\xA0\x0B\x03\x00\x00\x00\x00\x00',
-        b'\x09\xA0\x0C\x03\xFF\x00\x00\x00\x00',
-        b'\x09\xA0\x00\x00\x77\x0D\x00\x00\x00',
-        b'\x09\xA0\x01\x00\xEF\xF4\xFF\xFF\x00',
-        b'\x09\xA0\x02\x00\x5D\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x03\x00\xEC\xF4\xFF\xFF\x00',
-        b'\x09\xA0\x04\x00\x10\x03\x00\x00\x00',
-        b'\x09\xA0\x05\x00\xFA\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x06\x00\xD9\xFD\xFF\xFF\x00',
-        b'\x09\xA0\x07\x00\x7D\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x08\x00\x8F\x02\x00\x00\x00',
-        b'\x09\xA0\x09\x00\x55\x01\x00\x00\x00',
-        b'\x09\xA0\x0A\x00\x1C\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x0B\x00\xC8\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x0C\x00\x73\x02\x00\x00\x00',
-        b'\x09\xA0\x0D\x00\x3D\x02\x00\x00\x00',
-        b'\x09\xA0\x0E\x00\x13\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x0F\x00\xD2\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x10\x00\x55\x02\x00\x00\x00',
-        b'\x09\xA0\x11\x00\xE3\x02\x00\x00\x00',
-        b'\x09\xA0\x12\x00\x11\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x13\x00\x77\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x14\x00\x2C\x02\x00\x00\x00',
-        b'\x09\xA0\x15\x00\x83\x03\x00\x00\x00',
-        b'\x09\xA0\x16\x00\x28\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x17\x00\xF4\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x18\x00\xF2\x01\x00\x00\x00',
-        b'\x09\xA0\x19\x00\x29\x04\x00\x00\x00',
-        b'\x09\xA0\x1A\x00\x5D\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x1B\x00\x5B\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x1C\x00\xA1\x01\x00\x00\x00',
-        b'\x09\xA0\x1D\x00\xD6\x04\x00\x00\x00',
-        b'\x09\xA0\x1E\x00\xB1\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x1F\x00\xB5\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x20\x00\x34\x01\x00\x00\x00',
-        b'\x09\xA0\x21\x00\x88\x05\x00\x00\x00',
-        b'\x09\xA0\x22\x00\x25\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x23\x00\x09\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x24\x00\xA7\x00\x00\x00\x00',
-        b'\x09\xA0\x25\x00\x3B\x06\x00\x00\x00',
-        b'\x09\xA0\x26\x00\xBE\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x27\x00\x5C\xF9\xFF\xFF\x00',
-        b'\x09\xA0\x28\x00\xF8\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x29\x00\xEB\x06\x00\x00\x00',
-        b'\x09\xA0\x2A\x00\x7C\x00\x00\x00\x00',
-        b'\x09\xA0\x2B\x00\xB2\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x2C\x00\x23\xFF\xFF\xFF\x00',
-        b'\x09\xA0\x2D\x00\x93\x07\x00\x00\x00',
-        b'\x09\xA0\x2E\x00\x63\x01\x00\x00\x00',
-        b'\x09\xA0\x2F\x00\x11\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x30\x00\x25\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x31\x00\x30\x08\x00\x00\x00',
-        b'\x09\xA0\x32\x00\x74\x02\x00\x00\x00',
-        b'\x09\xA0\x33\x00\x7F\xF7\xFF\xFF\x00',
-        b'\x09\xA0\x34\x00\xFC\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x35\x00\xBB\x08\x00\x00\x00',
-        b'\x09\xA0\x36\x00\xB2\x03\x00\x00\x00',
-        b'\x09\xA0\x37\x00\x00\xF7\xFF\xFF\x00',
-        b'\x09\xA0\x38\x00\xA6\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x39\x00\x2E\x09\x00\x00\x00',
-        b'\x09\xA0\x3A\x00\x1E\x05\x00\x00\x00',
-        b'\x09\xA0\x3B\x00\x9C\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x3C\x00\x20\xFA\xFF\xFF\x00',
-        b'\x09\xA0\x3D\x00\x83\x09\x00\x00\x00',
-        b'\x09\xA0\x3E\x00\xBB\x06\x00\x00\x00',
-        b'\x09\xA0\x3F\x00\x5A\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x40\x00\x68\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x41\x00\xB2\x09\x00\x00\x00',
-        b'\x09\xA0\x42\x00\x8C\x08\x00\x00\x00',
-        b'\x09\xA0\x43\x00\x42\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x44\x00\x7C\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x45\x00\xB3\x09\x00\x00\x00',
-        b'\x09\xA0\x46\x00\x93\x0A\x00\x00\x00',
-        b'\x09\xA0\x47\x00\x5C\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x48\x00\x58\xF4\xFF\xFF\x00',
-        b'\x09\xA0\x49\x00\x7D\x09\x00\x00\x00',
-        b'\x09\xA0\x4A\x00\xD5\x0C\x00\x00\x00',
-        b'\x09\xA0\x4B\x00\xB3\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x4C\x00\xF7\xF1\xFF\xFF\x00',
-        b'\x09\xA0\x4D\x00\x04\x09\x00\x00\x00',
-        b'\x09\xA0\x4E\x00\x55\x0F\x00\x00\x00',
-        b'\x09\xA0\x4F\x00\x53\xF7\xFF\xFF\x00',
-        b'\x09\xA0\x50\x00\x54\xEF\xFF\xFF\x00',
-        b'\x09\xA0\x51\x00\x3B\x08\x00\x00\x00',
-        b'\x09\xA0\x52\x00\x1B\x12\x00\x00\x00',
-        b'\x09\xA0\x53\x00\x4A\xF8\xFF\xFF\x00',
-        b'\x09\xA0\x54\x00\x67\xEC\xFF\xFF\x00',
-        b'\x09\xA0\x55\x00\x10\x07\x00\x00\x00',
-        b'\x09\xA0\x56\x00\x32\x15\x00\x00\x00',
-        b'\x09\xA0\x57\x00\xAE\xF9\xFF\xFF\x00',
-        b'\x09\xA0\x58\x00\x22\xE9\xFF\xFF\x00',
-        b'\x09\xA0\x59\x00\x6E\x05\x00\x00\x00',
-        b'\x09\xA0\x5A\x00\xAA\x18\x00\x00\x00',
-        b'\x09\xA0\x5B\x00\x98\xFB\xFF\xFF\x00',
-        b'\x09\xA0\x5C\x00\x71\xE5\xFF\xFF\x00',
-        b'\x09\xA0\x5D\x00\x33\x03\x00\x00\x00',
-        b'\x09\xA0\x5E\x00\x9A\x1C\x00\x00\x00',
-        b'\x09\xA0\x5F\x00\x2F\xFE\xFF\xFF\x00',
-        b'\x09\xA0\x60\x00\x36\xE1\xFF\xFF\x00',
-        b'\x09\xA0\x61\x00\x32\x00\x00\x00\x00',
-        b'\x09\xA0\x62\x00\x2C\x21\x00\x00\x00',
-        b'\x09\xA0\x63\x00\xAD\x01\x00\x00\x00',
-        b'\x09\xA0\x64\x00\x3E\xDC\xFF\xFF\x00',
-        b'\x09\xA0\x65\x00\x1F\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x66\x00\xA0\x26\x00\x00\x00',
-        b'\x09\xA0\x67\x00\x75\x06\x00\x00\x00',
-        b'\x09\xA0\x68\x00\x32\xD6\xFF\xFF\x00',
-        b'\x09\xA0\x69\x00\x7A\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x6A\x00\x6A\x2D\x00\x00\x00',
-        b'\x09\xA0\x6B\x00\x32\x0D\x00\x00\x00',
-        b'\x09\xA0\x6C\x00\x74\xCE\xFF\xFF\x00',
-        b'\x09\xA0\x6D\x00\x54\xEE\xFF\xFF\x00',
-        b'\x09\xA0\x6E\x00\x66\x36\x00\x00\x00',
-        b'\x09\xA0\x6F\x00\x3B\x17\x00\x00\x00',
-        b'\x09\xA0\x70\x00\xC9\xC3\xFF\xFF\x00',
-        b'\x09\xA0\x71\x00\xAD\xE1\xFF\xFF\x00',
-        b'\x09\xA0\x72\x00\x68\x43\x00\x00\x00',
-        b'\x09\xA0\x73\x00\xAD\x27\x00\x00\x00',
-        b'\x09\xA0\x74\x00\x62\xB3\xFF\xFF\x00',
-        b'\x09\xA0\x75\x00\x64\xCB\xFF\xFF\x00',
-        b'\x09\xA0\x76\x00\x02\x59\x00\x00\x00',
-        b'\x09\xA0\x77\x00\xAD\x47\x00\x00\x00',
-        b'\x09\xA0\x78\x00\x46\x95\xFF\xFF\x00',
-        b'\x09\xA0\x79\x00\x58\x99\xFF\xFF\x00',
-        b'\x09\xA0\x7A\x00\x58\x86\x00\x00\x00',
-        b'\x09\xA0\x7B\x00\x76\xA1\x00\x00\x00',
-        b'\x09\xA0\x7C\x00\x6A\x49\xFF\xFF\x00',
-        b'\x09\xA0\x7D\x00\xEE\xC9\xFE\xFF\x00',
-        b'\x09\xA0\x7E\x00\xC3\x0E\x01\x00\x00',
-        b'\x09\xA0\x7F\x00\xBE\x06\x04\x00\x00',
-        b'\x09\xA0\x80\x00\xBE\x06\x04\x00\x00',
-        b'\x09\xA0\x81\x00\xC3\x0E\x01\x00\x00',
-        b'\x09\xA0\x82\x00\xEE\xC9\xFE\xFF\x00',
-        b'\x09\xA0\x83\x00\x6A\x49\xFF\xFF\x00',
-        b'\x09\xA0\x84\x00\x76\xA1\x00\x00\x00',
-        b'\x09\xA0\x85\x00\x58\x86\x00\x00\x00',
-        b'\x09\xA0\x86\x00\x58\x99\xFF\xFF\x00',
-        b'\x09\xA0\x87\x00\x46\x95\xFF\xFF\x00',
-        b'\x09\xA0\x88\x00\xAD\x47\x00\x00\x00',
-        b'\x09\xA0\x89\x00\x02\x59\x00\x00\x00',
-        b'\x09\xA0\x8A\x00\x64\xCB\xFF\xFF\x00',
-        b'\x09\xA0\x8B\x00\x62\xB3\xFF\xFF\x00',
-        b'\x09\xA0\x8C\x00\xAD\x27\x00\x00\x00',
-        b'\x09\xA0\x8D\x00\x68\x43\x00\x00\x00',
-        b'\x09\xA0\x8E\x00\xAD\xE1\xFF\xFF\x00',
-        b'\x09\xA0\x8F\x00\xC9\xC3\xFF\xFF\x00',
-        b'\x09\xA0\x90\x00\x3B\x17\x00\x00\x00',
-        b'\x09\xA0\x91\x00\x66\x36\x00\x00\x00',
-        b'\x09\xA0\x92\x00\x54\xEE\xFF\xFF\x00',
-        b'\x09\xA0\x93\x00\x74\xCE\xFF\xFF\x00',
-        b'\x09\xA0\x94\x00\x32\x0D\x00\x00\x00',
-        b'\x09\xA0\x95\x00\x6A\x2D\x00\x00\x00',
-        b'\x09\xA0\x96\x00\x7A\xF6\xFF\xFF\x00',
-        b'\x09\xA0\x97\x00\x32\xD6\xFF\xFF\x00',
-        b'\x09\xA0\x98\x00\x75\x06\x00\x00\x00',
-        b'\x09\xA0\x99\x00\xA0\x26\x00\x00\x00',
-        b'\x09\xA0\x9A\x00\x1F\xFC\xFF\xFF\x00',
-        b'\x09\xA0\x9B\x00\x3E\xDC\xFF\xFF\x00',
-        b'\x09\xA0\x9C\x00\xAD\x01\x00\x00\x00',
-        b'\x09\xA0\x9D\x00\x2C\x21\x00\x00\x00',
-        b'\x09\xA0\x9E\x00\x32\x00\x00\x00\x00',
-        b'\x09\xA0\x9F\x00\x36\xE1\xFF\xFF\x00',
-        b'\x09\xA0\xA0\x00\x2F\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xA1\x00\x9A\x1C\x00\x00\x00',
-        b'\x09\xA0\xA2\x00\x33\x03\x00\x00\x00',
-        b'\x09\xA0\xA3\x00\x71\xE5\xFF\xFF\x00',
-        b'\x09\xA0\xA4\x00\x98\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xA5\x00\xAA\x18\x00\x00\x00',
-        b'\x09\xA0\xA6\x00\x6E\x05\x00\x00\x00',
-        b'\x09\xA0\xA7\x00\x22\xE9\xFF\xFF\x00',
-        b'\x09\xA0\xA8\x00\xAE\xF9\xFF\xFF\x00',
-        b'\x09\xA0\xA9\x00\x32\x15\x00\x00\x00',
-        b'\x09\xA0\xAA\x00\x10\x07\x00\x00\x00',
-        b'\x09\xA0\xAB\x00\x67\xEC\xFF\xFF\x00',
-        b'\x09\xA0\xAC\x00\x4A\xF8\xFF\xFF\x00',
-        b'\x09\xA0\xAD\x00\x1B\x12\x00\x00\x00',
-        b'\x09\xA0\xAE\x00\x3B\x08\x00\x00\x00',
-        b'\x09\xA0\xAF\x00\x54\xEF\xFF\xFF\x00',
-        b'\x09\xA0\xB0\x00\x53\xF7\xFF\xFF\x00',
-        b'\x09\xA0\xB1\x00\x55\x0F\x00\x00\x00',
-        b'\x09\xA0\xB2\x00\x04\x09\x00\x00\x00',
-        b'\x09\xA0\xB3\x00\xF7\xF1\xFF\xFF\x00',
-        b'\x09\xA0\xB4\x00\xB3\xF6\xFF\xFF\x00',
-        b'\x09\xA0\xB5\x00\xD5\x0C\x00\x00\x00',
-        b'\x09\xA0\xB6\x00\x7D\x09\x00\x00\x00',
-        b'\x09\xA0\xB7\x00\x58\xF4\xFF\xFF\x00',
-        b'\x09\xA0\xB8\x00\x5C\xF6\xFF\xFF\x00',
-        b'\x09\xA0\xB9\x00\x93\x0A\x00\x00\x00',
-        b'\x09\xA0\xBA\x00\xB3\x09\x00\x00\x00',
-        b'\x09\xA0\xBB\x00\x7C\xF6\xFF\xFF\x00',
-        b'\x09\xA0\xBC\x00\x42\xF6\xFF\xFF\x00',
-        b'\x09\xA0\xBD\x00\x8C\x08\x00\x00\x00',
-        b'\x09\xA0\xBE\x00\xB2\x09\x00\x00\x00',
-        b'\x09\xA0\xBF\x00\x68\xF8\xFF\xFF\x00',
-        b'\x09\xA0\xC0\x00\x5A\xF6\xFF\xFF\x00',
-        b'\x09\xA0\xC1\x00\xBB\x06\x00\x00\x00',
-        b'\x09\xA0\xC2\x00\x83\x09\x00\x00\x00',
-        b'\x09\xA0\xC3\x00\x20\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xC4\x00\x9C\xF6\xFF\xFF\x00',
-        b'\x09\xA0\xC5\x00\x1E\x05\x00\x00\x00',
-        b'\x09\xA0\xC6\x00\x2E\x09\x00\x00\x00',
-        b'\x09\xA0\xC7\x00\xA6\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xC8\x00\x00\xF7\xFF\xFF\x00',
-        b'\x09\xA0\xC9\x00\xB2\x03\x00\x00\x00',
-        b'\x09\xA0\xCA\x00\xBB\x08\x00\x00\x00',
-        b'\x09\xA0\xCB\x00\xFC\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xCC\x00\x7F\xF7\xFF\xFF\x00',
-        b'\x09\xA0\xCD\x00\x74\x02\x00\x00\x00',
-        b'\x09\xA0\xCE\x00\x30\x08\x00\x00\x00',
-        b'\x09\xA0\xCF\x00\x25\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xD0\x00\x11\xF8\xFF\xFF\x00',
-        b'\x09\xA0\xD1\x00\x63\x01\x00\x00\x00',
-        b'\x09\xA0\xD2\x00\x93\x07\x00\x00\x00',
-        b'\x09\xA0\xD3\x00\x23\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xD4\x00\xB2\xF8\xFF\xFF\x00',
-        b'\x09\xA0\xD5\x00\x7C\x00\x00\x00\x00',
-        b'\x09\xA0\xD6\x00\xEB\x06\x00\x00\x00',
-        b'\x09\xA0\xD7\x00\xF8\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xD8\x00\x5C\xF9\xFF\xFF\x00',
-        b'\x09\xA0\xD9\x00\xBE\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xDA\x00\x3B\x06\x00\x00\x00',
-        b'\x09\xA0\xDB\x00\xA7\x00\x00\x00\x00',
-        b'\x09\xA0\xDC\x00\x09\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xDD\x00\x25\xFF\xFF\xFF\x00',
-        b'\x09\xA0\xDE\x00\x88\x05\x00\x00\x00',
-        b'\x09\xA0\xDF\x00\x34\x01\x00\x00\x00',
-        b'\x09\xA0\xE0\x00\xB5\xFA\xFF\xFF\x00',
-        b'\x09\xA0\xE1\x00\xB1\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xE2\x00\xD6\x04\x00\x00\x00',
-        b'\x09\xA0\xE3\x00\xA1\x01\x00\x00\x00',
-        b'\x09\xA0\xE4\x00\x5B\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xE5\x00\x5D\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xE6\x00\x29\x04\x00\x00\x00',
-        b'\x09\xA0\xE7\x00\xF2\x01\x00\x00\x00',
-        b'\x09\xA0\xE8\x00\xF4\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xE9\x00\x28\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xEA\x00\x83\x03\x00\x00\x00',
-        b'\x09\xA0\xEB\x00\x2C\x02\x00\x00\x00',
-        b'\x09\xA0\xEC\x00\x77\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xED\x00\x11\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xEE\x00\xE3\x02\x00\x00\x00',
-        b'\x09\xA0\xEF\x00\x55\x02\x00\x00\x00',
-        b'\x09\xA0\xF0\x00\xD2\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xF1\x00\x13\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xF2\x00\x3D\x02\x00\x00\x00',
-        b'\x09\xA0\xF3\x00\x73\x02\x00\x00\x00',
-        b'\x09\xA0\xF4\x00\xC8\xFC\xFF\xFF\x00',
-        b'\x09\xA0\xF5\x00\x1C\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xF6\x00\x55\x01\x00\x00\x00',
-        b'\x09\xA0\xF7\x00\x8F\x02\x00\x00\x00',
-        b'\x09\xA0\xF8\x00\x7D\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xF9\x00\xD9\xFD\xFF\xFF\x00',
-        b'\x09\xA0\xFA\x00\xFA\xFE\xFF\xFF\x00',
-        b'\x09\xA0\xFB\x00\x10\x03\x00\x00\x00',
-        b'\x09\xA0\xFC\x00\xEC\xF4\xFF\xFF\x00',
-        b'\x09\xA0\xFD\x00\x5D\xFB\xFF\xFF\x00',
-        b'\x09\xA0\xFE\x00\xEF\xF4\xFF\xFF\x00',
-        b'\x09\xA0\xFF\x00\x77\x0D\x00\x00\x00',
-        b'\x09\xA0\x00\x03\x08\x00\x00\x00\x00')
+    BWKHZ_190 = AD6620Program(
+        '9 6 5 9 16 16 4 1 0 255', '''
+          3447  -2833  -1187  -2836    784   -262   -551  -1155    655    341   -484   -824
+           627    573   -493   -814    597    739   -495   -905    556    899   -472  -1036
+           498   1065   -419  -1189    417   1238   -335  -1355    308   1416   -219  -1527
+           167   1595    -66  -1700     -8   1771    124  -1870   -221   1939    355  -2031
+          -475   2096    628  -2177   -772   2235    946  -2304  -1114   2350   1310  -2404
+         -1504   2435   1723  -2470  -1944   2482   2188  -2494  -2436   2483   2707  -2468
+         -2984   2429   3285  -2381  -3593   2308   3925  -2221  -4268   2107   4635  -1974
+         -5017   1808   5426  -1618  -5854   1390   6314  -1128  -6799    819   7322   -465
+         -7882     50   8492    429  -9154   -993   9888   1653 -10702  -2438  11626   3378
+        -12684  -4524  13926   5947 -15415  -7763  17256  10157 -19614 -13468  22786  18349
+        -27322 -26280  34392  41334 -46742 -79378  69315 263870 263870  69315 -79378 -46742
+         41334  34392 -26280 -27322  18349  22786 -13468 -19614  10157  17256  -7763 -15415
+          5947  13926  -4524 -12684   3378  11626  -2438 -10702   1653   9888   -993  -9154
+           429   8492     50  -7882   -465   7322    819  -6799  -1128   6314   1390  -5854
+         -1618   5426   1808  -5017  -1974   4635   2107  -4268  -2221   3925   2308  -3593
+         -2381   3285   2429  -2984  -2468   2707   2483  -2436  -2494   2188   2482  -1944
+         -2470   1723   2435  -1504  -2404   1310   2350  -1114  -2304    946   2235   -772
+         -2177    628   2096   -475  -2031    355   1939   -221  -1870    124   1771     -8
+         -1700    -66   1595    167  -1527   -219   1416    308  -1355   -335   1238    417
+         -1189   -419   1065    498  -1036   -472    899    556   -905   -495    739    597
+          -814   -493    573    627   -824   -484    341    655  -1155   -551   -262    784
+         -2836  -1187  -2833   3447
+        ''')
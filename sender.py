@@ -0,0 +1,203 @@
+# IQ datagram output.
+#
+# Each 8192 byte IQ frame goes out as 8192/blockSize UDP datagrams, each with
+# a 4 byte header: the 16-bit length/type word (type 0b100, length including
+# the header) and a 16-bit sequence number that runs 1..0xFFFE.  Blocks go
+# up to 4096 bytes: a whole 8192 byte frame would make a datagram too long
+# for the 13 bit length field, and a length of 0 there means an 8194 byte
+# message to anything that frames the stream.
+#
+# The headers for every sequence number are built once into a table, and the
+# payload is sent straight out of the frame buffer, so nothing is copied on
+# the way to the kernel.  Where the OS has it, all the datagrams of a frame go
+# out in one sendmmsg call; otherwise each one is a sendmsg with a two piece
+# iovec, and as a last resort a joined sendto.
+#
+# On a non-blocking socket (the asyncio server's) a full send buffer leaves
+# the rest of that frame out for that client and counts it in dropped, so
+# one slow client never holds up the loop that drains the capture ring.
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import socket
+import sys
+
+
+iqDataSendHeaderSize = 4
+maxSequence = 0xFFFE
+blockSizes = (256, 512, 1024, 2048, 4096)
+
+
+def iqDataHeader(length):
+    # 16-bit little-endian: low 13 bits length (header included), top 3 bits
+    # message type 0b100 (IQ data).
+    return bytes([length & 0xFF, 0x80 | ((length >> 8) & 0x1F)])
+
+headerTables = {}
+
+def headerTable(blockSize):
+    # Every header we will ever send for this block size, indexed by
+    # sequence number.  Shared by all senders; it is never written again.
+    table = headerTables.get(blockSize)
+    if table is None:
+        length = iqDataHeader(blockSize + iqDataSendHeaderSize)
+        table = bytearray()
+        for sn in range(maxSequence + 1):
+            table += length + bytes([sn & 0xFF, sn >> 8])
+        table = headerTables.setdefault(blockSize, table)
+    return table
+
+
+class iovec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+class msghdr(ctypes.Structure):
+    _fields_ = [('msg_name', ctypes.c_void_p),
+                ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.POINTER(iovec)),
+                ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p),
+                ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
+
+class mmsghdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', msghdr), ('msg_len', ctypes.c_uint)]
+
+class sockaddr_in(ctypes.Structure):
+    _fields_ = [('sin_family', ctypes.c_ushort),
+                ('sin_port', ctypes.c_uint16),
+                ('sin_addr', ctypes.c_uint8 * 4),
+                ('sin_zero', ctypes.c_uint8 * 8)]
+
+
+def loadSendmmsg():
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        fn = libc.sendmmsg
+    except (OSError, AttributeError, TypeError):
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int]
+    fn.restype = ctypes.c_int
+    return fn
+
+sendmmsg = loadSendmmsg()
+
+
+def sockaddr(address):
+    host, port = address
+    sa = sockaddr_in()
+    sa.sin_family = socket.AF_INET
+    sa.sin_port = socket.htons(port)
+    sa.sin_addr[:] = socket.inet_aton(socket.gethostbyname(host))
+    return sa
+
+
+class IQSender:
+    def __init__(self, udp, blockSize=1024, mode=None):
+        if blockSize not in blockSizes:
+            raise ValueError(f'block size {blockSize} is not one of {blockSizes}')
+        self.udp = udp
+        self.blockSize = blockSize
+        self.blocks = 8192 // blockSize
+        self.sequence = 0
+        self.datagrams = 0
+        self.wraps = 0
+        self.dropped = 0            # frames cut short with the socket buffer full
+        self.headers = headerTable(blockSize)
+        self.headerView = memoryview(self.headers)
+        if mode not in (None, 'sendmmsg', 'sendmsg', 'sendto'):
+            raise ValueError(f'unknown send mode: {mode}')
+        if mode == 'sendmmsg' and not sendmmsg:
+            mode = None
+        if mode == 'sendmsg' and not hasattr(udp, 'sendmsg'):
+            mode = None
+        self.mode = mode or ('sendmmsg' if sendmmsg else
+                             'sendmsg' if hasattr(udp, 'sendmsg') else 'sendto')
+        self.send = getattr(self, self.mode)
+        if self.mode == 'sendmmsg':
+            self.setupMmsg()
+
+    def sequenceNumber(self):
+        self.sequence = self.sequence + 1
+        if self.sequence > maxSequence:
+            self.sequence = 1
+            self.wraps = self.wraps + 1
+        return self.sequence
+
+    def header(self, sn):
+        return self.headerView[4*sn:4*sn+4]
+
+    def sendto(self, data, address):
+        bs = self.blockSize
+        for k in range(len(data) // bs):
+            hdr = self.header(self.sequenceNumber())
+            try:
+                self.udp.sendto(b''.join((hdr, data[k*bs:(k+1)*bs])), address)
+            except BlockingIOError:
+                self.dropped = self.dropped + 1
+                break
+            self.datagrams = self.datagrams + 1
+
+    def sendmsg(self, data, address):
+        bs = self.blockSize
+        data = memoryview(data)
+        for k in range(len(data) // bs):
+            hdr = self.header(self.sequenceNumber())
+            try:
+                self.udp.sendmsg((hdr, data[k*bs:(k+1)*bs]), (), 0, address)
+            except BlockingIOError:
+                self.dropped = self.dropped + 1
+                break
+            self.datagrams = self.datagrams + 1
+
+    def setupMmsg(self):
+        # One frame's worth of mmsghdr/iovec pairs, wired together once; a
+        # send only has to fill in the buffer addresses.
+        n = self.blocks
+        self.iov = (iovec * (2*n))()
+        self.msgs = (mmsghdr * n)()
+        for k in range(n):
+            self.iov[2*k].iov_len = iqDataSendHeaderSize
+            self.iov[2*k+1].iov_len = self.blockSize
+            hdr = self.msgs[k].msg_hdr
+            hdr.msg_iov = ctypes.cast(ctypes.addressof(self.iov) + 2*k*ctypes.sizeof(iovec),
+                                      ctypes.POINTER(iovec))
+            hdr.msg_iovlen = 2
+        self.headerRef = ctypes.c_char.from_buffer(self.headers)
+        self.headerBase = ctypes.addressof(self.headerRef)
+        self.addresses = {}
+
+    def sendmmsg(self, data, address):
+        data = memoryview(data)
+        if data.readonly or len(data) != 8192:
+            # ctypes can only take the address of a writable buffer
+            return self.sendmsg(data, address)
+        sa = self.addresses.get(address)
+        if sa is None:
+            sa = self.addresses[address] = sockaddr(address)
+        payload = ctypes.c_char.from_buffer(data)
+        base = ctypes.addressof(payload)
+        n = self.blocks
+        for k in range(n):
+            self.iov[2*k].iov_base = self.headerBase + 4*self.sequenceNumber()
+            self.iov[2*k+1].iov_base = base + k*self.blockSize
+            hdr = self.msgs[k].msg_hdr
+            hdr.msg_name = ctypes.addressof(sa)
+            hdr.msg_namelen = ctypes.sizeof(sa)
+        sent = 0
+        fd = self.udp.fileno()
+        msgs = ctypes.addressof(self.msgs)
+        while sent < n:
+            r = sendmmsg(fd, msgs + sent*ctypes.sizeof(mmsghdr), n - sent, 0)
+            if r < 0:
+                err = ctypes.get_errno()
+                if err != errno.EAGAIN:
+                    raise OSError(err, os.strerror(err))
+                self.dropped = self.dropped + 1
+                break
+            sent = sent + r
+        self.datagrams = self.datagrams + sent
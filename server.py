@@ -8,32 +8,36 @@
 # Get Unknown: [0x4] [0x20] [0x9] [0x0]
 
 
+from pylibftdi import FtdiError
 from pylibftdi.device import Device
 from pylibftdi.driver import Driver
-from threading import Thread, Event
-from time import sleep
+from threading import Thread, Event, Lock
+from time import monotonic, perf_counter, sleep
 from socket import *
+from select import select
 from sdrcmds import SdrIQByteCommands as bc
-import numpy as np
-from struct import unpack
-import sys, getopt
+from framer import FrameReader, ftdiTune, maxFrameLength
+from capture import Capture, FrameRing
+from meter import IQMeter
+from clients import Client, ClientHub, runItem, staticQueries, staticRequest
+from metrics import Metrics, MetricsServer, Histogram
+from sender import blockSizes
+from ddc import DDC
+from compress import codecs
+from recorder import Recorder
+from playback import Playback
+from dsp import DSPProgrammer
+from dspstate import DSPState
+from supervisor import Supervisor, radioSerials
+import os, sys, getopt
+
+
+iqDataSendBlockSize = 1024   # default, see -d; one of sender.blockSizes; SdrDx only likes 1024
+maxWrite = 4096              # bytes of client messages gathered into one USB write
+reconnectInterval = 0.5      # seconds between looks for a radio that has gone away
+recoverBuckets = (0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 60.0, 300.0)
 
 
-iqDataSendHeaderSize = 4
-iqDataSendBlockSize = 1024   # must be a factor of 8192; SdrDx only likes 1024
-iqDataSendMsgLength = iqDataSendBlockSize + iqDataSendHeaderSize
-
-
-def IQ(msg):
-    for k in range(2,len(msg),2):
-        yield unpack('h',msg[k:k+2])[0]
-
-def power(msg):
-    av = 0.0
-    for iq in IQ(msg):
-        av = av + iq*iq
-    return av/(len(msg)-2)
-
 def prnmsg(msg):
     return ' '.join(['['+hex(b).upper()+']' for b in msg]).replace('X','x')
 
@@ -117,28 +121,170 @@ def readMsg(source):
 
 
 class Listener:
-    def __init__(self):
+    def __init__(self,argv=None,radio=None):
+        # argv and radio are for driving the server from bench.py; normally
+        # they come from sys.argv and findRadio.
         self.makeItStop  = Event()
         self.warmBoot = False
         self.radioName = b'SDR-IQ'
         self.print = self.noOp
         self.boot = self.coldBoot
-        self.doCommandline()
-        self.findRadio()
+        self.meter = IQMeter()
+        self.meterInterval = 0
+        self.sendMode = None
+        self.blockSize = iqDataSendBlockSize
+        self.tcpPort = 50000
+        self.udpPort = 50100
+        self.clientPort = 50000     # where clients listen for IQ datagrams
+        self.asyncMode = False
+        self.maxClients = 1
+        self.group = None           # multicast (address,port) for IQ data
+        self.ttl = 1
+        self.interface = None
+        self.ringFrames = 64        # frames of slack between USB and the network
+        self.metrics = Metrics()
+        self.metricsPort = 0
+        self.bootSeconds = None     # how long the last cold boot took
+        self.dspBatch = 64          # AD6620 registers per USB write, 1 for one at a time
+        self.dspStatePath = os.path.expanduser('~/.sdriq-dsp.json')
+        self.hostBlockSize = {}     # IQ datagram size for particular client hosts
+        self.sampleRate = 196078    # the IQ rate, until the radio's AD6620 program is known
+        self.ddc = None             # (decimation, offset Hz) for every client
+        self.hostDdc = {}           # and for particular client hosts
+        self.codec = None           # compressed IQ for every client
+        self.hostCodec = {}         # and for particular client hosts
+        self.recordDir = None       # where to record IQ, if anywhere
+        self.recordBytes = 1 << 30  # start a new recording after this much
+        self.recordSeconds = 0      # or this long, if set
+        self.playFile = None        # a recording to serve instead of the radio
+        self.playSpeed = 1.0        # times real time, 0 for as fast as it goes
+        self.playLoop = False
+        self.statusInterval = 0.5   # seconds between the server's own Status polls, 0 for none
+        self.writeWindow = 0.0      # how long to wait for more client messages to write with one
+        self.usbWrites = 0          # write calls to the radio once serving
+        self.usbLatency = None      # FTDI latency timer, ms; None leaves it at 16
+        self.usbChunk = None        # libftdi USB transfer size, bytes
+        self.serial = None          # the radio to open, by serial number; None for the first
+        self.supervise = False      # serve every radio, one worker process each (-M)
+        self.workerArgs = []        # the options each worker gets, see supervisor.py
+        self.radioSerial = None     # the serial number of the radio we opened
+        self.radioUp = Event()      # clear while the radio is away, see reconnect
+        self.radioUp.set()
+        self.reconnects = 0
+        self.recoverTime = Histogram(recoverBuckets) # from losing the radio to having it back as it was
+        self.restoreSeconds = None  # how long putting it back as it was took, the last time
+        self.doCommandline(sys.argv[1:] if argv is None else argv)
+        self.dspState = DSPState(self.dspStatePath,self.print)
+        self.staticReplies = {}     # the radio's name, serial and versions, see clients.py
+        if radio is None and self.playFile:
+            self.radio = Playback(self.playFile,self.playSpeed,self.playLoop)
+            print(f'playing {self.radio.path}, {self.radio.count} frames at {self.radio.sampleRate} S/s')
+            self.sampleRate = self.radio.sampleRate
+        elif radio is None and self.supervise:
+            self.radio = None
+        elif radio is None:
+            self.findRadio()
+        else:
+            self.radio = radio
+            self.tuneUSB()
+            self.boot()
 
-    def doCommandline(self):
+    def doCommandline(self,argv):
         try:
-            opts, args = getopt.getopt(sys.argv[1:],'br:v')
+            opts, args = getopt.getopt(argv,'abB:c:C:d:D:f:g:i:lL:Mp:P:q:r:S:t:T:vm:s:w:x:z:')
         except getopt.GetoptError:
-            print('usage: server [-b,-r <radio>, -v]')
+            print('usage: server [-a, -b, -B <registers>, -c <clients>, -C <seconds>, -d [<host>=]<bytes>, -D <state file>, -f <file>[:<speed>], -g <group[:port]>, -i <interface>, -l, -L <ms>[:<bytes>], -M, -p <metrics port>, -P <seconds>, -q <frames>, -r <radio>, -S <serial>, -t <ttl>, -T <port>, -v, -m <seconds>, -s <sendmmsg|sendmsg|sendto>, -w <dir>[:<MB>[:<seconds>]], -x [<host>=]<decimation>[:<offset Hz>], -z [<host>=]<delta|8|12>]')
             sys.exit(2)
         for op in opts:
-            if op[0] == '-b':
+            if op[0] not in ('-M', '-S', '-T', '-p', '-D', '-w'):
+                self.workerArgs = self.workerArgs + [op[0]] + ([op[1]] if op[1] else [])
+            if op[0] == '-a':
+                self.asyncMode = True
+            elif op[0] == '-b':
                 self.boot = self.noOp
+            elif op[0] == '-c':
+                self.maxClients = int(op[1])
+            elif op[0] == '-C':
+                self.writeWindow = float(op[1])
+            elif op[0] == '-B':
+                self.dspBatch = int(op[1])
+            elif op[0] == '-D':
+                self.dspStatePath = op[1]
+            elif op[0] == '-d':
+                host, _, size = op[1].rpartition('=')
+                if int(size) not in blockSizes:
+                    print(f'datagram size must be one of {blockSizes}')
+                    sys.exit(2)
+                if host:
+                    self.hostBlockSize[host] = int(size)
+                else:
+                    self.blockSize = int(size)
+            elif op[0] == '-f':
+                path, _, speed = op[1].rpartition(':')
+                if not path or not speed.replace('.','',1).isdigit():
+                    path, speed = op[1], ''
+                self.playFile = path
+                self.playSpeed = float(speed or 1)
+            elif op[0] == '-l':
+                self.playLoop = True
+            elif op[0] == '-L':
+                latency, _, chunk = op[1].partition(':')
+                self.usbLatency = int(latency) if latency else None
+                self.usbChunk = int(chunk) if chunk else None
+            elif op[0] == '-g':
+                group, _, port = op[1].partition(':')
+                self.group = (group, int(port or 0))     # 0 for the client port
+            elif op[0] == '-i':
+                self.interface = op[1]
+            elif op[0] == '-M':
+                self.supervise = True
+            elif op[0] == '-p':
+                self.metricsPort = int(op[1])
+            elif op[0] == '-P':
+                self.statusInterval = float(op[1])
+            elif op[0] == '-q':
+                self.ringFrames = int(op[1])
+            elif op[0] == '-S':
+                self.serial = op[1]
+            elif op[0] == '-t':
+                self.ttl = int(op[1])
+            elif op[0] == '-T':
+                # clients connect here and get their IQ at the same port,
+                # which the server sends from 100 above
+                self.tcpPort = self.clientPort = int(op[1])
+                self.udpPort = self.tcpPort + 100
             elif op[0] == '-r':
                 self.radioName = bytes(op[1],encoding='utf-8')
             elif op[0] == '-v':
                 self.print = print
+            elif op[0] == '-m':
+                self.meterInterval = float(op[1])
+            elif op[0] == '-s':
+                self.sendMode = op[1]
+            elif op[0] == '-w':
+                spec = op[1].split(':')
+                self.recordDir = spec[0]
+                if len(spec) > 1 and spec[1]:
+                    self.recordBytes = int(float(spec[1]) * (1 << 20))
+                if len(spec) > 2:
+                    self.recordSeconds = float(spec[2])
+            elif op[0] == '-x':
+                host, _, spec = op[1].rpartition('=')
+                decimation, _, offset = spec.partition(':')
+                ddc = (int(decimation), float(offset or 0))
+                if host:
+                    self.hostDdc[host] = ddc
+                else:
+                    self.ddc = ddc
+            elif op[0] == '-z':
+                host, _, codec = op[1].rpartition('=')
+                if codec not in codecs:
+                    print(f'codec must be one of {", ".join(codecs)}')
+                    sys.exit(2)
+                if host:
+                    self.hostCodec[host] = codec
+                else:
+                    self.codec = codec
             else:
                 print(f'unknown option: {op}')
 
@@ -149,172 +295,555 @@ class Listener:
         return
 
     def coldBoot(self):
-        freq = self.GetFreq()
+        t = perf_counter()
+        serial, freq = self.probe()
+        if freq is None:
+            print('radio did not say its frequency; leaving it as it is')
+        record = self.dspState.select(serial,freq not in (None, 680000))
         if (freq == 680000):
             self.print('Cold boot detected')
-            self.SetDSP()
-            self.SetFreq(680001)
+            # put back what this radio had, or the stock 190 kHz program
+            self.SetDSP(self.dspState.program() or bc.BWKHZ_190)
+            freq = record.get('frequency',680001)
+            self.SetFreq(680001 if freq == 680000 else freq)
+            if 'rfGain' in record:
+                self.SetRFGain(record['rfGain'])
+            if 'ifGain' in record:
+                self.SetIFGain(record['ifGain'])
+            self.bootSeconds = perf_counter() - t
+            self.print(f'cold boot took {1e3*self.bootSeconds:.0f} ms ({self.dsp.mode} DSP load, {self.dsp.writes} USB writes)')
+        elif self.dspState.active:
+            self.print(f'{serial} still has its DSP program, {self.dspState.active[:12]}')
+        self.sampleRate = self.dspState.rate or self.sampleRate
 
     def findRadio(self):
-        self.devices = Driver().list_devices()
-        self.radio = None
-        for d in self.devices:
-            # ross - print('d[1]="{0}" self.radioName="{1}"'.format(d[1], self.radioName))
-            if (d[1] == self.radioName.decode('utf-8')):
-                self.print('found radio')
-                try:
-                    self.radio = Device(encoding='utf-8')
-                except FtdiError as err:
-                    print('Device instantiation failed:  {0}'.format(err))
-        if self.radio:
+        if self.openRadio(self.serial):
             print('connected to radio')
+            self.tuneUSB()
             self.radio.flush()
             self.boot()
         else:
             print('unable to connect to radio')
 
-    def GetFreq(self):
-        self.radio.write(bc.GetFreq)
-        rep = readMsg(self.radio.read)
-        return sum([ rep[k+5] << (8*k) for k in range(4)])
+    def openRadio(self,serial=None):
+        # Open the radio with that serial number, or the first one there is.
+        self.devices = Driver().list_devices()
+        self.radio = None
+        serials = radioSerials(self.devices,self.radioName)
+        if serial is not None:
+            serials = [s for s in serials if s == serial]
+        elif len(serials) > 1:
+            print(f'{len(serials)} radios found, serving {serials[0]} (-S picks one, -M serves them all)')
+        if serials:
+            self.print(f'found radio {serials[0]}')
+            try:
+                self.radio = Device(device_id=serials[0],encoding='utf-8')
+                self.radioSerial = serials[0]
+            except FtdiError as err:
+                print('Device instantiation failed:  {0}'.format(err))
+        return self.radio is not None
+
+    def reconnect(self,err):
+        # The radio has gone: unplugged, or the USB link reset.  Runs on the
+        # capture thread, which has nothing to read meanwhile.  The clients
+        # stay connected and their writes are dropped until the same radio
+        # is back and set up the way they had it.  Returns the new device,
+        # or None if the server stops first.
+        t = perf_counter()
+        self.radioUp.clear()
+        print(f'lost the radio: {err}')
+        try:
+            self.radio.close()
+        except (FtdiError, OSError, AttributeError):
+            pass
+        while True:
+            if self.openRadio(self.radioSerial):
+                try:
+                    self.tuneUSB()
+                    self.restore()
+                    break
+                except (FtdiError, OSError) as err:
+                    print(f'lost the radio again: {err}')
+            if self.makeItStop.wait(reconnectInterval):
+                return None
+        self.reconnects = self.reconnects + 1
+        self.recoverTime.observe(perf_counter() - t)
+        print(f'radio back after {perf_counter() - t:.1f} s, restored in {1e3*self.restoreSeconds:.0f} ms')
+        return self.radio
+
+    def restore(self):
+        # Put the radio back the way the clients had it: the DSP program,
+        # then the owner's last Set of each item (sample rate, frequency,
+        # gains, ...) and Run last if it was running.  The program goes in
+        # every time, since a client may have loaded one while the radio was
+        # away; in bulk that is a few tens of milliseconds.  Items no client
+        # has set go back the way a cold boot would put them.  The static
+        # replies are asked for again, since it may be another radio, and
+        # questions asked of the one that went away won't be answered.
+        t = perf_counter()
+        program = self.dspState.program()
+        record = dict(self.dspState.record())
+        serial, freq = self.probe()
+        warm = freq not in (None, 680000)
+        record = dict(self.dspState.select(serial,warm),**record)
+        self.primeCache()
+        with self.dspState.lock:
+            self.dspState.acks = 0
+        self.dspState.collecting = None
+        settings = dict(self.hub.settings)
+        run = settings.pop(runItem,None)
+        if program or not warm:
+            self.SetDSP(program)
+        self.hub.rateChanged(self.dspState.rate)
+        if not warm:
+            freq = record.get('frequency',680001)
+            if bc.SetFreq[2:4] not in settings:
+                self.SetFreq(680001 if freq == 680000 else freq)
+            if bc.SetRFGain[2:4] not in settings and 'rfGain' in record:
+                self.SetRFGain(record['rfGain'])
+            if bc.SetIFGain[2:4] not in settings and 'ifGain' in record:
+                self.SetIFGain(record['ifGain'])
+        msgs = list(settings.values()) + ([run] if run and run[5] != 1 else [])
+        if msgs:
+            self.queryAll(msgs)
+        self.restoreSeconds = perf_counter() - t
+        with self.hub.lock:
+            self.hub.pending.clear()
+            self.hub.statusAsked = 0.0
+        self.radioUp.set()
+        # anything set while we were at it went nowhere
+        for item, msg in list(self.hub.settings.items()):
+            if settings.get(item, run if item == runItem else None) != msg:
+                self.writeRadio(msg)
+
+    def drain(self,timeout=1.0):
+        # Stop the radio and throw away what it still sends.  A radio that
+        # kept streaming through a link reset comes back mid-frame, which
+        # readMsg can't find its way through.
+        deadline = perf_counter() + timeout
+        self.radio.write(bc.Stop)
+        while self.radioRead(maxFrameLength,0.05) and perf_counter() < deadline:
+            pass
+        self.radio.flush()
+
+    def tuneUSB(self):
+        if self.usbLatency is None and not self.usbChunk:
+            return
+        try:
+            ftdiTune(self.radio,self.usbLatency,self.usbChunk)
+            self.print(f'FTDI latency timer {self.usbLatency or 16} ms, USB transfers of {self.usbChunk or 4096} bytes')
+        except IOError as err:
+            print(f'could not tune USB: {err}')
+
+    def radioRead(self,n,timeout=1.0):
+        # The radio's read comes back short once the FTDI latency timer goes
+        # by with nothing new, which for a slow reply may be with nothing
+        # at all.  Wait a while for something.
+        deadline = perf_counter() + timeout
+        data = self.radio.read(n)
+        while not data and perf_counter() < deadline:
+            sleep(0.0005)
+            data = self.radio.read(n)
+        return data
+
+    def query(self,msg,timeout=1.0):
+        # Send a Get and wait for its reply, passing over anything else
+        # the radio sends meanwhile (IQ frames, if it's already running).
+        return self.queryAll([msg],timeout).get(bytes(msg[2:4]))
+
+    def queryAll(self,msgs,timeout=1.0):
+        # The same for several messages (of different items) in one USB
+        # write, so they cost one round trip between them.  Returns the
+        # replies by control item.
+        self.radio.write(b''.join(msgs))
+        wanted = set(bytes(msg[2:4]) for msg in msgs)
+        replies = {}
+        deadline = perf_counter() + timeout
+        while len(replies) < len(wanted) and perf_counter() < deadline:
+            rep = readMsg(self.radioRead)
+            if not rep:
+                break
+            if bytes(rep[2:4]) in wanted and rep[0:2] != b'\x00\x80':
+                replies[bytes(rep[2:4])] = rep
+        return replies
+
+    def primeCache(self):
+        # Ask the radio for what never changes while it stays connected, so
+        # the hub can answer clients from the cache.  Again whenever a
+        # radio is connected, which may not be the same one.
+        # All in one write; the PIC version replies share an item, so they
+        # are told apart as the hub does.
+        self.staticReplies.clear()
+        self.radio.write(b''.join(staticQueries))
+        deadline = perf_counter() + 1.0
+        while len(self.staticReplies) < len(staticQueries) and perf_counter() < deadline:
+            rep = readMsg(self.radioRead)
+            if not rep:
+                break
+            request = staticRequest(rep)
+            if request in staticQueries:
+                self.staticReplies[request] = bytes(rep)
+        self.print(f'{len(self.staticReplies)} of {len(staticQueries)} static queries cached')
+
+    def probe(self):
+        # The radio's serial number and frequency (None if it didn't say),
+        # with both asked in one write.  It is stopped and drained first:
+        # one still streaming from before would answer with IQ.
+        self.drain()
+        replies = self.queryAll([bc.SerialNumber, bc.GetFreq])
+        rep = replies.get(bc.SerialNumber[2:4])
+        serial = bytes(rep[4:]).rstrip(b'\x00').decode('ascii','replace') if rep else self.radioSerial
+        rep = replies.get(bc.GetFreq[2:4])
+        freq = int.from_bytes(rep[5:9],'little') if rep else None
+        return serial, freq
 
     def SetFreq(self,freq):
         msg = list(bc.SetFreq)
         for k in range(4):
             msg[k+5] = (freq >> (8*k)) & 0xFF
         self.radio.write(bytes(msg))
-        return readMsg(self.radio.read)
+        return readMsg(self.radioRead)
 
-    def SetDSP(self):
-        for cmd in bc.BWKHZ_190:
-            self.radio.write(cmd)
-            self.radio.read(3)
+    def SetDSP(self,commands=None):
+        commands = commands or bc.BWKHZ_190
+        self.dsp = DSPProgrammer(self.radio,self.print,self.dspBatch)
+        if self.dsp.program(commands):
+            self.dspState.loaded(commands)
+        else:
+            print('AD6620 program not acknowledged; the radio may not work')
         self.radio.flush()
 
-    def SetIFGain(self):
+    def SetIFGain(self,gain=24):
         cmd = list(bc.SetIFGain)
-        cmd[5] = 24
+        cmd[5] = gain
         self.radio.write(bytes(cmd))
-        self.radio.read(5)
+        return readMsg(self.radioRead)
 
-    def SetRFGain(self):
+    def SetRFGain(self,gain=0):
         cmd = list(bc.SetRFGain)
-        cmd[5] = 0
+        cmd[5] = gain & 0xFF
         self.radio.write(bytes(cmd))
+        return readMsg(self.radioRead)
 
     def serve(self):
+        if self.supervise:
+            return Supervisor(self).run()
         if not self.radio:
             print(f'Radio {self.radioName.decode()} not found')
-            return
+            return 1
+        self.primeCache()
         self.tcp = socket(AF_INET,SOCK_STREAM)
         # ross 2020-06-10:  We want to accept connections from anywhere.
         # '' is equivalent to AF_ANY.
         #self.tcp.bind(('localhost',50000))
-        self.tcp.bind(('',50000))
-        self.tcp.listen(1)
+        self.tcp.bind(('',self.tcpPort))
+        self.tcp.listen(self.maxClients)
         self.udp = socket(AF_INET,SOCK_DGRAM)
         self.udp.setsockopt(SOL_SOCKET,SO_REUSEADDR,1)
         # ross 2020-06-10:  We want to send data to anywhere
         # '' is equivalent to AF_ANY.
         #self.udp.bind(('localhost',50100))
-        self.udp.bind(('',50100))
-        self.print('listening on port 50000')
-        try:
-            self.connect = self.tcp.accept()
-        except:
-            # ross TODO:  print the exception
+        self.udp.bind(('',self.udpPort))
+        self.hub = ClientHub(self.print)
+        self.hub.dsp = self.dspState
+        self.dspState.start(self.makeItStop)
+        self.hub.cache = self.staticReplies
+        self.hub.sampleRate = self.sampleRate
+        # a Status reply stays good for two polls, so one late reply
+        # doesn't send every client's poll to the radio
+        self.hub.statusMaxAge = 2 * self.statusInterval
+        if self.group:
+            self.multicast()
+        self.ring = FrameRing(self.ringFrames)
+        self.capture = Capture(self,self.ring)
+        # acks to the server's own DSP loads would only flood the ring
+        self.capture.swallow = self.dspState.fromRadio
+        self.capture.start()
+        self.recorder = None
+        if self.recordDir:
+            os.makedirs(self.recordDir,exist_ok=True)
+            self.recorder = Recorder(self,self.ring,self.recordDir,self.recordBytes,self.recordSeconds)
+            self.recorder.start()
+        self.registerMetrics()
+        self.metricsServer = None
+        if self.metricsPort:
+            self.metricsServer = MetricsServer(self.metrics,self.metricsPort)
+            self.metricsServer.start()
+            self.print(f'metrics on http://localhost:{self.metricsPort}/metrics')
+        self.print(f'listening on port {self.tcpPort}')
+        if self.statusInterval:
+            StatusPoller(self).start()
+        if self.asyncMode:
+            from asyncserver import AsyncServer
+            AsyncServer(self,Validator(self.print)).run()
+            self.shutdown()
             return
-        self.print(f'Connected: {self.connect[1][0]} on port {self.connect[1][1]}')
-        # ross - Connected: 192.168.76.28 on port 60887
-        self.writer = RadioWriter(self)
         self.reader = RadioReader(self)
-        self.writer.start()
         self.reader.start()
+        acceptor = Thread(target=self.accept,daemon=True)
+        acceptor.start()
         self.makeItStop.wait()
+        self.shutdown()
+
+    def shutdown(self):
+        if self.recorder:
+            self.recorder.join(5)
+        self.dspState.save(True)
+        self.print(self.ring.report())
         self.print('closing TCP and UDP sockets')
         self.tcp.close()
         self.udp.close()
+        if self.metricsServer:
+            self.metricsServer.stop()
         self.print('Server - done')
 
+    def writeRadio(self,data):
+        # Everything the server sends the radio while serving goes through
+        # here.  Without a radio it goes nowhere; a write that fails wakes
+        # the capture thread, whose read will fail too and start reconnect.
+        self.usbWrites = self.usbWrites + 1
+        if self.radioUp.is_set():
+            try:
+                self.radio.write(data)
+            except (FtdiError, OSError) as err:
+                self.print(f'write to the radio failed: {err}')
+        self.capture.wakeup.set()
+
+    def newClient(self,send,address):
+        # A Client with whatever this host has been given on the command line.
+        host = address[0]
+        codec = self.hostCodec.get(host,self.codec)
+        if codec:
+            self.print(f'{host} gets {codec} compressed IQ')
+        ddc, offset = self.ddcFor(host)
+        return Client(send,address,self.udp,self.blockSizeFor(host),self.sendMode,
+                      ddc,codec,offset)
+
+    def blockSizeFor(self,host):
+        return self.hostBlockSize.get(host,self.blockSize)
+
+    def ddcFor(self,host):
+        # A down-converter of its own for a client on host, or None for the
+        # full stream, and its offset in Hz.  The offset is worked out
+        # against the IQ rate of the program in the radio; the hub retunes
+        # it when a client loads another.
+        spec = self.hostDdc.get(host,self.ddc)
+        if spec is None or spec == (1, 0.0):
+            return None, 0.0
+        decimation, offset = spec
+        self.print(f'{host} gets 1/{decimation} of the rate, {offset:+.0f} Hz from the tuned frequency')
+        return DDC(decimation,offset / self.hub.sampleRate), offset
+
+    def registerMetrics(self):
+        m, capture, ring, hub = self.metrics, self.capture, self.ring, self.hub
+        m.counter('sdriq_usb_reads_total','USB read calls',lambda: capture.framer.reads)
+        m.counter('sdriq_usb_bytes_total','bytes read from USB',lambda: capture.framer.bytes)
+        m.counter('sdriq_usb_frames_total','IQ frames read from USB',lambda: capture.iqFrames)
+        m.counter('sdriq_usb_writes_total','USB write calls',lambda: self.usbWrites)
+        m.counter('sdriq_parse_errors_total','impossible message lengths from USB',lambda: capture.framer.errors)
+        m.counter('sdriq_desyncs_total','times the USB stream lost its framing',lambda: capture.framer.desyncs)
+        m.counter('sdriq_desync_skipped_bytes_total','bytes skipped finding the framing again',lambda: capture.framer.skipped)
+        m.counter('sdriq_desync_seconds_total','time spent without framing',lambda: capture.framer.recoveryTime)
+        m.gauge('sdriq_desync_last_seconds','how long the last loss of framing lasted',lambda: capture.framer.lastRecovery)
+        m.counter('sdriq_reconnects_total','times the radio came back after going away',lambda: self.reconnects)
+        m.gauge('sdriq_radio_connected','1 with the radio there, 0 while it is away',lambda: int(self.radioUp.is_set()))
+        m.add('sdriq_recover_seconds','histogram','time from losing the radio to having it back as it was',self.recoverTime)
+        m.gauge('sdriq_restore_seconds','time putting the radio back as it was took, the last time',lambda: self.restoreSeconds)
+        m.counter('sdriq_ring_dropped_total','frames dropped with the capture ring full',lambda: ring.dropped)
+        m.gauge('sdriq_ring_high_water','most frames ever waiting in the capture ring',lambda: ring.highWater)
+        m.gauge('sdriq_ring_lag','frames the slowest consumer is behind',lambda: ring.stats()['lag'])
+        m.counter('sdriq_udp_datagrams_total','IQ datagrams sent',hub.datagrams)
+        m.counter('sdriq_sequence_wraps_total','IQ datagram sequence number wraps',hub.wraps)
+        m.counter('sdriq_client_frames_dropped_total','IQ frames cut short for a client with the UDP send buffer full',hub.dropped)
+        m.gauge('sdriq_compression_ratio','raw over sent IQ bytes, compressed clients',hub.compressionRatio)
+        m.gauge('sdriq_compression_cpu_seconds_per_frame','encoding time per IQ frame',hub.compressionCost)
+        m.counter('sdriq_control_messages_total','control messages',lambda: hub.fromClients,'direction="from_client"')
+        m.counter('sdriq_control_messages_total','control messages',lambda: hub.toRadio,'direction="to_radio"')
+        m.counter('sdriq_control_messages_total','control messages',lambda: capture.controls,'direction="from_radio"')
+        m.counter('sdriq_control_cache_hits_total','static queries answered from the cache, USB round trips saved',lambda: hub.cacheHits)
+        m.gauge('sdriq_control_cache_entries','static query replies cached',lambda: len(hub.cache))
+        for source, histogram in hub.replyTime.items():
+            m.add('sdriq_control_reply_seconds','histogram','time from a client query to its reply',histogram,f'source="{source}"')
+        m.counter('sdriq_status_polls_total','Status queries sent to the radio',lambda: hub.statusPolls)
+        m.counter('sdriq_status_from_snapshot_total','client Status polls answered from the latest reply',lambda: hub.statusHits)
+        m.gauge('sdriq_status_age_seconds','age of the latest Status reply',hub.statusAge)
+        m.gauge('sdriq_clients','connected clients',lambda: len(hub))
+        m.gauge('sdriq_cold_boot_seconds','time the last cold boot took',lambda: self.bootSeconds)
+        m.counter('sdriq_dsp_loads_total','DSP programs from clients sent to the radio',lambda: self.dspState.reloads)
+        m.counter('sdriq_dsp_loads_skipped_total','DSP programs from clients the radio already had',lambda: self.dspState.skipped)
+        m.gauge('sdriq_iq_power_dbfs','IQ power over the last 100 frames',lambda: (self.meter.window(100) or {}).get('dBFS'))
+        m.gauge('sdriq_iq_clips','clipped IQ samples in the last 1000 frames',lambda: (self.meter.window(1000) or {}).get('clips'))
+        if self.recorder:
+            rec = self.recorder
+            m.counter('sdriq_recorded_frames_total','IQ frames recorded',lambda: rec.recorded)
+            m.counter('sdriq_recording_dropped_total','IQ frames left out of the recording',lambda: rec.dropped)
+            m.counter('sdriq_recording_bytes_total','bytes written to recordings',lambda: rec.written)
+            m.gauge('sdriq_recording_blocks_waiting','1 MiB blocks waiting for the disk',rec.waiting)
+            m.gauge('sdriq_recording_longest_write_seconds','longest single block write',lambda: rec.longestWrite)
+        self.latency = m.histogram('sdriq_stage_latency_seconds','time from USB read to UDP send','stage="usb_to_udp"')
+
+    def multicast(self):
+        # IQ data goes to the group instead of to each client.
+        self.group = (self.group[0], self.group[1] or self.clientPort)
+        self.udp.setsockopt(IPPROTO_IP,IP_MULTICAST_TTL,self.ttl)
+        if self.interface:
+            self.udp.setsockopt(IPPROTO_IP,IP_MULTICAST_IF,inet_aton(self.interface))
+        self.hub.multicast = self.newClient(None,self.group)
+        self.print(f'IQ data to multicast group {self.group[0]} port {self.group[1]}')
+
+    def accept(self):
+        # One RadioWriter per client; they all share the one RadioReader.
+        while not self.makeItStop.isSet():
+            try:
+                tcp, address = self.tcp.accept()
+            except:
+                # ross TODO:  print the exception
+                self.makeItStop.set()
+                return
+            if len(self.hub) >= self.maxClients:
+                self.print(f'Refused: {address[0]} on port {address[1]}, {self.maxClients} client(s) already')
+                tcp.close()
+                continue
+            self.print(f'Connected: {address[0]} on port {address[1]}')
+            # ross - Connected: 192.168.76.28 on port 60887
+            lock = Lock()
+            def send(msg,tcp=tcp,lock=lock):
+                with lock:
+                    tcp.sendall(msg)
+            client = self.newClient(send,(address[0],self.clientPort))
+            RadioWriter(self,tcp,self.hub.add(client)).start()
+
 class RadioWriter(Thread):
-    def __init__(self,listener):
+    def __init__(self,listener,tcp,client):
         super(RadioWriter,self).__init__()
         self.makeItStop = listener.makeItStop
-        self.radio      = listener.radio
-        self.tcp        = listener.connect[0]
+        self.write      = listener.writeRadio
+        self.window     = listener.writeWindow
+        self.tcp        = tcp
+        self.client     = client
+        self.hub        = listener.hub
+        self.lastClient = listener.maxClients == 1
         self.print      = listener.print
         self.logger     = Validator(listener.print)
+        self.framer     = FrameReader(self.tcp.recv_into)
+        self.held       = None      # a message left over for the next write
         self.daemon     = True
 
     def run(self):
         # Receive messages from the SDR client and pass them on to the radio.
         while not self.makeItStop.isSet():
-            msg = readMsg(self.tcp.recv)
+            try:
+                msg = self.held or self.framer.read()
+                self.held = None
+                out = self.gather(msg)
+            except OSError:
+                break
             if not msg:
-                self.makeItStop.set()
-                continue
-            self.logger.log(msg)    # ross - does Validator do anything other than just log shit?
-            self.radio.write(msg)
+                break
+            if out:
+                self.write(out)
+        self.hub.remove(self.client)
+        self.tcp.close()
+        if self.lastClient:
+            # the one-client server goes away with its client, as it always has
+            self.makeItStop.set()
         self.print('RadioWriter - done')
 
+    def handle(self,msg):
+        # control messages are small; the radio and the logger want bytes
+        msg = bytes(msg)
+        self.logger.log(msg)    # ross - does Validator do anything other than just log shit?
+        return self.hub.fromClient(self.client,msg)
+
+    def gather(self,msg):
+        # msg, and every message behind it that is already in or reaches
+        # the socket within the write window, in order, as one USB write.
+        # One that would take the write past maxWrite is held for the next.
+        out = []
+        size = 0
+        deadline = perf_counter() + self.window
+        while msg:
+            if out and size + len(msg) > maxWrite:
+                self.held = bytes(msg)
+                break
+            data = self.handle(msg)
+            if data:
+                out.append(data)
+                size = size + len(data)
+            msg = self.framer.frame() or self.more(deadline)
+        return b''.join(out)
+
+    def more(self,deadline):
+        # The next message if it comes before the deadline, else None.
+        while True:
+            ready = select([self.tcp],[],[],max(deadline - perf_counter(), 0))[0]
+            if not ready or not self.framer.fill():
+                return None
+            msg = self.framer.frame()
+            if msg is not None:
+                return msg
+
+class StatusPoller(Thread):
+    # Asks the radio for Status every statusInterval for the hub to answer
+    # clients' polls with (see clients.py), while anyone is connected.
+    def __init__(self,listener):
+        super(StatusPoller,self).__init__()
+        self.makeItStop = listener.makeItStop
+        self.write      = listener.writeRadio
+        self.hub        = listener.hub
+        self.interval   = listener.statusInterval
+        self.daemon     = True
+
+    def run(self):
+        while not self.makeItStop.wait(self.interval):
+            if self.hub.statusDue():
+                self.write(bc.Status)
+
 class RadioReader(Thread):
     def __init__(self,listener):
         super(RadioReader,self).__init__()
         self.makeItStop = listener.makeItStop
-        self.tcp        = listener.connect[0]
-        #self.rAddress   = ('localhost',50000)   # ross - address for sending ADC data via UDP - ? in SdrDx
-        self.rAddress   = (listener.connect[1][0], 50000)   # send ADC data to the host that connected to us
-        self.udp        = listener.udp          # ross - ends up being L's udp object set up in Listener::serve
-        self.radio      = listener.radio
+        self.hub        = listener.hub          # every connected client, see clients.py
+        self.ring       = listener.ring
+        self.frames     = listener.ring.consumer()
         self.print      = listener.print
-        self.sequence   = 0
+        self.meter      = listener.meter
+        self.meterInterval = listener.meterInterval
+        self.latency    = listener.latency
         self.daemon     = True
 
-    def sequenceNumber(self):
-        self.sequence = self.sequence + 1
-        if (self.sequence < 0xFFFF):
-            return self.sequence
-        self.sequence = 1
-        return self.sequence
-
     def sendData(self,msg):
         #self.print('sending data via UDP ({0})'.format(len(msg)))
-        ba = bytearray(iqDataSendMsgLength)
-        for k in range(int(len(msg) / iqDataSendBlockSize)):
-            #self.print(f'  block {k}')
-            sn = self.sequenceNumber()
-            # TODO:  write a function that formats the 16-bit header
-            #ba[0] = 0x04    # length lsb (8 bits)
-            #ba[1] = 0x84    # message type 0b100 and length msb (5 bits)
-            ba[0] = int(iqDataSendMsgLength) & 0xff                 # length lsb (8 bits)
-            ba[1] = 0x80 | ((int(iqDataSendMsgLength) >> 8) & 0x1f)   # message type 0b100 and length msb (5 bits)
-            ba[2] = sn & 0xFF
-            ba[3] = (sn >> 8) & 0xFF
-            ba[4:] = msg[k * iqDataSendBlockSize : (k + 1) * iqDataSendBlockSize]
-            #print('k={:} 0x{:02X} 0x{:02X} 0x{:02X} 0x{:02X}'.format(k, ba[0], ba[1], ba[2], ba[3]))
-            self.udp.sendto(ba,self.rAddress)  # ross - this is where we send ADC data via UDP
+        # msg is a view into the framer's buffer; each client's sender puts
+        # the header and each block of it on the wire without copying
+        self.hub.sendData(msg)  # ross - this is where we send ADC data via UDP
 
     def run(self):
         # Receive messages from the radio.  Send ADC data via
         # UDP and other messages via TCP to the SDR client.
+        nextReport = monotonic() + self.meterInterval
         while not self.makeItStop.isSet():
-            msg = readMsg(self.radio.read)
+            msg = self.frames.next(0.1)    # a view into the capture ring
             if not msg:
-                sleep(0.01)
                 continue
             #ross print('got msg {0}'.format(msg))
             if msg[0:2] == b'\x00\x80':
-                #print(f'power = {power(msg)}')
                 #self.print('sending UDP ({0})'.format(len(msg)))
                 self.sendData(msg[2:])  # ross - send ADC data
+                self.latency.observe(perf_counter() - self.frames.times[0])
+                self.meter.update(msg[2:])
+                if self.meterInterval and monotonic() >= nextReport:
+                    print(self.meter.report())
+                    print(self.ring.report())
+                    nextReport = monotonic() + self.meterInterval
             else:
                 #self.print('sending TCP ({0})'.format(len(msg)))
-                self.tcp.send(msg)
+                self.hub.fromRadio(msg)
         self.print('RadioReader - done')
 
 if __name__ == '__main__':
    L = Listener()
    try:
-        L.serve()
+        sys.exit(L.serve())
    except KeyboardInterrupt:
         print('\nbye')
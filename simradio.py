@@ -0,0 +1,298 @@
+# A simulated SDR-IQ for running the server without hardware.
+#
+# SimRadio stands in for the pylibftdi Device the server opens: read,
+# readinto, write and flush.  Once a client sets Run it produces correctly
+# framed 00 80 IQ frames (a test tone) at the rate its sample rate implies,
+# handed out in whole USB reads the way the FTDI chip does.  Control
+# messages get the answers a real radio gives, queued into the read stream
+# between IQ frames.  As on the real radio the rate is the AD6620
+# program's: it changes when a whole program has been written, and the
+# sample rate item (0x00B0) is only the A/D clock, kept and reported.
+#
+# It can also be made to take its time like the real USB link: writeTime
+# per write call, and latencyTimer, the FTDI chip holding on to a short
+# reply (under a 62 byte packet) for that long before sending it.
+#
+# A read waits the way a libftdi read does: it goes on until it has all
+# it asked for, and only comes back short once a latency timer (16 ms if
+# not set) has gone by with nothing new.  Data turns up a USB frame (1 ms)
+# at a time at most.
+#
+# Every 512 bytes of IQ payload starts with the time (perf_counter) the
+# frame became available, so a receiver can work out latency per datagram.
+
+import numpy as np
+from struct import pack, pack_into, unpack_from
+from threading import Condition
+from time import perf_counter, sleep
+
+from framer import frameLength, iqFrameHeader, iqFrameLength
+from sdrcmds import adClock, programRate
+
+
+stampSpacing = 512
+usbPacket = 62                      # FTDI payload bytes per USB packet
+usbFrame = 0.001                    # full speed USB polls the chip once a millisecond
+nak = b'\x02\x00'
+dataItemAck = b'\x03\x60\x00'
+
+
+class SimRadio:
+    def __init__(self,sampleRate=196078,frames=None,chunk=4096,
+                 name=b'SDR-IQ',serial=b'SIM00001',tone=0.1,writeTime=0.0,latencyTimer=0.0):
+        self.lock       = Condition()
+        self.replies    = bytearray()
+        self.sampleRate = sampleRate
+        self.frames     = frames        # stop after this many, None for ever
+        self.chunk      = chunk
+        self.name       = name
+        self.serial     = serial
+        self.running    = False
+        self.started    = 0.0
+        self.stopAt     = 0             # where the stream ends after a Stop
+        self.pos        = 0             # bytes of IQ stream handed out since Run
+        self.freq       = 680000        # what a cold SDR-IQ reports
+        self.rfGain     = 0
+        self.ifGain     = 0
+        self.program    = []            # AD6620 writes
+        self.programStart = 0           # where in them the last soft reset was
+        self.adClock    = adClock       # item 0x00B0, Hz
+        self.writes     = 0             # write() calls, i.e. USB transfers out
+        self.controls   = 0             # control messages received
+        self.writeTime  = writeTime
+        self.latencyTimer = latencyTimer
+        self.replyStart = 0.0           # when the oldest unsent reply byte came
+        n = np.arange(4096 // 2)
+        z = tone * 32767 * np.exp(2j * np.pi * n * 0.0625)
+        iq = np.empty(4096, dtype='<i2')
+        iq[0::2] = z.real
+        iq[1::2] = z.imag
+        self.frame = bytearray(b'\x00\x80' + iq.tobytes())
+        self.frameView = memoryview(self.frame)
+
+    # the Device interface
+
+    def write(self,data):
+        data = bytes(data)
+        if self.writeTime:
+            sleep(self.writeTime)
+        with self.lock:
+            self.writes = self.writes + 1
+            k = 0
+            while len(data) - k >= 2:
+                n = frameLength(data[k], data[k+1])
+                self.control(data[k:k+n])
+                k = k + n
+            self.lock.notify_all()
+        return len(data)
+
+    def readinto(self,view):
+        timer = self.latencyTimer or 0.016
+        deadline = perf_counter() + timer
+        done = 0
+        with self.lock:
+            while True:
+                n = self.fill(view[done:])
+                done = done + n
+                now = perf_counter()
+                if n:
+                    deadline = now + timer
+                if done == len(view) or now >= deadline:
+                    return done
+                self.lock.wait(max(min(deadline, self.nextData()) - now, usbFrame))
+
+    def read(self,n):
+        buf = bytearray(n)
+        return bytes(buf[:self.readinto(memoryview(buf))])
+
+    def tune(self,latency,chunk):
+        # framer.ftdiTune: the latency timer in ms and the USB transfer size
+        if latency is not None:
+            self.latencyTimer = latency / 1000.0
+        if chunk:
+            self.chunk = chunk
+
+    def flush(self,*args):
+        with self.lock:
+            self.replies.clear()
+            self.pos = self.available()
+
+    # the stream
+
+    def frameRate(self):
+        return max(self.sampleRate, 1) / 2048.0
+
+    def setRate(self,rate):
+        if not rate or rate == self.sampleRate:
+            return
+        self.sampleRate = rate
+        # carry on from where the stream is at the new rate
+        self.started = perf_counter() - self.pos / iqFrameLength / self.frameRate()
+
+    def produced(self):
+        # IQ frames handed out so far
+        return self.pos // iqFrameLength
+
+    def available(self):
+        # Bytes of IQ stream the radio has made by now, in whole reads.
+        if not self.running:
+            return max(self.pos, self.stopAt)
+        made = (perf_counter() - self.started) * self.frameRate()
+        if self.frames is not None:
+            made = min(made, self.frames)
+        limit = int(made * iqFrameLength) // self.chunk * self.chunk
+        if self.frames is not None and made >= self.frames:
+            limit = self.frames * iqFrameLength
+        return max(limit, self.pos)
+
+    def nextData(self):
+        # When there will next be something to read, as far as we know now.
+        t = float('inf')
+        if self.replies and self.pos % iqFrameLength == 0:
+            # (replies only go between IQ frames)
+            t = self.replyStart + self.latencyTimer
+        if self.running and (self.frames is None or self.pos < self.frames * iqFrameLength):
+            # the next whole read's worth of IQ
+            made = (self.pos // self.chunk + 1) * self.chunk / iqFrameLength
+            t = min(t, self.started + made / self.frameRate())
+        return t
+
+    def fill(self,view):
+        done = 0
+        room = len(view)
+        limit = self.available()
+        while done < room:
+            off = self.pos % iqFrameLength
+            if off == 0 and self.replies and self.repliesDue():
+                m = min(room - done, len(self.replies))
+                view[done:done+m] = self.replies[:m]
+                del self.replies[:m]
+                done = done + m
+                continue
+            if self.pos >= limit:
+                break
+            m = min(room - done, iqFrameLength - off, limit - self.pos)
+            frame = self.frameAt(self.pos // iqFrameLength, off)
+            if off < 2:
+                # the header, then straight on into the samples
+                h = min(m, 2 - off)
+                view[done:done+h] = iqFrameHeader[off:off+h]
+                view[done+h:done+m] = frame[0:m-h]
+            else:
+                view[done:done+m] = frame[off-2:off-2+m]
+            done = done + m
+            self.pos = self.pos + m
+        return done
+
+    def frameAt(self,k,off):
+        # The samples of frame k; off is how far into it the read starts.
+        if off == 0:
+            self.stamp(k)
+        return self.frameView[2:]
+
+    def stamp(self,k):
+        t = self.started + (k + 1) / self.frameRate()
+        for off in range(2, iqFrameLength, stampSpacing):
+            pack_into('<d', self.frame, off, t)
+
+    # control messages
+
+    def repliesDue(self):
+        # while streaming the IQ keeps the chip's packets full
+        return (not self.latencyTimer or self.running or len(self.replies) >= usbPacket or
+                perf_counter() - self.replyStart >= self.latencyTimer)
+
+    def reply(self,msg):
+        if not self.replies:
+            self.replyStart = perf_counter()
+        self.replies += msg
+
+    def control(self,msg):
+        self.controls = self.controls + 1
+        kind = msg[1] >> 5
+        if kind == 5:
+            # AD6620 register write; taking the chip out of soft reset
+            # starts the program written since it went in
+            self.program.append(bytes(msg))
+            self.reply(dataItemAck)
+            if msg[2:4] == b'\x00\x03' and len(msg) > 4:
+                if msg[4] & 1:
+                    self.programStart = len(self.program) - 1
+                else:
+                    self.setRate(programRate(self.program[self.programStart:]))
+            return
+        if len(msg) < 4 or kind not in (0, 1):
+            self.reply(nak)
+            return
+        item = msg[2] + (msg[3] << 8)
+        handler = getattr(self, f'item{item:04X}', None)
+        if handler is None:
+            self.reply(nak)
+            return
+        value = handler(msg[4:] if kind == 0 else None, msg[4:])
+        if value is None:
+            self.reply(nak)
+            return
+        body = msg[2:4] + value
+        self.reply(pack('<H', len(body) + 2) + body)
+
+    # Each itemNNNN answers the control item with that code.  `value` is the
+    # payload of a Set (None for a Get); `args` is whatever followed the item
+    # code, e.g. the channel.  They return the reply payload.
+
+    def item0001(self,value,args):
+        return self.name + b'\x00'
+
+    def item0002(self,value,args):
+        return self.serial + b'\x00'
+
+    def item0003(self,value,args):
+        return pack('<H', 100)
+
+    def item0004(self,value,args):
+        pic = args[0] if args else 0
+        return bytes([pic]) + pack('<H', 7 + pic)
+
+    def item0005(self,value,args):
+        return b'\x0B' if self.running else b'\x0C'
+
+    def item0018(self,value,args):
+        if value is not None:
+            running = value[1] == 2
+            if running and not self.running:
+                self.started = perf_counter()
+                self.pos = 0
+            elif self.running and not running:
+                # the frame under way still goes out whole
+                self.stopAt = -(-self.pos // iqFrameLength) * iqFrameLength
+            self.running = running
+        return bytes([0x81, 2 if self.running else 1, 0, 1])
+
+    def item0020(self,value,args):
+        if value is not None:
+            self.freq = int.from_bytes(value[1:6], 'little')
+        return b'\x00' + self.freq.to_bytes(5, 'little')
+
+    def item0038(self,value,args):
+        if value is not None:
+            self.rfGain = value[1]
+        return bytes([0, self.rfGain & 0xFF])
+
+    def item0040(self,value,args):
+        if value is not None:
+            self.ifGain = value[1]
+        return bytes([0, self.ifGain & 0xFF])
+
+    def item00B0(self,value,args):
+        if value is not None:
+            self.adClock = unpack_from('<I', value, 1)[0]
+        return b'\x00' + pack('<I', self.adClock)
+
+
+def stampOf(payload):
+    # The production time a SimRadio wrote at the start of an IQ datagram's
+    # payload, or None.
+    if len(payload) < 8:
+        return None
+    t = unpack_from('<d', payload)[0]
+    return t if t > 0.0 else None
@@ -0,0 +1,150 @@
+# Serving every radio on the host, one process each (server.py -M).
+#
+# A server process serves one radio, and its capture, network and control
+# threads all share that process's GIL.  With several SDR-IQs on one host
+# the supervisor finds them all by serial number and runs an ordinary
+# server.py for each, with -S for its radio and its own ports, so each
+# radio gets a core of its own and one radio's trouble stays its own.
+#
+# Radios are numbered in serial number order and radio k gets TCP port
+# tcpPort+k (its clients get their IQ at that port too and it sends from
+# udpPort+k) and, with -p, metrics port metricsPort+k.  The same radios
+# plugged into another USB port keep their ports.
+#
+# Each worker keeps its DSP state in a file of its own, the -D path with
+# the serial number added, and with -w records into a subdirectory named
+# after its radio, so no two processes ever write the same file.
+#
+# A worker that exits is started again: at once if it exited cleanly (the
+# one-client server does when its client leaves), otherwise after a delay
+# that doubles with each failure in a row, so a radio that has gone away is
+# looked for every half minute or so rather than in a tight loop.
+
+import os
+import signal
+import subprocess
+import sys
+from time import monotonic
+
+from pylibftdi.driver import Driver
+
+
+serverPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'server.py')
+firstDelay = 1.0                    # seconds before restarting a failed worker
+maxDelay = 30.0
+steady = 60.0                       # a worker up this long has its delay reset
+
+
+def radioSerials(devices,name):
+    # The serial numbers of the radios called name among list_devices()'s
+    # (manufacturer, description, serial) tuples, in order.
+    name = name.decode('utf-8')
+    return sorted(d[2] for d in devices if d[1] == name)
+
+
+class Worker:
+    def __init__(self,serial,argv):
+        self.serial   = serial
+        self.argv     = argv        # the command line that runs it
+        self.process  = None
+        self.started  = 0.0
+        self.due      = 0.0         # when to start it again
+        self.delay    = 0.0
+        self.starts   = 0
+        self.failures = 0
+
+    def start(self):
+        self.process = subprocess.Popen(self.argv)
+        self.started = monotonic()
+        self.starts  = self.starts + 1
+
+    def exited(self):
+        # The worker's exit code once it has gone, else None.
+        if self.process is None:
+            return None
+        return self.process.poll()
+
+    def stop(self,timeout=5.0):
+        # as Ctrl-C would, then harder
+        if self.process is None or self.process.poll() is not None:
+            return
+        self.process.send_signal(signal.SIGINT)
+        try:
+            self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+class Supervisor:
+    def __init__(self,listener,interval=0.5):
+        self.makeItStop  = listener.makeItStop
+        self.print       = listener.print
+        self.radioName   = listener.radioName
+        self.args        = listener.workerArgs
+        self.tcpPort     = listener.tcpPort
+        self.metricsPort = listener.metricsPort
+        self.statePath   = listener.dspStatePath
+        self.recordDir   = listener.recordDir
+        self.recordBytes = listener.recordBytes
+        self.recordSeconds = listener.recordSeconds
+        self.interval    = interval
+        self.workers     = []
+
+    def radios(self):
+        return radioSerials(Driver().list_devices(),self.radioName)
+
+    def command(self,serial,k):
+        argv = [sys.executable, serverPath] + self.args + ['-S', serial, '-T', str(self.tcpPort + k)]
+        if self.metricsPort:
+            argv = argv + ['-p', str(self.metricsPort + k)]
+        root, ext = os.path.splitext(self.statePath)
+        argv = argv + ['-D', f'{root}-{serial}{ext}']
+        if self.recordDir:
+            spec = f'{os.path.join(self.recordDir, serial)}:{self.recordBytes / (1 << 20):g}'
+            if self.recordSeconds:
+                spec = spec + f':{self.recordSeconds:g}'
+            argv = argv + ['-w', spec]
+        return argv
+
+    def run(self):
+        serials = self.radios()
+        if not serials:
+            print(f'Radio {self.radioName.decode()} not found')
+            return 1
+        for k, serial in enumerate(serials):
+            self.workers.append(Worker(serial,self.command(serial,k)))
+            print(f'radio {serial} on port {self.tcpPort + k}')
+        try:
+            while True:
+                for worker in self.workers:
+                    self.check(worker)
+                if self.makeItStop.wait(self.interval):
+                    break
+        finally:
+            for worker in self.workers:
+                worker.stop()
+        self.print('Supervisor - done')
+
+    def check(self,worker):
+        now = monotonic()
+        code = worker.exited()
+        if worker.process is None:
+            if now >= worker.due:
+                worker.start()
+            return
+        if code is None:
+            return
+        worker.process = None
+        if now - worker.started >= steady:
+            worker.delay = 0.0
+        if code == 0 and now - worker.started >= firstDelay:
+            self.print(f'radio {worker.serial}: server exited, starting another')
+            worker.delay = 0.0
+        else:
+            worker.failures = worker.failures + 1
+            worker.delay = min(max(2 * worker.delay, firstDelay), maxDelay)
+            print(f'radio {worker.serial}: server failed ({code}), restarting in {worker.delay:.0f} s')
+        worker.due = now + worker.delay
+        if now >= worker.due:
+            worker.start()